@@ -0,0 +1,38 @@
+"""
+Measures the cost of checking input during a frame.
+
+Run from the repository root with: python benchmarks/input_bench.py
+"""
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def run(name: str, check, count: int = 100000):
+    start = time.perf_counter()
+    for _ in range(count):
+        check()
+    print(f"{name:<26} {(time.perf_counter() - start) / count * 1e6:6.3f} us per check")
+
+
+def frame(checks: int = 500, frames: int = 200):
+    """Runs a frame of many checks, like a scene full of buttons and key bindings makes."""
+    snapshot = getattr(rb.Input, "_snapshot", lambda: None)
+    start = time.perf_counter()
+    for _ in range(frames):
+        snapshot()
+        for _ in range(checks):
+            rb.Input.key_pressed("w")
+            rb.Input.mouse_in((0, 0), (10, 10))
+            rb.Input.mouse_state()
+    print(f"{str(checks) + ' checks per frame':<26} {(time.perf_counter() - start) / frames * 1000:6.3f} ms per frame")
+
+
+run("key_pressed", lambda: rb.Input.key_pressed("w"))
+run("key_pressed shift", lambda: rb.Input.key_pressed("shift"))
+run("key_pressed combo", lambda: rb.Input.key_pressed("ctrl", "s"))
+run("mouse_state", rb.Input.mouse_state)
+run("get_mouse_pos", rb.Input.get_mouse_pos)
+run("mouse_in", lambda: rb.Input.mouse_in((0, 0), (10, 10)))
+frame()
@@ -0,0 +1,28 @@
+"""
+Compares the axis-aligned narrowphase shortcuts with the general separating axis tests they replace.
+
+Run from the repository root with: python benchmarks/narrowphase_bench.py
+"""
+import timeit
+import rubato as rb
+from rubato.structure.gameobject.physics.engine import _Engine
+
+rb.init(headless=True)
+
+box_a = rb.Rectangle(width=20, height=20)
+box_b = rb.Rectangle(width=20, height=20)
+circle = rb.Circle(radius=10)
+rb.GameObject().add(box_a)
+rb.GameObject(pos=(15, 4)).add(box_b)
+rb.GameObject(pos=(-4, 17)).add(circle)
+
+
+def run(name: str, fast, slow, number: int = 20000):
+    fast_time = min(timeit.repeat(fast, number=number, repeat=5)) / number * 1e6
+    slow_time = min(timeit.repeat(slow, number=number, repeat=5)) / number * 1e6
+    print(f"{name:<16}{fast_time:8.2f} us{slow_time:8.2f} us (SAT){slow_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    run("box-box", lambda: _Engine.overlap(box_a, box_b), lambda: _Engine._polygon_polygon_test(box_a, box_b))
+    run("circle-box", lambda: _Engine.overlap(circle, box_a), lambda: _Engine._circle_polygon_test(circle, box_a))
@@ -0,0 +1,27 @@
+"""
+Measures the cost of generating noise for a terrain.
+
+Run from the repository root with: python benchmarks/noise_bench.py
+"""
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+SIZE = 1024
+COORDS = [i / 64 for i in range(SIZE)]
+
+
+def run(name: str, func, samples: int):
+    start = time.perf_counter()
+    func()
+    took = time.perf_counter() - start
+    print(f"{name:<30} {took * 1000:9.2f} ms  {took / samples * 1e9:8.1f} ns per sample")
+
+
+small = COORDS[:128]
+run("noise2 loop, 128x128", lambda: [rb.Noise.noise2(x, y) for y in small for x in small], 128 * 128)
+run("noise2_grid, 1024x1024", lambda: rb.Noise.noise2_grid(COORDS, COORDS), SIZE * SIZE)
+run("noise2_grid 4 octaves", lambda: rb.Noise.noise2_grid(COORDS, COORDS, octaves=4), SIZE * SIZE)
+run("noise2_tile, first", lambda: rb.Noise.noise2_tile(0, 0, 256, 256, 1 / 64, 4), 256 * 256)
+run("noise2_tile, cached", lambda: rb.Noise.noise2_tile(0, 0, 256, 256, 1 / 64, 4), 256 * 256)
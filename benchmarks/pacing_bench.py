@@ -0,0 +1,32 @@
+"""
+Measures how closely empty frames match the target fps.
+
+Run from the repository root with: python benchmarks/pacing_bench.py
+"""
+import statistics
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def run(target: int, frames: int = 300):
+    rb.Time.target_fps = target
+    rb.Time._normal_delta = 1000 / target
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        rb.Time._start_frame()
+        rb.Time._end_frame()
+        times.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{target:>4} fps  target {1000 / target:6.3f} ms  mean {statistics.mean(times):6.3f} ms  "
+        f"stdev {statistics.stdev(times):6.3f} ms  max {max(times):6.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    for fps in (60, 144, 240):
+        run(fps)
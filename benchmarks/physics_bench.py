@@ -0,0 +1,35 @@
+"""
+Measures how long a physics step takes for a pile of boxes and balls falling onto a static floor.
+
+Run from the repository root with: python benchmarks/physics_bench.py
+"""
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def build(count: int) -> rb.Scene:
+    scene = rb.Scene()
+    scene.add(rb.wrap([rb.Rectangle(width=2000, height=20), rb.RigidBody(static=True)], pos=(0, -300)))
+
+    for i in range(count):
+        x, y = (i % 40) * 25 - 500, (i // 40) * 25 - 250
+        hitbox = rb.Rectangle(width=20, height=20) if i % 2 else rb.Circle(radius=10)
+        scene.add(rb.wrap([hitbox, rb.RigidBody(gravity=(0, -500))], pos=(x, y)))
+
+    return scene
+
+
+def run(count: int, steps: int = 120):
+    scene = build(count)
+    start = time.perf_counter()
+    for _ in range(steps):
+        scene._fixed_update()
+    total = time.perf_counter() - start
+    print(f"{count:>5} bodies{total / steps * 1e3:10.3f} ms/step")
+
+
+if __name__ == "__main__":
+    for n in (100, 400, 1000):
+        run(n)
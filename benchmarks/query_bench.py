@@ -0,0 +1,45 @@
+"""
+Measures spatial queries against a scene full of hitboxes, like line-of-sight checks and mouse picking.
+
+Run from the repository root with: python benchmarks/query_bench.py
+"""
+import random
+import timeit
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def build(count: int) -> rb.Scene:
+    random.seed(0)
+    scene = rb.Scene()
+    for i in range(count):
+        hitbox = rb.Rectangle(width=20, height=20) if i % 2 else rb.Circle(radius=10)
+        scene.add(rb.wrap(hitbox, pos=(random.uniform(-2000, 2000), random.uniform(-2000, 2000))))
+    return scene
+
+
+def run(count: int, number: int = 2000):
+    scene = build(count)
+    rays = [(rb.Vector.rand_unit_vector() * 1000, rb.Vector.rand_unit_vector()) for _ in range(number)]
+    points = [rb.Vector(random.uniform(-2000, 2000), random.uniform(-2000, 2000)) for _ in range(number)]
+    scene.query_point((0, 0))  # build the grid
+
+    ray_time = min(timeit.repeat(lambda: [scene.raycast(o, d, 500) for o, d in rays], number=1, repeat=5))
+    point_time = min(timeit.repeat(lambda: [scene.query_point(p) for p in points], number=1, repeat=5))
+    naive_time = min(
+        timeit.repeat(
+            lambda: [[hb for hb in scene.get_all(rb.Hitbox) if hb.contains_pt(p)] for p in points[:100]],
+            number=1,
+            repeat=5,
+        )
+    ) * number / 100
+    print(
+        f"{count:>5} hitboxes  raycast {ray_time / number * 1e6:8.2f} us  point {point_time / number * 1e6:8.2f} us"
+        f"  naive point {naive_time / number * 1e6:8.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    for n in (100, 1000, 5000):
+        run(n)
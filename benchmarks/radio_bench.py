@@ -0,0 +1,69 @@
+"""
+Measures the cost of broadcasting events.
+
+Run from the repository root with: python benchmarks/radio_bench.py
+"""
+import ctypes
+import time
+import sdl2
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def run(name: str, listeners: list, count: int = 100000):
+    rb.Radio.listeners = {}
+    for func in listeners:
+        rb.Radio.listen("bench", func)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        rb.Radio.broadcast("bench")
+    print(f"{name:<26} {(time.perf_counter() - start) / count * 1e6:6.3f} us per broadcast")
+
+
+def handle(name: str, count: int = 1000, frames: int = 50):
+    """Handles a frame of mouse motion events, like a 1000 Hz mouse makes in a second."""
+    rb.Radio.listeners = {}
+    rb.Radio.listen(rb.Events.MOUSEMOTION, lambda response: None)
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEMOTION
+
+    total = 0
+    for _ in range(frames):
+        for i in range(count):
+            event.motion.x = i
+            sdl2.SDL_PushEvent(ctypes.byref(event))
+        start = time.perf_counter()
+        rb.Radio._handle()
+        total += time.perf_counter() - start
+    print(f"{name:<26} {total / frames / count * 1e6:6.3f} us per motion event")
+
+
+def drain(count: int = 20000):
+    """Posts a burst of events and drains them frame by frame within the budget."""
+    rb.Radio.listeners = {}
+    rb.Radio.listen("bench", lambda response: None)
+    for _ in range(count):
+        rb.Radio.post("bench")
+
+    frames = []
+    while rb.Radio.pending():
+        start = time.perf_counter()
+        rb.Radio._drain()
+        frames.append(time.perf_counter() - start)
+    print(
+        f"{'posted burst of ' + str(count):<26} {sum(frames) / count * 1e6:6.3f} us per event  {len(frames)} frames  "
+        f"longest {max(frames) * 1000:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    run("no listeners", [])
+    run("1 listener with args", [lambda response: None])
+    run("1 listener without args", [lambda: None])
+    run("10 listeners without args", [lambda: None] * 10)
+    handle("motion events")
+    rb.Radio.coalesce = True
+    handle("coalesced motion events")
+    drain()
@@ -0,0 +1,60 @@
+"""
+Measures the cost of loading sounds and music.
+
+Run from the repository root with: python benchmarks/sound_bench.py
+"""
+import time
+import sdl2.sdlmixer as mixer
+import rubato as rb
+
+rb.init(headless=True)
+
+FOLDER = "demo/sounds"
+TRACK = "demo/sounds/music.mp3"
+
+
+def folder(background: bool):
+    rb.Sound.loaded_sounds.clear()
+    start = time.perf_counter()
+    rb.Sound.import_sound_folder(FOLDER, recursive=False, background=background)
+    returned = time.perf_counter() - start
+    for sound in rb.Sound.loaded_sounds.values():
+        sound.wait()
+    ready = time.perf_counter() - start
+    name = "background" if background else "blocking"
+    print(
+        f"{'folder, ' + name:<26} returns {returned * 1000:7.2f} ms  ready {ready * 1000:7.2f} ms  "
+        f"{rb.Sound.memory() / 1e6:6.2f} MB decoded"
+    )
+
+
+def track():
+    rb.Sound.loaded_sounds.clear()
+    start = time.perf_counter()
+    sound = rb.Sound(TRACK, "track")
+    print(f"{'track as Sound':<26} returns {(time.perf_counter() - start) * 1000:7.2f} ms  {sound.size / 1e6:6.2f} MB")
+
+    start = time.perf_counter()
+    rb.Music(TRACK, "track")
+    print(f"{'track as Music':<26} returns {(time.perf_counter() - start) * 1000:7.2f} ms  streamed")
+
+
+def crowd(count: int = 2000):
+    """Plays a burst of looping footsteps, like a crowd does, and counts the mixer channels it needed."""
+    rb.Sound.loaded_sounds.clear()
+    sound = rb.Sound("demo/sounds/click.wav", "step")
+    start = time.perf_counter()
+    for _ in range(count):
+        sound.play(-1)
+    took = time.perf_counter() - start
+    print(
+        f"{'crowd of ' + str(count):<26} {took / count * 1e6:7.2f} us per play  "
+        f"{mixer.Mix_AllocateChannels(-1)} channels"
+    )
+    mixer.Mix_HaltChannel(-1)
+
+
+folder(False)
+folder(True)
+track()
+crowd()
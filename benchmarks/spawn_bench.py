@@ -0,0 +1,42 @@
+"""
+Measures how long it takes to spawn game objects, like a bullet-hell game does every frame.
+
+Run from the repository root with: python benchmarks/spawn_bench.py
+"""
+import timeit
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def bare(scene: rb.Scene):
+    scene.add(rb.GameObject())
+
+
+def bullet(scene: rb.Scene):
+    scene.add(rb.wrap([rb.Circle(radius=4), rb.RigidBody(velocity=(0, 100))]))
+
+
+def colored_bullet(scene: rb.Scene):
+    go = rb.wrap([rb.Circle(radius=4, color=rb.Color.red), rb.RigidBody(velocity=(0, 100))])
+    scene.add(go)
+    go._update()  # the hitbox image is drawn on the first update
+
+
+def churn(scene: rb.Scene):
+    scene.add(rb.wrap([rb.Circle(radius=4), rb.RigidBody(velocity=(0, 100))]))
+    if scene.root_count > 1000:
+        scene.remove(next(iter(scene._root)))  # despawn the oldest bullet
+
+
+def run(func, number: int = 5000):
+    scene = rb.Scene()
+    total = min(timeit.repeat(lambda: func(scene), number=number, repeat=5))
+    print(f"{func.__name__:<16}{total / number * 1e6:8.2f} us/spawn")
+
+
+if __name__ == "__main__":
+    run(bare)
+    run(bullet)
+    run(colored_bullet)
+    run(churn)
@@ -0,0 +1,46 @@
+"""
+Measures how well a stack of boxes resting on a static floor holds still at different physics rates.
+
+Run from the repository root with: python benchmarks/stack_bench.py
+"""
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+SIZE = 20
+HEIGHT = 8
+
+
+def run(physics_fps: int, seconds: float = 5):
+    rb.Time.fixed_delta = 1 / physics_fps
+    scene = rb.Scene()
+    scene.add(rb.wrap([rb.Rectangle(width=400, height=20), rb.RigidBody(static=True)], pos=(0, -10)))
+
+    boxes = []
+    for i in range(HEIGHT):
+        box = rb.wrap([rb.Rectangle(width=SIZE, height=SIZE), rb.RigidBody(gravity=(0, -500), friction=0.5)])
+        box.pos = rb.Vector(0, SIZE / 2 + i * SIZE)
+        boxes.append(box)
+        scene.add(box)
+
+    steps = int(seconds * physics_fps)
+    heights = []
+    start = time.perf_counter()
+    for _ in range(steps):
+        scene._fixed_update()
+        heights.append(boxes[-1].pos.y)
+    total = time.perf_counter() - start
+
+    # how far the top box sank and how much it still moves during the last second
+    expected = SIZE / 2 + (HEIGHT - 1) * SIZE
+    last = heights[-physics_fps:]
+    print(
+        f"{physics_fps:>4} Hz  top box sank {expected - heights[-1]:7.2f}  jitter {max(last) - min(last):7.2f}  "
+        f"drift {boxes[-1].pos.x:7.2f}  {total / steps * 1e3:6.3f} ms/step"
+    )
+
+
+if __name__ == "__main__":
+    for fps in (30, 50, 120):
+        run(fps)
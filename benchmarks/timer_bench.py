@@ -0,0 +1,64 @@
+"""
+Measures scheduling, stopping and processing many cooldown timers.
+
+Run from the repository root with: python benchmarks/timer_bench.py
+"""
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def run(count: int, frames: int = 120):
+    start = time.perf_counter()
+    tasks = [rb.Time.delayed_call(lambda: None, 0.5 + (i % 1000) / 1000) for i in range(count)]
+    scheduled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task in tasks[:count * 9 // 10]:
+        task.stop()
+    stopped = time.perf_counter() - start
+    pending = rb.Time.pending()["delayed"]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        rb.Time._process_calls()
+    processed = time.perf_counter() - start
+
+    print(
+        f"{count:>7} timers  schedule {scheduled / count * 1e6:5.2f} us  stop {stopped / count * 1e6:5.2f} us  "
+        f"pending after stop {pending:>6}  frame {processed / frames * 1000:6.3f} ms"
+    )
+    for task in tasks:
+        task.stop()
+
+
+def owned(count: int):
+    rb.Time._delta_time = 16  # a 60 fps frame
+    scene = rb.Scene()
+    gos = [rb.GameObject() for _ in range(count)]
+    scene.add(*gos)
+    for go in gos:
+        rb.Time.delayed_call(lambda: None, 1, owner=go)
+
+    scene._update()
+    start = time.perf_counter()
+    for _ in range(10):
+        scene._update()
+    updated = (time.perf_counter() - start) / 10
+
+    start = time.perf_counter()
+    scene.remove(*gos)
+    removed = time.perf_counter() - start
+
+    print(
+        f"{count:>7} owners  update {updated * 1000:6.3f} ms  remove {removed / count * 1e6:5.2f} us  "
+        f"pending after remove {sum(rb.Time.pending(go)['delayed'] for go in gos)}"
+    )
+
+
+if __name__ == "__main__":
+    for n in (1000, 10000, 100000):
+        run(n)
+    for n in (1000, 10000):
+        owned(n)
@@ -0,0 +1,32 @@
+"""
+Measures the cost of updating a scene full of buttons.
+
+Run from the repository root with: python benchmarks/ui_bench.py
+"""
+import time
+import rubato as rb
+
+rb.init(headless=True)
+
+
+def run(name: str, count: int = 500, frames: int = 200, moving: bool = False):
+    scene = rb.Scene()
+    for i in range(count):
+        scene.add(rb.wrap(rb.Button(20, 20), pos=((i % 25) * 24 - 300, (i // 25) * 24 - 240)))
+
+    mouse = [rb.Vector(0, 0)]
+    rb.Input.get_mouse_pos = lambda: mouse[0]
+    scene._update()
+
+    start = time.perf_counter()
+    for i in range(frames):
+        if moving:
+            mouse[0] = rb.Vector(i % 300 - 150, i % 200 - 100)
+        scene._update()
+    print(f"{name:<26} {(time.perf_counter() - start) / frames * 1000:6.3f} ms per frame")
+
+
+run("500 buttons, still mouse")
+run("500 buttons, moving mouse", moving=True)
+run("2000 buttons, still mouse", count=2000)
+run("2000 buttons, moving mouse", count=2000, moving=True)
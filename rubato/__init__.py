@@ -11,7 +11,7 @@
 # pylint: disable=wrong-import-position
 from warnings import simplefilter
 from importlib.resources import files
-import cython, sys
+import cython, sys, os
 
 if not cython.compiled and "sphinx" not in sys.modules:
     raise Exception("rubato must be compiled with Cython")
@@ -39,7 +39,8 @@ def init(
     maximize: bool = False,
     target_fps: int = 0,
     physics_fps: int = 50,
-    hidden: bool = False  # test: skip
+    hidden: bool = False,  # test: skip
+    headless: bool = False,
 ):
     """
     Initializes rubato.
@@ -58,16 +59,27 @@ def init(
         target_fps: The target frames per second. If set to 0, the target fps will be uncapped. Defaults to 0.
         physics_fps: The physics simulation's frames per second. Defaults to 50.
         hidden: Whether the window should be hidden. Defaults to False.
+        headless: Whether to run without a display, for servers and automated tests. SDL uses its dummy video and
+            audio drivers unless the SDL_VIDEODRIVER and SDL_AUDIODRIVER environment variables say otherwise, the
+            window is never shown and nothing is drawn unless Game.headless_draw is True, in which case frames are
+            drawn to an offscreen target that Display.save_screenshot() reads. A hidden window is still created, on
+            the dummy driver, so that the window properties of Display keep working. Defaults to False.
     """
+    if headless:
+        # only takes effect if SDL has not been initialized yet
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
     sdl2.SDL_Init(sdl2.SDL_INIT_EVERYTHING)
 
     Game._initialized = True
 
     Time.target_fps = target_fps
     if Time.target_fps != 0:
-        Time._normal_delta = int(1000 / target_fps)
+        Time._normal_delta = 1000 / target_fps
     Time._physics_fps = physics_fps
     Time.fixed_delta = 1 / physics_fps
+    Time._counter_start = sdl2.SDL_GetPerformanceCounter()
 
     flags = (
         sdl2.SDL_WINDOW_RESIZABLE | sdl2.SDL_WINDOW_ALLOW_HIGHDPI | sdl2.SDL_WINDOW_MOUSE_FOCUS |
@@ -78,29 +90,37 @@ def init(
 
     size = res if not window_size else window_size
 
+    # headless games keep a hidden window too, as the window properties of Display all read from it
     Display.window = sdl2.ext.Window(name, (int(size[0]), int(size[1])), window_pos, flags)
 
-    Display.renderer = sdl2.ext.Renderer(
-        Display.window,
-        flags=(sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_TARGETTEXTURE),
-        logical_size=(int(res[0]), int(res[1]))
-    )
+    Display.headless = headless
+    if headless:
+        # a software renderer drawing into a surface needs no display and never waits for vsync
+        Display._target = sdl2.SDL_CreateRGBSurfaceWithFormat(0, int(res[0]), int(res[1]), 32, Display.pixel_format)
+        Display.renderer = sdl2.ext.Renderer(Display._target, logical_size=(int(res[0]), int(res[1])))
+    else:
+        Display.renderer = sdl2.ext.Renderer(
+            Display.window,
+            flags=(sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_TARGETTEXTURE),
+            logical_size=(int(res[0]), int(res[1]))
+        )
     Display._half_res = (res[0] / 2, res[1] / 2)
 
-    if change_pos:
-        Display.window_pos += Vector(0, Display.get_window_border_size()[0])
+    if not headless:
+        if change_pos:
+            Display.window_pos += Vector(0, Display.get_window_border_size()[0])
 
-    if icon:
-        Display.set_window_icon(icon)
-    else:
-        Display.set_window_icon(str(files("rubato.static.png").joinpath("logo_filled.png")))
+        if icon:
+            Display.set_window_icon(icon)
+        else:
+            Display.set_window_icon(str(files("rubato.static.png").joinpath("logo_filled.png")))
 
-    Display.set_fullscreen(fullscreen)
+        Display.set_fullscreen(fullscreen)
 
-    if maximize and not fullscreen:
-        Display.maximize_window()
+        if maximize and not fullscreen:
+            Display.maximize_window()
 
-    Display.hidden = hidden
+    Display.hidden = hidden or headless
 
     Game.debug_font = Font(size=22, font="Mozart", color=Color.debug)
 
@@ -1,3 +1,3 @@
 """The init for c_src"""
 
-from . import c_draw
+from . import c_draw, c_noise
@@ -0,0 +1,62 @@
+# distutils: language = c++
+# cython: language_level = 3
+"""Loader for cnoise.cpp"""
+import cython
+from typing import Any
+if cython.compiled:
+    from cython.cimports.rubato.c_src import cnoise  # type: ignore
+    from cython.cimports.cpython import array  # type: ignore
+else:
+    cnoise: Any
+    import array
+
+
+def noise2_points(
+    xs: array.array,
+    ys: array.array,
+    seed: int,
+    octaves: int,
+    lacunarity: float,
+    gain: float,
+    grads: array.array,
+) -> array.array:
+    out: array.array = array.array("d", [0.0]) * len(xs)
+    cnoise.noise2Points(
+        xs.data.as_voidptr,  # type: ignore
+        ys.data.as_voidptr,  # type: ignore
+        out.data.as_voidptr,  # type: ignore
+        len(xs),
+        seed & 0xFFFFFFFFFFFFFFFF,
+        (seed >> 64) & 3,
+        octaves,
+        lacunarity,
+        gain,
+        grads.data.as_voidptr,  # type: ignore
+    )
+    return out
+
+
+def noise2_grid(
+    xs: array.array,
+    ys: array.array,
+    seed: int,
+    octaves: int,
+    lacunarity: float,
+    gain: float,
+    grads: array.array,
+) -> array.array:
+    out: array.array = array.array("d", [0.0]) * (len(xs) * len(ys))
+    cnoise.noise2Grid(
+        xs.data.as_voidptr,  # type: ignore
+        len(xs),
+        ys.data.as_voidptr,  # type: ignore
+        len(ys),
+        out.data.as_voidptr,  # type: ignore
+        seed & 0xFFFFFFFFFFFFFFFF,
+        (seed >> 64) & 3,
+        octaves,
+        lacunarity,
+        gain,
+        grads.data.as_voidptr,  # type: ignore
+    )
+    return out
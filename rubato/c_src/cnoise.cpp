@@ -0,0 +1,136 @@
+#include <cstdint>
+
+/***********************************************************************************************************************
+
+OPENSIMPLEX2 NOISE
+
+Computes the same values as rubato.utils.computation.noise.Noise, sample for sample. Python hashes lattice points with
+unbounded integers, so the hash here keeps the lowest 66 bits of each product, which are all the bits the gradient
+index depends on. Floating point operations are done in the same order as in Python and must not be contracted.
+
+***********************************************************************************************************************/
+
+#define PRIME_X 0x5205402B9270C86FULL
+#define PRIME_Y 0x598CD327003817B5ULL
+#define HASH_MULTIPLIER 0x53A3F72DEEC546F5ULL
+
+#define SKEW_2D 0.366025403784439
+#define UNSKEW_2D -0.21132486540518713
+#define RSQUARED_2D 0.5
+
+// the high 64 bits of the product of two 64 bit integers
+inline uint64_t mulhi(uint64_t a, uint64_t b) {
+    uint64_t a0 = a & 0xFFFFFFFF, a1 = a >> 32, b0 = b & 0xFFFFFFFF, b1 = b >> 32;
+    uint64_t p00 = a0 * b0, p01 = a0 * b1, p10 = a1 * b0, p11 = a1 * b1;
+    uint64_t mid = (p00 >> 32) + (p01 & 0xFFFFFFFF) + (p10 & 0xFFFFFFFF);
+    return p11 + (p01 >> 32) + (p10 >> 32) + (mid >> 32);
+}
+
+// a * c as an unbounded two's complement integer, as its low 64 bits and the 2 bits above them
+inline void mul66(int64_t a, uint64_t c, uint64_t& lo, uint64_t& hi) {
+    uint64_t u = (uint64_t) a;
+    lo = u * c;
+    hi = (mulhi(u, c) - (a < 0 ? c : 0)) & 3;
+}
+
+inline double grad2(uint64_t seedLo, uint64_t seedHi, int64_t xsb, int64_t ysb, double dx, double dy, const double* grads) {
+    uint64_t xl, xh, yl, yh;
+    mul66(xsb, PRIME_X, xl, xh);
+    mul66(ysb, PRIME_Y, yl, yh);
+
+    uint64_t hl = seedLo ^ xl ^ yl, hh = (seedHi ^ xh ^ yh) & 3;
+    uint64_t pl = hl * HASH_MULTIPLIER, ph = (mulhi(hl, HASH_MULTIPLIER) + hh * HASH_MULTIPLIER) & 3;
+    int gi = (int) (((pl & 0xFF) ^ ((pl >> 58) | (ph << 6))) & 0xFE);
+    return grads[gi] * dx + grads[gi | 1] * dy;
+}
+
+inline int64_t floorInt(double x) {
+    int64_t xi = (int64_t) x;
+    return x < xi ? xi - 1 : xi;
+}
+
+inline double noise2(uint64_t seedLo, uint64_t seedHi, double x, double y, const double* grads) {
+    double s = SKEW_2D * (x + y);
+    double xs = x + s, ys = y + s;
+
+    int64_t xsb = floorInt(xs), ysb = floorInt(ys);
+    double xi = xs - xsb, yi = ys - ysb;
+
+    double t = (xi + yi) * UNSKEW_2D;
+    double dx0 = xi + t, dy0 = yi + t;
+
+    double value = 0;
+    double a0 = RSQUARED_2D - dx0 * dx0 - dy0 * dy0;
+    if (a0 > 0) {
+        value = (a0 * a0) * (a0 * a0) * grad2(seedLo, seedHi, xsb, ysb, dx0, dy0, grads);
+    }
+
+    double a1 = (2 * (1 + 2 * UNSKEW_2D) * (1 / UNSKEW_2D + 2)) * t +
+                ((-2 * (1 + 2 * UNSKEW_2D) * (1 + 2 * UNSKEW_2D)) + a0);
+    if (a1 > 0) {
+        double dx1 = dx0 - (1 + 2 * UNSKEW_2D), dy1 = dy0 - (1 + 2 * UNSKEW_2D);
+        value += (a1 * a1) * (a1 * a1) * grad2(seedLo, seedHi, xsb + 1, ysb + 1, dx1, dy1, grads);
+    }
+
+    if (dy0 > dx0) {
+        double dx2 = dx0 - UNSKEW_2D, dy2 = dy0 - (UNSKEW_2D + 1);
+        double a2 = RSQUARED_2D - dx2 * dx2 - dy2 * dy2;
+        if (a2 > 0) {
+            value += (a2 * a2) * (a2 * a2) * grad2(seedLo, seedHi, xsb, ysb + 1, dx2, dy2, grads);
+        }
+    } else {
+        double dx2 = dx0 - (UNSKEW_2D + 1), dy2 = dy0 - UNSKEW_2D;
+        double a2 = RSQUARED_2D - dx2 * dx2 - dy2 * dy2;
+        if (a2 > 0) {
+            value += (a2 * a2) * (a2 * a2) * grad2(seedLo, seedHi, xsb + 1, ysb, dx2, dy2, grads);
+        }
+    }
+
+    return value;
+}
+
+// octaves of noise added together, each at lacunarity times the frequency and gain times the amplitude of the last
+inline double fbm2(uint64_t seedLo, uint64_t seedHi, double x, double y, int octaves, double lacunarity, double gain, const double* grads) {
+    if (octaves == 1) {
+        return noise2(seedLo, seedHi, x, y, grads);
+    }
+
+    double value = 0, total = 0, amplitude = 1, frequency = 1;
+    for (int i = 0; i < octaves; i++) {
+        value += amplitude * noise2(seedLo, seedHi, x * frequency, y * frequency, grads);
+        total += amplitude;
+        amplitude *= gain;
+        frequency *= lacunarity;
+    }
+    return value / total;
+}
+
+/***********************************************************************************************************************
+
+ARRAY FUNCTIONS
+
+***********************************************************************************************************************/
+
+inline void noise2Points(void* _xs, void* _ys, void* _out, int len, uint64_t seedLo, uint64_t seedHi, int octaves, double lacunarity, double gain, void* _grads) {
+    const double* xs = (const double*) _xs;
+    const double* ys = (const double*) _ys;
+    const double* grads = (const double*) _grads;
+    double* out = (double*) _out;
+
+    for (int i = 0; i < len; i++) {
+        out[i] = fbm2(seedLo, seedHi, xs[i], ys[i], octaves, lacunarity, gain, grads);
+    }
+}
+
+inline void noise2Grid(void* _xs, int nx, void* _ys, int ny, void* _out, uint64_t seedLo, uint64_t seedHi, int octaves, double lacunarity, double gain, void* _grads) {
+    const double* xs = (const double*) _xs;
+    const double* ys = (const double*) _ys;
+    const double* grads = (const double*) _grads;
+    double* out = (double*) _out;
+
+    for (int j = 0; j < ny; j++) {
+        for (int i = 0; i < nx; i++) {
+            out[j * nx + i] = fbm2(seedLo, seedHi, xs[i], ys[j], octaves, lacunarity, gain, grads);
+        }
+    }
+}
@@ -0,0 +1,4 @@
+cdef extern from "cnoise.cpp":
+
+    void noise2Points(void* xs, void* ys, void* out, int len, unsigned long long seedLo, unsigned long long seedHi, int octaves, double lacunarity, double gain, void* grads)
+    void noise2Grid(void* xs, int nx, void* ys, int ny, void* out, unsigned long long seedLo, unsigned long long seedHi, int octaves, double lacunarity, double gain, void* grads)
@@ -6,7 +6,7 @@
 import sdl2, sdl2.sdlttf
 import sys
 
-from . import Time, Display, Radio, Events, Font, PrintError, IdError, Draw, InitError, Camera
+from . import Time, Display, Input, Sound, Radio, Events, Font, PrintError, IdError, Draw, InitError, Camera, Profiler
 
 if TYPE_CHECKING:
     from . import Scene
@@ -25,6 +25,12 @@ class Game:
     """Whether to use debug-mode."""
     show_fps: bool = False
     """Whether to show fps."""
+    headless_draw: bool = False
+    """
+    Whether a headless game still draws its frames, onto an offscreen target that
+    :meth:`Display.save_screenshot() <rubato.utils.hardware.display.Display.save_screenshot>` can read.
+    Drawing is skipped otherwise. Defaults to False.
+    """
     debug_font: Font
     """What font to draw debug text in."""
 
@@ -131,54 +137,93 @@ def _start(cls) -> None:
     def _tick(cls):
         # start a new frame
         Time._start_frame()
+        Profiler._start_frame()
 
         if cls.state == cls.STOPPED:
             sdl2.SDL_PushEvent(sdl2.SDL_Event(sdl2.SDL_QUIT))
 
         # Pump SDL events
+        Profiler.begin("events")
         sdl2.SDL_PumpEvents()
+        Input._snapshot()
 
         # Event handling
         if Radio._handle():
             cls.quit()
+        Radio._drain()
+        Profiler.end()
 
         # process delayed calls
-        Time._process_calls()
+        Profiler.begin("calls")
+        Time._process_calls(cls.state == cls.PAUSED)
+        Profiler.end()
 
+        Profiler.begin("update")
         cls.update()
 
         curr = cls._scenes.get(cls._current)
+        Sound._camera = curr.camera if curr else None
         if curr:  # pylint: disable=using-constant-test
             if cls.state == Game.PAUSED:
                 # process user set pause update
                 curr._paused_update()
+                Profiler.end()
             else:
                 # normal update
                 curr._update()
+                Profiler.end()
 
-                # fixed update
+                # fixed update, dropping the time that does not fit in max_substeps
+                Profiler.begin("fixed update")
                 Time._physics_counter += Time.delta_time
+                if Time.max_substeps:
+                    Time._physics_counter = min(Time._physics_counter, Time.fixed_delta * Time.max_substeps)
 
                 while Time._physics_counter >= Time.fixed_delta:
                     curr._fixed_update()
                     Time._physics_counter -= Time.fixed_delta
+                Profiler.end()
+        else:
+            Profiler.end()
 
+        # headless games only draw when asked to, onto the offscreen target
+        if not Display.headless or cls.headless_draw:
+            cls._render(curr)
+        else:
+            Draw._queue.clear()
+
+        # end frame
+        Profiler.begin("wait")
+        Time._end_frame()
+        Profiler.end()
+        Profiler._end_frame()
+
+    @classmethod
+    def _render(cls, curr: Scene | None):
+        """Draws the frame and presents it."""
+        Profiler.begin("draw")
+        if curr:  # pylint: disable=using-constant-test
             curr._draw()
         else:
             Draw.clear()
 
         cls.draw()
+        Profiler.end()
 
+        Profiler.begin("dump")
         Draw._dump()
+        Profiler.end()
 
         if cls.show_fps:
             Draw._draw_fps(cls.debug_font)
+            if Profiler.overlay and Profiler.enabled:
+                Draw._draw_profile(cls.debug_font)
 
         # update renderers
-        Display.renderer.present()
-
-        # end frame
-        Time._end_frame()
+        if not Display.headless:
+            Profiler.begin("present")
+            Display.renderer.present()
+            Profiler.end()
 
     @staticmethod
     def update():  # test: skip
@@ -3,10 +3,14 @@
 Its functionality is defined by the components it holds.
 """
 from __future__ import annotations
-from typing import Type, TypeVar
+from typing import Type, TypeVar, TYPE_CHECKING
 
-from . import Component
-from ... import Game, Vector, DuplicateComponentError, Draw, ImplementationError, Camera, Color, Surface, Math
+from . import Component, RigidBody
+from ... import Game, Vector, DuplicateComponentError, Draw, ImplementationError, Camera, Color, Surface, Math, Time
+
+if TYPE_CHECKING:
+    from .. import Scene
+    from ...utils.rb_time import _Clock
 
 T = TypeVar("T", bound=Component)
 
@@ -29,6 +33,8 @@ class GameObject:
         hidden: Whether the game object is hidden or not. Defaults to False.
     """
 
+    _debug_cross: Surface | None = None
+
     def __init__(
         self,
         pos: Vector | tuple[float, float] = (0, 0),
@@ -45,28 +51,52 @@ def __init__(
         """
         The name of the game object. Will default to: ""
         """
-        self.pos: Vector = Vector.create(pos)
-        """The current position of the game object."""
+        self._pos: Vector = Vector.create(pos)
         self.ignore_cam: bool = ignore_cam
         """Whether the game object ignores the scene's camera when drawing or not."""
         self.debug: bool = debug
         """Whether to draw a debug crosshair for the game object."""
         self.z_index: int = z_index
         """The z_index of the game object."""
-        self.rotation: float = rotation
-        """The rotation of the game object in degrees."""
+        self._rotation: float = rotation
         self.hidden: bool = hidden
         """Whether the game object is hidden (not drawn)."""
         self.active: bool = active
         """Whether the game object should update and draw."""
 
-        self._parent: GameObject | None = None
-        self.parent = parent
+        self._scene: Scene | None = None
         self._children: list[GameObject] = []
         self._components: dict[type, list[Component]] = {}
-        self._debug_cross: Surface = Surface(10, 10)
-        self._debug_cross.draw_line(Vector(0, 5), Vector(0, -5), Color.debug, thickness=2)  # vertical line
-        self._debug_cross.draw_line(Vector(-5, 0), Vector(5, 0), Color.debug, thickness=2)  # horizontal line
+        self._lookup: dict[type, list[Component]] = {}
+        self._parent: GameObject | None = None
+        self._clock: _Clock | None = None
+        """The time of the game object and the tasks it owns. Created when it is given its first task."""
+        self.parent = parent
+
+    @property
+    def pos(self) -> Vector:
+        """
+        The current position of the game object. Setting it makes the spatial queries of the scene rebuild their grid,
+        but changing its x or y in place does not.
+        """
+        return self._pos
+
+    @pos.setter
+    def pos(self, new: Vector):
+        self._pos = new
+        if self._scene is not None:
+            self._scene._spatial = None
+
+    @property
+    def rotation(self) -> float:
+        """The rotation of the game object in degrees."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, new: float):
+        self._rotation = new
+        if self._scene is not None:
+            self._scene._spatial = None
 
     @property
     def parent(self) -> GameObject | None:
@@ -76,11 +106,21 @@ def parent(self) -> GameObject | None:
     @parent.setter
     def parent(self, parent: GameObject | None):
         """Sets the parent of the game object."""
+        if parent is self._parent:
+            return
         if self._parent:
             self._parent._children.remove(self)
+        if scene := self._scene:
+            scene._unregister_tree(self)
         self._parent = parent
         if self._parent:
             self._parent._children.append(self)
+        if self._parent and self._parent._scene:
+            scene = self._parent._scene
+        elif scene and not scene.contains(self):
+            scene = None
+        if scene:
+            scene._register_tree(self)
 
     def true_z(self) -> int:
         """
@@ -101,8 +141,8 @@ def true_pos(self) -> Vector:
             Vector: The true position of the game object.
         """
         if self.parent:
-            return self.pos.rotate(self.parent.true_rotation()) + self.parent.true_pos()
-        return self.pos
+            return self._pos.rotate(self.parent.true_rotation()) + self.parent.true_pos()
+        return self._pos
 
     def true_rotation(self) -> float:
         """
@@ -112,8 +152,8 @@ def true_rotation(self) -> float:
             float: The true rotation of the game object.
         """
         if self.parent:
-            return self.rotation + self.parent.true_rotation()
-        return self.rotation
+            return self._rotation + self.parent.true_rotation()
+        return self._rotation
 
     def children(self) -> tuple[GameObject]:
         """
@@ -156,7 +196,10 @@ def add(self, *components: Component) -> GameObject:
                 self._components[comp_type] = []
             self._components[comp_type].append(component)
             component.gameobj = self
+            if self._scene:
+                self._scene._register(component)
 
+        self._lookup.clear()
         return self
 
     def remove(self, comp_type: Type[Component]):
@@ -171,9 +214,12 @@ def remove(self, comp_type: Type[Component]):
         """
         for key, val in self._components.items():
             if issubclass(key, comp_type):
+                if self._scene:
+                    self._scene._unregister(val[0])
                 del val[0]
                 if not val:
-                    del val
+                    del self._components[key]
+                self._lookup.clear()
                 return
         raise IndexError(f"There are no components of type '{comp_type}' in game object '{self.name}'.")
 
@@ -191,6 +237,11 @@ def remove_by_ref(self, component: Component) -> bool:
             if issubclass(key, type(component)):
                 if component in val:
                     val.remove(component)
+                    if self._scene:
+                        self._scene._unregister(component)
+                    if not val:
+                        del self._components[key]
+                    self._lookup.clear()
                     return True
         return False
 
@@ -204,13 +255,15 @@ def remove_all(self, comp_type: Type[Component]):
         Raises:
             IndexError: The components were not in the game object and nothing was removed.
         """
-        deleted = False
-        for key, val in self._components.items():
-            if issubclass(key, comp_type):
-                del val
-                deleted = True
-        if not deleted:
+        keys = [key for key in self._components if issubclass(key, comp_type)]
+        if not keys:
             raise IndexError(f"There are no components of type '{comp_type}' in game object '{self.name}'.")
+        for key in keys:
+            if self._scene:
+                for comp in self._components[key]:
+                    self._scene._unregister(comp)
+            del self._components[key]
+        self._lookup.clear()
 
     def get(self, comp_type: Type[T]) -> T:
         """
@@ -225,9 +278,8 @@ def get(self, comp_type: Type[T]) -> T:
         Returns:
             The first component of that type that the gameobject holds.
         """
-        for key, val in self._components.items():
-            if issubclass(key, comp_type):
-                return val[0]  # type: ignore
+        if comps := self._find(comp_type):
+            return comps[0]  # type: ignore
         raise ValueError(f"There are no components of type '{comp_type}' in game object '{self.name}'.")
 
     def get_all(self, comp_type: Type[T]) -> list[T]:
@@ -241,11 +293,41 @@ def get_all(self, comp_type: Type[T]) -> list[T]:
             A list containing all the components of that type. If no components were found, the
                 list is empty.
         """
-        fin = []
-        for key, val in self._components.items():
-            if issubclass(key, comp_type):
-                fin.extend(val)
-        return fin
+        return list(self._find(comp_type))  # type: ignore
+
+    def _find(self, comp_type: type) -> list[Component]:
+        """
+        Gets all the components of a type from the lookup cache, building the entry on the first request.
+        The cache is cleared whenever a component is added or removed.
+
+        Args:
+            comp_type: The type of component to search for.
+
+        Returns:
+            The cached list of components of that type. This list must not be modified.
+        """
+        try:
+            return self._lookup[comp_type]
+        except KeyError:
+            fin = []
+            for key, val in self._components.items():
+                if issubclass(key, comp_type):
+                    fin.extend(val)
+            self._lookup[comp_type] = fin
+            return fin
+
+    def _first(self, comp_type: Type[T]) -> T | None:
+        """
+        Gets the first component of a type from the game object.
+
+        Args:
+            comp_type: The type of component to search for.
+
+        Returns:
+            The first component of that type, or None if the game object does not hold one.
+        """
+        comps = self._find(comp_type)
+        return comps[0] if comps else None  # type: ignore
 
     def _deep_get_all(self, comp_type: Type[T]) -> list[T]:
         """
@@ -267,6 +349,9 @@ def _update(self):
         if not self.active:
             return
 
+        if self._clock is not None:
+            self._clock.advance(self._clock.now + Time._delta_time)
+
         all_comps = list(self._components.values())
         for comps in all_comps:
             for comp in comps:
@@ -290,6 +375,21 @@ def _draw(self, camera: Camera):
         if self.hidden or not self.active:
             return
 
+        rb: RigidBody | None = self._first(RigidBody)
+        if rb is None or not rb.interpolate:
+            self._draw_tree(camera)
+            return
+
+        # draw at the interpolated transform without changing the one the game sees
+        pos, rotation = self._pos, self._rotation
+        self._pos, self._rotation = rb._interpolated()
+        try:
+            self._draw_tree(camera)
+        finally:
+            self._pos, self._rotation = pos, rotation
+
+    def _draw_tree(self, camera: Camera):
+        """Queues the components and children of the game object."""
         cam = Game._zero_cam if self.ignore_cam else camera
 
         for comps in self._components.values():
@@ -301,9 +401,25 @@ def _draw(self, camera: Camera):
             child._draw(cam)
 
         if self.debug or Game.debug:
-            self._debug_cross.rotation = self.true_rotation()
+            self._queue_debug_cross(cam)
+
+    def _queue_debug_cross(self, camera: Camera):
+        """Queues the debug crosshair. All game objects share the same crosshair surface."""
+        if camera.z_index < Math.INF:
+            return
+
+        if (cross := GameObject._debug_cross) is None:
+            cross = GameObject._debug_cross = Surface(10, 10)
+            cross.draw_line(Vector(0, 5), Vector(0, -5), Color.debug, thickness=2)  # vertical line
+            cross.draw_line(Vector(-5, 0), Vector(5, 0), Color.debug, thickness=2)  # horizontal line
+
+        pos, rotation = self.true_pos(), self.true_rotation()
 
-            Draw.queue_surface(self._debug_cross, self.true_pos(), Math.INF, cam)
+        def draw_cross():
+            cross.rotation = rotation
+            Draw.surface(cross, pos, camera)
+
+        Draw._push(Math.INF, draw_cross)
 
     def clone(self) -> GameObject:
         """
@@ -330,10 +446,7 @@ def clone(self) -> GameObject:
         return new_obj
 
     def __contains__(self, comp_type):
-        for key in self._components:
-            if issubclass(key, comp_type):
-                return True
-        return False
+        return bool(self._find(comp_type))
 
     def __repr__(self):
         return (
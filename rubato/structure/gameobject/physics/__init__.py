@@ -2,4 +2,5 @@
 from .hitbox import Hitbox, Polygon, Rectangle, Circle
 from .rigidbody import RigidBody
 from .engine import Manifold, _Engine
+from .query import RaycastHit, _SpatialHash
 from .qtree import _QTree
@@ -4,7 +4,8 @@
 import math
 
 from . import RigidBody, Circle, Polygon, Rectangle
-from .... import Math, Vector, InitError
+from .hitbox import _ignore
+from .... import Math, Vector, InitError, Time
 
 if TYPE_CHECKING:
     from . import Hitbox
@@ -20,6 +21,13 @@ class _Engine:
     def __init__(self) -> None:
         raise InitError(self)
 
+    _contacts: list[Manifold] | None = None
+    """The collisions found during the current physics step, waiting to be solved. None outside of a physics step."""
+    _island_count: int = 0
+    """How many islands the last call to _solve found."""
+    _pairs: int = 0
+    """How many pairs of hitboxes collide() was called with, for the profiler. Reset by the scene every step."""
+
     @staticmethod
     def resolve(col: Manifold):
         """
@@ -28,73 +36,96 @@ def resolve(col: Manifold):
         Args:
             col: The collision information.
         """
-        # INITIALIZATION STEP
-        rb_a: RigidBody | None = col.shape_a.gameobj.get(RigidBody) if (RigidBody in col.shape_a.gameobj) else None
-        rb_b: RigidBody | None = col.shape_b.gameobj.get(RigidBody) if (RigidBody in col.shape_b.gameobj) else None
-
-        if not rb_a and not rb_b:
-            return
-
-        # calculate restitution
-        e = max(rb_a.bounciness if rb_a else 0, rb_b.bounciness if rb_b else 0)
-
-        # calculate friction coefficient
-        if not rb_a:
-            rv = rb_b.velocity  # type: ignore
-            mu = rb_b.friction * rb_b.friction  # type: ignore
-        elif not rb_b:
-            rv = -rb_a.velocity
-            mu = rb_a.friction * rb_a.friction
-        else:
-            rv = rb_b.velocity - rb_a.velocity
-            mu = (rb_a.friction * rb_a.friction + rb_b.friction * rb_b.friction) / 2
-
-        # find inverse masses
-        inv_mass_a: float = rb_a.inv_mass if rb_a else 0
-        inv_mass_b: float = rb_b.inv_mass if rb_b else 0
-
-        # handle infinite mass cases
-        if inv_mass_a == inv_mass_b == 0:
-            if not rb_a:
-                inv_mass_b = 1
-            elif not rb_b:
-                inv_mass_a = 1
-            else:
-                inv_mass_a, inv_mass_b = 1, 1
-
-        col.normal *= -1
+        _Engine._solve([col], {}, 1)
 
-        # RESOLUTION STEP
-        contact_vel = rv.dot(col.normal)
-
-        inv_inert = 1 / (inv_mass_a + inv_mass_b)
-
-        j = -(1 + e) * contact_vel * inv_inert
-
-        impulse = col.normal * j
+    @staticmethod
+    def _solve(cols: list[Manifold], cache: dict[tuple[Hitbox, Hitbox], tuple[float, float]],
+               iterations: int) -> dict[tuple[Hitbox, Hitbox], tuple[float, float]]:
+        """
+        Solves collisions with sequential impulses. The impulses of each pair of hitboxes are accumulated over the
+        iterations and are used as a starting point (warm start) the next time the same pair collides.
 
-        t = rv - col.normal * rv.dot(col.normal)
-        t.normalized(t)
+        Collisions are split into islands: groups of collisions linked by the rigidbodies that can move. Islands
+        cannot affect each other, so each one is solved on its own and stops iterating as soon as it settles.
 
-        jt = -rv.dot(t) * inv_inert
+        Args:
+            cols: The collisions to solve.
+            cache: The accumulated impulses of the previous step, by pair of hitboxes.
+            iterations: The most times to go over the collisions of an island.
 
-        if abs(jt) < j * mu:
-            t_impulse = t * jt
-        else:
-            t_impulse = -mu * t * j
+        Returns:
+            The accumulated impulses of this step, by pair of hitboxes.
+        """
+        contacts: list[_Contact] = []
+        for col in cols:
+            rb_a: RigidBody | None = col.shape_a.gameobj._first(RigidBody)
+            rb_b: RigidBody | None = col.shape_b.gameobj._first(RigidBody)
+            if not rb_a and not rb_b:
+                continue
+
+            contact = _Contact(col, rb_a, rb_b)
+            if contact.mass == 0:
+                continue
+
+            # the impulses do not change sign when the pair is seen in the other order
+            impulses = cache.get((col.shape_a, col.shape_b)) or cache.get((col.shape_b, col.shape_a))
+            contact.prepare(impulses)
+            contacts.append(contact)
+
+        islands = _Engine._islands(contacts)
+        _Engine._island_count = len(islands)
+        for island in islands:
+            for _ in range(iterations):
+                change = 0
+                for contact in island:
+                    change = max(change, contact.solve())
+                if change < _Contact.settle:
+                    break
+
+        new_cache = {}
+        for contact in contacts:
+            contact.correct()
+            new_cache[(contact.col.shape_a, contact.col.shape_b)] = (contact.jn, contact.jt)
+        return new_cache
 
-        correction = max(col.penetration - 0.01, 0) * col.normal
+    @staticmethod
+    def _islands(contacts: list[_Contact]) -> list[list[_Contact]]:
+        """
+        Groups contacts that share a moving rigidbody, directly or through other contacts. Rigidbodies that do not
+        move (static or infinite mass) do not link contacts, so a floor does not merge everything resting on it.
 
-        # Corrections
-        if rb_a and not rb_a.static:
-            rb_a.velocity -= impulse * inv_mass_a
-            rb_a.velocity -= t_impulse * inv_mass_a
-            col.shape_a.gameobj.pos -= correction * rb_a.pos_correction
+        Args:
+            contacts: The contacts to group.
 
-        if rb_b and not rb_b.static:
-            rb_b.velocity += impulse * inv_mass_b
-            rb_b.velocity += t_impulse * inv_mass_b
-            col.shape_b.gameobj.pos += correction * rb_b.pos_correction
+        Returns:
+            The islands, ordered by their first contact. Contacts keep their order within an island.
+        """
+        parents: dict[RigidBody, RigidBody] = {}
+
+        def find(rb: RigidBody) -> RigidBody:
+            root = rb
+            while parents[root] is not root:
+                root = parents[root]
+            while parents[rb] is not root:
+                parents[rb], rb = root, parents[rb]
+            return root
+
+        for contact in contacts:
+            a = contact.rb_a if contact.inv_mass_a else None
+            b = contact.rb_b if contact.inv_mass_b else None
+            for rb in (a, b):
+                if rb is not None and rb not in parents:
+                    parents[rb] = rb
+            if a is not None and b is not None:
+                root_a, root_b = find(a), find(b)
+                if root_a is not root_b:
+                    parents[root_b] = root_a
+
+        islands: dict[RigidBody, list[_Contact]] = {}
+        for contact in contacts:
+            rb = contact.rb_a if contact.inv_mass_a else contact.rb_b
+            islands.setdefault(find(rb), []).append(contact)  # type: ignore
+        return list(islands.values())
 
     @staticmethod
     def overlap(hitbox_a: Hitbox, hitbox_b: Hitbox) -> Optional[Manifold]:
@@ -114,23 +145,110 @@ def overlap(hitbox_a: Hitbox, hitbox_b: Hitbox) -> Optional[Manifold]:
                           Rectangle | Polygon | Circle) or not isinstance(hitbox_b, Rectangle | Polygon | Circle):
             raise TypeError("Engine.overlap() only supports Rectangle, Polygon, and Circle objects.")
 
+        # rectangles that are not rotated take the axis-aligned shortcuts
+        box_a = _Engine._aabb(hitbox_a) if isinstance(hitbox_a, Rectangle) else None
+        box_b = _Engine._aabb(hitbox_b) if isinstance(hitbox_b, Rectangle) else None
+
         if isinstance(hitbox_a, Circle):
             if isinstance(hitbox_b, Circle):
                 return _Engine._circle_circle_test(hitbox_a, hitbox_b)
 
+            if box_b is not None:
+                return _Engine._circle_aabb_test(hitbox_a, hitbox_b, box_b)
+
             return _Engine._circle_polygon_test(hitbox_a, hitbox_b)
 
         if isinstance(hitbox_b, Circle):
-            r = _Engine._circle_polygon_test(hitbox_b, hitbox_a)
+            if box_a is not None:
+                r = _Engine._circle_aabb_test(hitbox_b, hitbox_a, box_a)
+            else:
+                r = _Engine._circle_polygon_test(hitbox_b, hitbox_a)
             return None if r is None else r._flip()
 
+        if box_a is not None and box_b is not None:
+            return _Engine._aabb_aabb_test(hitbox_a, hitbox_b, box_a, box_b)
+
         return _Engine._polygon_polygon_test(hitbox_a, hitbox_b)
 
+    @staticmethod
+    def _aabb(rect: Rectangle) -> Optional[tuple]:
+        """
+        Finds the center and half size of a rectangle whose sides are aligned with the axes.
+
+        Returns:
+            The center x, center y, half width and half height, or None if the rectangle is rotated.
+        """
+        rot = (rect.rot_offset + rect.gameobj.true_rotation()) % 180
+        if rot == 0:
+            hw, hh = rect.width * rect.scale.x / 2, rect.height * rect.scale.y / 2
+        elif rot == 90:
+            hw, hh = rect.height * rect.scale.y / 2, rect.width * rect.scale.x / 2
+        else:
+            return None
+
+        x, y = _Engine._world_pos(rect)
+        return x, y, abs(hw), abs(hh)
+
+    @staticmethod
+    def _aabb_aabb_test(rect_a: Rectangle, rect_b: Rectangle, box_a: tuple, box_b: tuple) -> Optional[Manifold]:
+        """Checks for overlap between two rectangles aligned with the axes"""
+        ax, ay, ahw, ahh = box_a
+        bx, by, bhw, bhh = box_b
+
+        dx, dy = ax - bx, ay - by
+        over_x = ahw + bhw - abs(dx)
+        if over_x <= 0:
+            return
+        over_y = ahh + bhh - abs(dy)
+        if over_y <= 0:
+            return
+
+        # the shapes touch along the middle of the overlapping area
+        left, right = max(ax - ahw, bx - bhw), min(ax + ahw, bx + bhw)
+        bottom, top = max(ay - ahh, by - bhh), min(ay + ahh, by + bhh)
+
+        if over_x < over_y:
+            x = (left + right) / 2
+            return Manifold(
+                rect_a, rect_b, over_x, Vector(1 if dx >= 0 else -1, 0), [Vector(x, bottom), Vector(x, top)]
+            )
+
+        y = (bottom + top) / 2
+        return Manifold(rect_a, rect_b, over_y, Vector(0, 1 if dy >= 0 else -1), [Vector(left, y), Vector(right, y)])
+
+    @staticmethod
+    def _circle_aabb_test(circle: Circle, rect: Rectangle, box: tuple) -> Optional[Manifold]:
+        """Checks for overlap between a circle and a rectangle aligned with the axes"""
+        bx, by, hw, hh = box
+        circle_rad = circle.true_radius()
+        cx, cy = _Engine._world_pos(circle)
+
+        dx, dy = cx - bx, cy - by
+        px, py = min(max(dx, -hw), hw), min(max(dy, -hh), hh)
+
+        if px == dx and py == dy:
+            # the center is inside the rectangle, push it out through the closest side
+            sep_x, sep_y = abs(dx) - hw, abs(dy) - hh
+            if sep_x > sep_y:
+                norm, pen = Vector(1 if dx >= 0 else -1, 0), circle_rad - sep_x
+            else:
+                norm, pen = Vector(0, 1 if dy >= 0 else -1), circle_rad - sep_y
+            return _Engine._circle_contact(Manifold(circle, rect, pen, norm))
+
+        ox, oy = dx - px, dy - py
+        dist = ox * ox + oy * oy
+        if dist > circle_rad * circle_rad:
+            return
+
+        dist = math.sqrt(dist)
+        return _Engine._circle_contact(Manifold(circle, rect, circle_rad - dist, Vector(ox / dist, oy / dist)))
+
     @staticmethod
     def collide(hitbox_a: Hitbox, hitbox_b: Hitbox) -> Optional[Manifold]:
         """
         Collides two hitboxes (if they overlap), calling their callbacks if they exist.
-        Resolves the collision using Rigidbody impulse resolution if applicable.
+        Resolves the collision using Rigidbody impulse resolution if applicable. During a physics step, the resolution
+        is deferred until every collision of the step is known.
         Note that this is only implemented for native rubato hitbox types (Rectangle, Polygon, Circle).
 
         Args:
@@ -140,50 +258,72 @@ def collide(hitbox_a: Hitbox, hitbox_b: Hitbox) -> Optional[Manifold]:
         Returns:
             Returns a collision info object if a collision is detected or None if no collision is detected.
         """
+        _Engine._pairs += 1
         if not hitbox_a.should_collide(hitbox_a, hitbox_b) or not hitbox_b.should_collide(hitbox_b, hitbox_a):
             return
 
         col = _Engine.overlap(hitbox_a, hitbox_b)
         if col is None:
+            # manifolds are only made for the callbacks that were set
             if hitbox_b in hitbox_a.colliding:
-                mani = Manifold(hitbox_a, hitbox_b)
                 hitbox_a.colliding.remove(hitbox_b)
-                hitbox_a.on_exit(mani)
+                if hitbox_a.on_exit is not _ignore:
+                    hitbox_a.on_exit(Manifold(hitbox_a, hitbox_b))
 
             if hitbox_a in hitbox_b.colliding:
-                mani = Manifold(hitbox_b, hitbox_a)
                 hitbox_b.colliding.remove(hitbox_a)
-                hitbox_b.on_exit(mani)
+                if hitbox_b.on_exit is not _ignore:
+                    hitbox_b.on_exit(Manifold(hitbox_b, hitbox_a))
 
             return
 
-        loc = col._flip()
+        loc: Manifold | None = None
 
         if hitbox_b not in hitbox_a.colliding:
             hitbox_a.colliding.add(hitbox_b)
-            hitbox_a.on_enter(col)
+            if hitbox_a.on_enter is not _ignore:
+                hitbox_a.on_enter(col)
 
         if hitbox_a not in hitbox_b.colliding:
             hitbox_b.colliding.add(hitbox_a)
-            hitbox_b.on_enter(loc)
+            if hitbox_b.on_enter is not _ignore:
+                loc = col._flip()
+                hitbox_b.on_enter(loc)
 
         if not (hitbox_a.trigger or hitbox_b.trigger):
-            _Engine.resolve(col)
+            if _Engine._contacts is None:
+                _Engine.resolve(col)
+            else:
+                _Engine._contacts.append(col)
 
-        hitbox_a.on_collide(col)
-        hitbox_b.on_collide(loc)
+        if hitbox_a.on_collide is not _ignore:
+            hitbox_a.on_collide(col)
+        if hitbox_b.on_collide is not _ignore:
+            hitbox_b.on_collide(loc if loc is not None else col._flip())
+
+    @staticmethod
+    def _world_pos(hitbox: Hitbox) -> tuple[float, float]:
+        """Finds the world position of a hitbox without creating vectors when it has no offset."""
+        pos = hitbox.gameobj.true_pos()
+        off = hitbox.offset
+        if off.x == 0 and off.y == 0:
+            return pos.x, pos.y
+        rad = math.radians(-hitbox.gameobj.true_rotation())
+        c, s = math.cos(rad), math.sin(rad)
+        return pos.x + off.x * c - off.y * s, pos.y + off.x * s + off.y * c
 
     @staticmethod
     def _circle_circle_test(circle_a: Circle, circle_b: Circle) -> Optional[Manifold]:
         """Checks for overlap between two circles"""
-        a_rad = circle_a.true_radius()
-        b_rad = circle_b.true_radius()
-        a_pos = circle_a.true_pos()
-        b_pos = circle_b.true_pos()
+        a_rad: float = circle_a.true_radius()
+        b_rad: float = circle_b.true_radius()
+        ax, ay = _Engine._world_pos(circle_a)
+        bx, by = _Engine._world_pos(circle_b)
 
-        t_rad = a_rad + b_rad
-        d_x, d_y = a_pos.x - b_pos.x, a_pos.y - b_pos.y
-        dist = d_x * d_x + d_y * d_y
+        t_rad: float = a_rad + b_rad
+        d_x: float = ax - bx
+        d_y: float = ay - by
+        dist: float = d_x * d_x + d_y * d_y
 
         if dist > t_rad * t_rad:
             return
@@ -197,144 +337,226 @@ def _circle_circle_test(circle_a: Circle, circle_b: Circle) -> Optional[Manifold
             pen = t_rad - dist
             norm = Vector(d_x / dist, d_y / dist)
 
-        return Manifold(circle_a, circle_b, pen, norm)
+        return Manifold(circle_a, circle_b, pen, norm, [Vector(ax, ay) - norm * (a_rad - pen / 2)])
 
     @staticmethod
     def _circle_polygon_test(circle: Circle, polygon: Polygon | Rectangle) -> Optional[Manifold]:
         """Checks for overlap between a circle and a polygon"""
         verts = polygon.offset_verts()
-        circle_rad = circle.true_radius()
-        circle_pos = circle.true_pos()
-        poly_pos = polygon.true_pos()
-        poly_rot = polygon.gameobj.true_rotation()
-
-        center = (circle_pos - poly_pos).rotate(-poly_rot)
-
-        separation = -Math.INF
-        face_normal = 0
-
-        for i in range(len(verts)):
-            s = _Engine._get_normal(verts, i).dot(center - verts[i])
-
-            if s > circle_rad:
+        count = len(verts)
+        circle_rad: float = circle.true_radius()
+        poly_pos = polygon.gameobj.true_pos()
+        poly_rot: float = polygon.gameobj.true_rotation()
+
+        # the center of the circle in the frame of the polygon
+        cx, cy = _Engine._world_pos(circle)
+        rad = math.radians(poly_rot)
+        c: float = math.cos(rad)
+        s: float = math.sin(rad)
+        dx: float = cx - poly_pos.x
+        dy: float = cy - poly_pos.y
+        cx, cy = dx * c - dy * s, dx * s + dy * c
+
+        separation: float = -Math.INF
+        face: int = 0
+        nx: float = 0
+        ny: float = 0
+
+        for i in range(count):
+            v1, v2 = verts[i], verts[(i + 1) % count]
+            ex: float = v2.x - v1.x
+            ey: float = v2.y - v1.y
+            length: float = math.sqrt(ex * ex + ey * ey)
+            if length == 0:
+                continue
+
+            d: float = (ey * (cx - v1.x) - ex * (cy - v1.y)) / length
+
+            if d > circle_rad:
                 return
 
-            if s > separation:
-                separation = s
-                face_normal = i
+            if d > separation:
+                separation, face, nx, ny = d, i, ey / length, -ex / length
 
         if separation <= 0:
-            norm = _Engine._get_normal(verts, face_normal).rotate(poly_rot)
-            return Manifold(circle, polygon, circle_rad, norm)
-
-        v1, v2 = verts[face_normal], verts[(face_normal + 1) % len(verts)]
+            return _Engine._circle_contact(Manifold(circle, polygon, circle_rad, Vector(nx, ny).rotate(poly_rot)))
 
-        dot_1 = (center - v1).dot(v2 - v1)
-        dot_2 = (center - v2).dot(v1 - v2)
+        v1, v2 = verts[face], verts[(face + 1) % count]
         pen = circle_rad - separation
 
-        if dot_1 <= 0:
-            offs = center - v1
-            if offs.mag_sq > circle_rad * circle_rad:
-                return
-
-            return Manifold(circle, polygon, pen, offs.rotate(poly_rot).normalized())
-        elif dot_2 <= 0:
-            offs = center - v2
-            if offs.mag_sq > circle_rad * circle_rad:
-                return
-
-            return Manifold(circle, polygon, pen, offs.rotate(poly_rot).normalized())
+        if (cx - v1.x) * (v2.x - v1.x) + (cy - v1.y) * (v2.y - v1.y) <= 0:
+            corner = v1
+        elif (cx - v2.x) * (v1.x - v2.x) + (cy - v2.y) * (v1.y - v2.y) <= 0:
+            corner = v2
         else:
-            norm = _Engine._get_normal(verts, face_normal)
-            if norm.dot(center - v1) > circle_rad:
-                return
+            return _Engine._circle_contact(Manifold(circle, polygon, pen, Vector(nx, ny).rotate(poly_rot)))
+
+        ox: float = cx - corner.x
+        oy: float = cy - corner.y
+        if ox * ox + oy * oy > circle_rad * circle_rad:
+            return
 
-            return Manifold(circle, polygon, pen, norm.rotate(poly_rot))
+        return _Engine._circle_contact(Manifold(circle, polygon, pen, Vector(ox, oy).rotate(poly_rot).normalized()))
 
     @staticmethod
     def _polygon_polygon_test(shape_a: Polygon | Rectangle, shape_b: Polygon | Rectangle) -> Optional[Manifold]:
         """Checks for overlap between two polygons"""
-        a_verts = shape_a.offset_verts()
-        b_verts = shape_b.offset_verts()
-
-        pen_a, face_a = _Engine._axis_least_penetration(shape_a, shape_b, a_verts, b_verts)
-        if pen_a is None or face_a is None:
+        pen_a, face_a = _Engine._axis_least_penetration(shape_a, shape_b)
+        if face_a < 0:
             return
 
-        pen_b, face_b = _Engine._axis_least_penetration(shape_b, shape_a, b_verts, a_verts)
-        if pen_b is None or face_b is None:
+        pen_b, face_b = _Engine._axis_least_penetration(shape_b, shape_a)
+        if face_b < 0:
             return
 
+        # the normal is perpendicular to the side of least penetration and points from shape_b to shape_a
         if pen_b < pen_a:
-            man = Manifold(shape_a, shape_b, abs(pen_a))
-            rot = shape_a.gameobj.true_rotation()
-            pos = shape_a.gameobj.true_pos()
-
-            v1 = a_verts[face_a].rotate(rot) + pos
-            v2 = a_verts[(face_a + 1) % len(a_verts)].rotate(rot) + pos
-
-            side_plane_normal = (v2 - v1).normalized()
-            man.normal = side_plane_normal.perpendicular() * Math.sign(pen_a)
+            ref, face, inc, sign = shape_a, face_a, shape_b, -1
         else:
-            man = Manifold(shape_a, shape_b, abs(pen_b))
-            rot = shape_b.gameobj.true_rotation()
-            pos = shape_b.gameobj.true_pos()
+            ref, face, inc, sign = shape_b, face_b, shape_a, 1
 
-            v1 = b_verts[face_b].rotate(rot) + pos
-            v2 = b_verts[(face_b + 1) % len(b_verts)].rotate(rot) + pos
+        ref_verts = _Engine._world_verts(ref)
+        (x1, y1), (x2, y2) = ref_verts[face], ref_verts[(face + 1) % len(ref_verts)]
+        length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        normal = Vector((y2 - y1) / length * sign, (x1 - x2) / length * sign)
 
-            side_plane_normal = (v2 - v1).normalized()
-            man.normal = side_plane_normal.perpendicular() * -Math.sign(pen_b)
-
-        return man
+        contacts = _Engine._clip_contacts(ref_verts, face, _Engine._world_verts(inc))
+        return Manifold(shape_a, shape_b, abs(pen_a if sign < 0 else pen_b), normal, contacts)
 
     @staticmethod
-    def _axis_least_penetration(
-        a: Polygon | Rectangle, b: Polygon | Rectangle, a_verts: list[Vector], b_verts: list[Vector]
-    ) -> tuple[float, int] | tuple[None, None]:
-        """Finds the axis of least penetration between two possibly colliding polygons."""
-        best_dist = -Math.INF
-        best_ind = 0
-        a_rot = a.gameobj.true_rotation()
-        b_rot = b.gameobj.true_rotation()
-
-        for i in range(len(a_verts)):
-            n = _Engine._get_normal(a_verts, i).rotate(a_rot).rotate(-b_rot)
-            s = _Engine._get_support(b_verts, -n)
-            v = (a_verts[i].rotate(a_rot) + a.gameobj.true_pos() - b.gameobj.true_pos()).rotate(-b_rot)
-            d = n.dot(s - v)
+    def _axis_least_penetration(a: Polygon | Rectangle, b: Polygon | Rectangle) -> tuple[float, int]:
+        """
+        Finds the side of polygon a along which polygon b penetrates the least, working in world coordinates.
+
+        Returns:
+            The (negative) distance of b past that side and its index, or an index of -1 if the polygons are apart.
+        """
+        a_verts, b_verts = a.offset_verts(), b.offset_verts()
+        count = len(a_verts)
+
+        a_pos, b_pos = a.gameobj.true_pos(), b.gameobj.true_pos()
+        rad = math.radians(-a.gameobj.true_rotation())
+        ac: float = math.cos(rad)
+        a_s: float = math.sin(rad)
+        rad = math.radians(-b.gameobj.true_rotation())
+        bc: float = math.cos(rad)
+        b_s: float = math.sin(rad)
+
+        best_dist: float = -Math.INF
+        best_ind: int = 0
+
+        for i in range(count):
+            v1, v2 = a_verts[i], a_verts[(i + 1) % count]
+
+            # the outward normal of the side, in world coordinates
+            ex: float = v2.x - v1.x
+            ey: float = v2.y - v1.y
+            wx: float = ex * ac - ey * a_s
+            wy: float = ex * a_s + ey * ac
+            length: float = math.sqrt(wx * wx + wy * wy)
+            if length == 0:
+                continue
+            nx: float = wy / length
+            ny: float = -wx / length
+
+            # the vertex of b furthest behind the side
+            support: float = Math.INF
+            for v in b_verts:
+                proj: float = nx * (v.x * bc - v.y * b_s + b_pos.x) + ny * (v.x * b_s + v.y * bc + b_pos.y)
+                if proj < support:
+                    support = proj
+
+            d: float = support - nx * (v1.x * ac - v1.y * a_s + a_pos.x) - ny * (v1.x * a_s + v1.y * ac + a_pos.y)
 
             if d > best_dist:
                 best_dist = d
                 best_ind = i
                 if d >= 0:
-                    return None, None
+                    return 0, -1
 
         return best_dist, best_ind
 
     @staticmethod
-    def _get_support(verts: list[Vector], direction: Vector) -> Vector | None:
-        """Gets the furthest support vertex in a given direction."""
-        best_proj = -Math.INF
-        best_vert = None
+    def _circle_contact(col: Manifold) -> Manifold:
+        """Adds the contact point to a collision between a circle (shape_a) and a polygon."""
+        circle: Circle = col.shape_a  # type: ignore
+        col.contacts = [circle.true_pos() - col.normal * (circle.true_radius() - col.penetration / 2)]
+        return col
+
+    @staticmethod
+    def _world_verts(shape: Polygon | Rectangle) -> list[tuple[float, float]]:
+        """Finds the vertices of a polygon in world coordinates, as pairs of floats."""
+        pos = shape.gameobj.true_pos()
+        rad = math.radians(-shape.gameobj.true_rotation())
+        c, s = math.cos(rad), math.sin(rad)
+        return [(v.x * c - v.y * s + pos.x, v.x * s + v.y * c + pos.y) for v in shape.offset_verts()]
 
-        for v in verts:
-            projection = v.dot(direction)
+    @staticmethod
+    def _clip_contacts(ref: list[tuple[float, float]], face: int, inc: list[tuple[float, float]]) -> list[Vector]:
+        """
+        Finds where two overlapping polygons touch, by clipping the side of the incident polygon that faces the
+        reference side against that side.
 
-            if projection > best_proj:
-                best_vert = v
-                best_proj = projection
+        Args:
+            ref: The vertices of the reference polygon, in world coordinates.
+            face: The index of the reference side.
+            inc: The vertices of the incident polygon, in world coordinates.
 
-        return best_vert
+        Returns:
+            Up to two contact points.
+        """
+        (x1, y1), (x2, y2) = ref[face], ref[(face + 1) % len(ref)]
+        length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        tx: float = (x2 - x1) / length
+        ty: float = (y2 - y1) / length
+        nx: float = ty
+        ny: float = -tx
+        cx, cy = _Engine._center(ref)
+        if nx * (x1 - cx) + ny * (y1 - cy) < 0:  # point the normal out of the reference polygon
+            nx, ny = -nx, -ny
+
+        # the incident side is the one whose normal is the most opposite to the reference normal
+        best: float = Math.INF
+        inc_face: int = 0
+        count = len(inc)
+        cx, cy = _Engine._center(inc)
+        for i in range(count):
+            (ax, ay), (bx, by) = inc[i], inc[(i + 1) % count]
+            sx: float = by - ay
+            sy: float = ax - bx
+            length = math.sqrt(sx * sx + sy * sy)
+            if length == 0:
+                continue
+            d: float = (sx * nx + sy * ny) / length
+            if sx * (ax - cx) + sy * (ay - cy) < 0:
+                d = -d
+            if d < best:
+                best, inc_face = d, i
+
+        points = [inc[inc_face], inc[(inc_face + 1) % count]]
+        points = _Engine._clip(points, -tx, -ty, -(tx * x1 + ty * y1))
+        points = _Engine._clip(points, tx, ty, tx * x2 + ty * y2)
+
+        return [Vector(px, py) for px, py in points if nx * (px - x1) + ny * (py - y1) <= 0]
 
     @staticmethod
-    def _get_normal(verts: list[Vector], index: int) -> Vector:
-        """Finds a vector perpendicular to a side"""
-        face = (verts[(index + 1) % len(verts)] - verts[index]).perpendicular()
-        face.magnitude = 1
-        return face
+    def _clip(points: list[tuple[float, float]], nx: float, ny: float, offset: float) -> list[tuple[float, float]]:
+        """Clips a segment to the side of a line where (nx, ny).dot(p) <= offset."""
+        if len(points) < 2:
+            return points
+        (ax, ay), (bx, by) = points
+        d1: float = nx * ax + ny * ay - offset
+        d2: float = nx * bx + ny * by - offset
+        out = [p for p, d in ((points[0], d1), (points[1], d2)) if d <= 0]
+        if d1 * d2 < 0:
+            t = d1 / (d1 - d2)
+            out.append((ax + (bx - ax) * t, ay + (by - ay) * t))
+        return out
 
+    @staticmethod
+    def _center(verts: list[tuple[float, float]]) -> tuple[float, float]:
+        """Finds the average of a list of vertices."""
+        return sum(v[0] for v in verts) / len(verts), sum(v[1] for v in verts) / len(verts)
 
 class Manifold:
     """
@@ -345,6 +567,7 @@ class Manifold:
         shape_b: The second shape involved in the collision (the incident shape).
         penetration: The amount of penetration between the two shapes.
         normal: The normal of the collision.
+        contacts: The points where the shapes touch. Defaults to [].
     """
 
     def __init__(
@@ -353,6 +576,7 @@ def __init__(
         shape_b: Hitbox,
         penetration: float = 0,
         normal: Vector = Vector(),
+        contacts: list[Vector] | None = None,
     ):
         self.shape_a: Hitbox = shape_a
         """The reference shape."""
@@ -362,11 +586,13 @@ def __init__(
         """The amount by which the colliders are intersecting."""
         self.normal: Vector = normal
         """The direction that would most quickly separate the two colliders."""
+        self.contacts: list[Vector] = contacts if contacts is not None else []
+        """The points where the colliders touch, in world coordinates. There are at most two."""
 
     def __repr__(self) -> str:
         return (
             f"Manifold(shape_a={self.shape_a}, shape_b={self.shape_b}, penetration={self.penetration}, "
-            f"normal={self.normal})"
+            f"normal={self.normal}, contacts={self.contacts})"
         )
 
     def _flip(self) -> Manifold:
@@ -376,4 +602,126 @@ def _flip(self) -> Manifold:
         Returns:
             The new manifold
         """
-        return Manifold(self.shape_b, self.shape_a, self.penetration, -self.normal)
+        return Manifold(self.shape_b, self.shape_a, self.penetration, -self.normal, self.contacts)
+
+
+class _Contact:
+    """A collision between two rigidbodies, as seen by the impulse solver."""
+
+    slop: float = 0.01
+    """How much penetration is tolerated before the solver pushes the shapes apart."""
+    bias: float = 0.1
+    """The fraction of the penetration the solver removes each step through the velocity of the rigidbodies."""
+    settle: float = 1e-3
+    """The change in relative velocity under which a contact is considered solved."""
+
+    def __init__(self, col: Manifold, rb_a: RigidBody | None, rb_b: RigidBody | None):
+        self.col: Manifold = col
+        self.rb_a: RigidBody | None = rb_a
+        self.rb_b: RigidBody | None = rb_b
+
+        # calculate restitution
+        self.e: float = max(rb_a.bounciness if rb_a else 0, rb_b.bounciness if rb_b else 0)
+
+        # calculate friction coefficient
+        if not rb_a:
+            self.mu: float = rb_b.friction * rb_b.friction  # type: ignore
+        elif not rb_b:
+            self.mu: float = rb_a.friction * rb_a.friction
+        else:
+            self.mu: float = (rb_a.friction * rb_a.friction + rb_b.friction * rb_b.friction) / 2
+
+        # find inverse masses
+        inv_mass_a: float = rb_a.inv_mass if rb_a else 0
+        inv_mass_b: float = rb_b.inv_mass if rb_b else 0
+
+        # handle infinite mass cases
+        if inv_mass_a == inv_mass_b == 0:
+            if not rb_a:
+                inv_mass_b = 1
+            elif not rb_b:
+                inv_mass_a = 1
+            else:
+                inv_mass_a, inv_mass_b = 1, 1
+
+        # only the rigidbodies that can move take part in the resolution
+        self.inv_mass_a: float = inv_mass_a if rb_a and not rb_a.static else 0
+        self.inv_mass_b: float = inv_mass_b if rb_b and not rb_b.static else 0
+        total = self.inv_mass_a + self.inv_mass_b
+        self.mass: float = 1 / total if total else 0
+
+        # the normal points from shape_a to shape_b and the tangent is perpendicular to it
+        self.nx: float = -col.normal.x
+        self.ny: float = -col.normal.y
+        self.tx: float = -self.ny
+        self.ty: float = self.nx
+
+        self.jn: float = 0
+        """The accumulated normal impulse."""
+        self.jt: float = 0
+        """The accumulated friction impulse."""
+        self.target: float = 0
+        """The normal velocity the solver aims for: the bounce, or enough to start separating the shapes."""
+
+    def _rel_vel(self) -> tuple[float, float]:
+        """The velocity of rigidbody b relative to rigidbody a."""
+        vx, vy = 0.0, 0.0
+        if self.rb_b:
+            vx, vy = self.rb_b.velocity.x, self.rb_b.velocity.y
+        if self.rb_a:
+            vx, vy = vx - self.rb_a.velocity.x, vy - self.rb_a.velocity.y
+        return vx, vy
+
+    def _apply(self, px: float, py: float):
+        """Applies an impulse to rigidbody b and the opposite impulse to rigidbody a."""
+        if self.inv_mass_a:
+            self.rb_a.velocity.x -= px * self.inv_mass_a  # type: ignore
+            self.rb_a.velocity.y -= py * self.inv_mass_a  # type: ignore
+        if self.inv_mass_b:
+            self.rb_b.velocity.x += px * self.inv_mass_b  # type: ignore
+            self.rb_b.velocity.y += py * self.inv_mass_b  # type: ignore
+
+    def prepare(self, impulses: tuple[float, float] | None):
+        """Computes the target velocity and applies the impulses of the previous step (warm start)."""
+        vx, vy = self._rel_vel()
+        contact_vel = vx * self.nx + vy * self.ny
+        self.target = -self.e * contact_vel if contact_vel < 0 else 0
+        self.target = max(self.target, self.bias * max(self.col.penetration - self.slop, 0) / Time.fixed_delta)
+
+        if impulses is not None:
+            self.jn, self.jt = impulses
+            self._apply(self.nx * self.jn + self.tx * self.jt, self.ny * self.jn + self.ty * self.jt)
+
+    def solve(self) -> float:
+        """
+        Applies the impulses that bring the relative velocity closest to the target.
+
+        Returns:
+            How much the relative velocity changed.
+        """
+        # normal impulse, which can only push
+        vx, vy = self._rel_vel()
+        dj = (self.target - (vx * self.nx + vy * self.ny)) * self.mass
+        jn = max(self.jn + dj, 0)
+        dj, self.jn = jn - self.jn, jn
+        self._apply(self.nx * dj, self.ny * dj)
+
+        # friction impulse, bounded by the normal impulse
+        vx, vy = self._rel_vel()
+        dt = -(vx * self.tx + vy * self.ty) * self.mass
+        limit = self.mu * self.jn
+        jt = min(max(self.jt + dt, -limit), limit)
+        dt, self.jt = jt - self.jt, jt
+        self._apply(self.tx * dt, self.ty * dt)
+
+        return (abs(dj) + abs(dt)) / self.mass
+
+    def correct(self):
+        """Pushes the shapes apart to remove the penetration."""
+        col = self.col
+        correction = max(col.penetration - self.slop, 0) * Vector(self.nx, self.ny)
+
+        if self.rb_a and not self.rb_a.static:
+            col.shape_a.gameobj.pos -= correction * self.rb_a.pos_correction
+        if self.rb_b and not self.rb_b.static:
+            col.shape_b.gameobj.pos += correction * self.rb_b.pos_correction
@@ -9,6 +9,10 @@
     from . import Manifold
 
 
+def _ignore(manifold: Manifold):  # pylint: disable=unused-argument
+    """The default collision callback. The physics engine skips building manifolds for it."""
+
+
 class Hitbox(Component):
     """
     A hitbox superclass. Do not use this class to attach hitboxes to your game objects.
@@ -57,11 +61,11 @@ def __init__(
         self.should_collide: Callable[[Hitbox, Hitbox],
                                       bool] = should_collide if should_collide else lambda self, other: True
         """The should_collide function to call to determine whether two hitboxes should collide."""
-        self.on_collide: Callable[[Manifold], None] = on_collide if on_collide else lambda manifold: None
+        self.on_collide: Callable[[Manifold], None] = on_collide if on_collide else _ignore
         """The on_collide function to call when a collision happens with this hitbox."""
-        self.on_enter: Callable[[Manifold], None] = on_enter if on_enter else lambda manifold: None
+        self.on_enter: Callable[[Manifold], None] = on_enter if on_enter else _ignore
         """The on_enter function to call when collision begins with this hitbox."""
-        self.on_exit: Callable[[Manifold], None] = on_exit if on_exit else lambda manifold: None
+        self.on_exit: Callable[[Manifold], None] = on_exit if on_exit else _ignore
         """The on_exit function to call when a collision ends with this hitbox."""
         self.singular: bool = False
         """Whether this hitbox is singular or not."""
@@ -71,8 +75,8 @@ def __init__(
         """An unordered set of hitboxes that the Hitbox is currently colliding with."""
         self.color: Color | None = color
         """The color of the hitbox."""
-        self._image: Surface = Surface()
-        self._debug_image: Surface = Surface()
+        self._image: Surface | None = None
+        self._debug_image: Surface | None = None
         self.uptodate: bool = False
         """Whether the hitbox image is up to date or not."""
         self._old_rot_offset: float = self.rot_offset
@@ -102,8 +106,29 @@ def redraw(self):
         """
         Regenerates the image of the hitbox.
         """
-        self._image.clear()
-        self._debug_image.clear()
+        if self._image is not None:
+            self._image.clear()
+        if self._debug_image is not None:
+            self._debug_image.clear()
+
+    def _fit_images(self, width: int, height: int):
+        """
+        Makes sure the images that are shown have the given size and are clear, and drops the ones that are not.
+        The hitbox image only exists while the hitbox has a color and the debug image only while debug is on.
+        """
+        if self.color is None:
+            self._image = None
+        elif self._image is None or self._image.width != width or self._image.height != height:
+            self._image = Surface(width, height)
+        else:
+            self._image.clear()
+
+        if not (self.debug or Game.debug):
+            self._debug_image = None
+        elif self._debug_image is None or self._debug_image.width != width or self._debug_image.height != height:
+            self._debug_image = Surface(width, height)
+        else:
+            self._debug_image.clear()
 
     def get_aabb(self) -> tuple[Vector, Vector]:
         """
@@ -135,12 +160,16 @@ def update(self):
             self._old_scale = self.scale
 
     def draw(self, camera: Camera):
-        if self.color:
+        debug = self.debug or Game.debug
+        if (self.color and self._image is None) or (debug and self._debug_image is None):
+            self.redraw()
+
+        if self.color and self._image is not None:
             self._image.rotation = self.true_rotation()
 
             Draw.queue_surface(self._image, self.true_pos(), self.true_z(), camera)
 
-        if self.debug or Game.debug:
+        if debug and self._debug_image is not None:
             self._debug_image.rotation = self.true_rotation()
 
             Draw.queue_surface(self._debug_image, self.true_pos(), Math.INF, camera=camera)
@@ -241,11 +270,11 @@ def get_aabb(self) -> tuple[Vector, Vector]:
         for vert in verts:
             if vert.y > top:
                 top = vert.y
-            elif vert.y < bottom:
+            if vert.y < bottom:
                 bottom = vert.y
             if vert.x > right:
                 right = vert.x
-            elif vert.x < left:
+            if vert.x < left:
                 left = vert.x
 
         return Vector(left, bottom), Vector(right, top)
@@ -264,17 +293,12 @@ def regen(self):
         self._offset_verts = [(vert * self.scale).rotate(self.rot_offset) + self.offset for vert in self.verts]
 
     def redraw(self):
-        super().redraw()
-
-        w = round(self.radius * self.scale.x * 2)
-        h = round(self.radius * self.scale.y * 2)
-        if w != self._image.width or h != self._image.height:
-            self._image = Surface(w, h)
-            self._debug_image = Surface(w, h)
+        self._fit_images(round(self.radius * self.scale.x * 2), round(self.radius * self.scale.y * 2))
 
-        if self.color is not None:
+        if self._image is not None:
             self._image.draw_poly(self.verts, (0, 0), fill=self.color, aa=True, blending=False)
-        self._debug_image.draw_poly(self.verts, (0, 0), Color.debug, 2, blending=False)
+        if self._debug_image is not None:
+            self._debug_image.draw_poly(self.verts, (0, 0), Color.debug, 2, blending=False)
 
     def contains_pt(self, pt: Vector | tuple[float, float]) -> bool:
         return Input.pt_in_poly(pt, self.true_verts())
@@ -508,11 +532,11 @@ def get_aabb(self) -> tuple[Vector, Vector]:
         for vert in verts:
             if vert.y > top:
                 top = vert.y
-            elif vert.y < bottom:
+            if vert.y < bottom:
                 bottom = vert.y
             if vert.x > right:
                 right = vert.x
-            elif vert.x < left:
+            if vert.x < left:
                 left = vert.x
 
         return Vector(left, bottom), Vector(right, top)
@@ -534,17 +558,14 @@ def regen(self):
         self._offset_verts = [(vert * self.scale).rotate(self.rot_offset) + self.offset for vert in self._verts]
 
     def redraw(self):
-        self._debug_image.clear()
-
         w = round(self.width * self.scale.x)
         h = round(self.height * self.scale.y)
-        if w != self._image.width or h != self._image.height:
-            self._image = Surface(w, h)
-            self._debug_image = Surface(w, h)
+        self._fit_images(w, h)
 
-        if self.color is not None:
-            self._image.fill(self.color)
-        self._debug_image.draw_rect((0, 0), (w, h), Color.debug, 2, blending=False)
+        if self._image is not None:
+            self._image.fill(self.color)  # type: ignore
+        if self._debug_image is not None:
+            self._debug_image.draw_rect((0, 0), (w, h), Color.debug, 2, blending=False)
 
     def contains_pt(self, pt: Vector | tuple[float, float]) -> bool:
         return Input.pt_in_poly(pt, self.true_verts())
@@ -651,18 +672,14 @@ def true_radius(self) -> int | float:
         return self.radius * self.scale.max()
 
     def redraw(self):
-        super().redraw()
-
         int_r = round(self.radius * self.scale.max())
         size = int_r * 2 + 1
+        self._fit_images(size, size)
 
-        if size != self._image.width:
-            self._image = Surface(size, size)
-            self._debug_image = Surface(size, size)
-
-        if self.color is not None:
+        if self._image is not None:
             self._image.draw_circle((0, 0), int_r, fill=self.color, aa=True, blending=False)
-        self._debug_image.draw_circle((0, 0), int_r, Color.debug, 2, blending=False)
+        if self._debug_image is not None:
+            self._debug_image.draw_circle((0, 0), int_r, Color.debug, 2, blending=False)
 
     def contains_pt(self, pt: Vector | tuple[float, float]) -> bool:
         r = self.true_radius()
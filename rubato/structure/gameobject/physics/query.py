@@ -0,0 +1,423 @@
+"""
+Spatial queries (raycasts, shape casts, point and AABB queries) against the hitboxes of a scene.
+"""
+from __future__ import annotations
+from typing import Callable, Optional
+import math
+
+from . import Hitbox, Circle, Polygon, Rectangle, _Engine
+from .... import Math, Vector
+
+
+class RaycastHit:
+    """
+    A class that represents the result of a raycast or a shape cast.
+
+    Args:
+        hitbox: The hitbox that was hit.
+        point: The point where the hit happened.
+        normal: The normal of the surface that was hit.
+        distance: How far along the cast the hit happened.
+    """
+
+    def __init__(self, hitbox: Hitbox, point: Vector, normal: Vector, distance: float):
+        self.hitbox: Hitbox = hitbox
+        """The hitbox that was hit."""
+        self.point: Vector = point
+        """
+        The point where the hit happened. For shape casts, this is the position of the shape when it hits.
+        """
+        self.normal: Vector = normal
+        """The unit normal of the surface that was hit, pointing back towards the cast."""
+        self.distance: float = distance
+        """How far along the cast the hit happened."""
+
+    def __repr__(self) -> str:
+        return f"RaycastHit(hitbox={self.hitbox}, point={self.point}, normal={self.normal}, distance={self.distance})"
+
+
+class _SpatialHash:
+    """
+    A uniform grid over the hitboxes of a scene, built from their AABBs at the time of creation.
+    Hitboxes that cover too many cells are kept in a separate list and are tested by every query.
+    """
+
+    max_cells: int = 64
+    """The number of cells a hitbox can cover before it is considered large."""
+    bisections: int = 16
+    """The number of bisection steps used to refine the time of impact of a shape cast."""
+
+    def __init__(self, hitboxes: list[Hitbox]):
+        self.cells: dict[tuple[int, int], list[Hitbox]] = {}
+        self.large: list[Hitbox] = []
+        self.aabbs: dict[Hitbox, tuple[float, float, float, float]] = {}
+
+        sizes = []
+        for hb in hitboxes:
+            bl, tr = hb.get_aabb()
+            self.aabbs[hb] = (bl.x, bl.y, tr.x, tr.y)
+            sizes.append(max(tr.x - bl.x, tr.y - bl.y))
+
+        sizes.sort()
+        # twice the median size keeps most hitboxes in one to four cells, even if a few huge ones exist
+        self.cell_size: float = max(2 * sizes[len(sizes) // 2], 1) if sizes else 1
+
+        self.left, self.bottom, self.right, self.top = Math.INF, Math.INF, -Math.INF, -Math.INF
+        for hb in self.aabbs:
+            self._insert(hb)
+
+    def _cells(self, hb: Hitbox) -> tuple[int, int, int, int]:
+        """Gets the first and last columns and rows of the cells the AABB of a hitbox covers."""
+        l, b, r, t = self.aabbs[hb]
+        cs = self.cell_size
+        return math.floor(l / cs), math.floor(b / cs), math.floor(r / cs), math.floor(t / cs)
+
+    def _insert(self, hb: Hitbox):
+        """Adds a hitbox to the cells its AABB covers."""
+        x0, y0, x1, y1 = self._cells(hb)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+            self.large.append(hb)
+            return
+
+        l, b, r, t = self.aabbs[hb]
+        self.left, self.bottom = min(self.left, l), min(self.bottom, b)
+        self.right, self.top = max(self.right, r), max(self.top, t)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                if (x, y) in self.cells:
+                    self.cells[(x, y)].append(hb)
+                else:
+                    self.cells[(x, y)] = [hb]
+
+    def _remove(self, hb: Hitbox):
+        """Removes a hitbox from the cells its AABB covers."""
+        x0, y0, x1, y1 = self._cells(hb)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+            self.large.remove(hb)
+            return
+
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cell = self.cells[(x, y)]
+                cell.remove(hb)
+                if not cell:
+                    del self.cells[(x, y)]
+
+    def move(self, hb: Hitbox):
+        """
+        Moves a hitbox of the grid to its current AABB. The bounds of the grid only ever grow, so they may be larger
+        than the hitboxes in it.
+        """
+        if hb not in self.aabbs:
+            return
+        self._remove(hb)
+        bl, tr = hb.get_aabb()
+        self.aabbs[hb] = (bl.x, bl.y, tr.x, tr.y)
+        self._insert(hb)
+
+    def query_point(self, x: float, y: float, should_hit: Optional[Callable[[Hitbox], bool]]) -> list[Hitbox]:
+        """Gets the hitboxes that contain a point."""
+        cs = self.cell_size
+        pt = Vector(x, y)
+        fin = []
+        for hb in self.cells.get((math.floor(x / cs), math.floor(y / cs)), []) + self.large:
+            l, b, r, t = self.aabbs[hb]
+            if l <= x <= r and b <= y <= t and (should_hit is None or should_hit(hb)) and hb.contains_pt(pt):
+                fin.append(hb)
+        return fin
+
+    def query_aabb(
+        self, l: float, b: float, r: float, t: float, should_hit: Optional[Callable[[Hitbox], bool]]
+    ) -> list[Hitbox]:
+        """Gets the hitboxes whose AABBs overlap an AABB."""
+        cs = self.cell_size
+        x0, y0, x1, y1 = math.floor(l / cs), math.floor(b / cs), math.floor(r / cs), math.floor(t / cs)
+
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.cells):
+            candidates = self.aabbs.keys()
+        else:
+            found: dict[Hitbox, None] = {}
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    if (x, y) in self.cells:
+                        found.update(dict.fromkeys(self.cells[(x, y)]))
+            found.update(dict.fromkeys(self.large))
+            candidates = found.keys()
+
+        fin = []
+        for hb in candidates:
+            hl, hbt, hr, htp = self.aabbs[hb]
+            if hl <= r and hr >= l and hbt <= t and htp >= b and (should_hit is None or should_hit(hb)):
+                fin.append(hb)
+        return fin
+
+    def raycast(
+        self,
+        ox: float,
+        oy: float,
+        dx: float,
+        dy: float,
+        max_dist: float,
+        should_hit: Optional[Callable[[Hitbox], bool]],
+    ) -> Optional[RaycastHit]:
+        """Finds the closest hit along a ray. The direction must be a unit vector."""
+        best_t, best_nx, best_ny = Math.INF, 0.0, 0.0
+        best_hb: Optional[Hitbox] = None
+
+        for hb in self.large:
+            if should_hit is None or should_hit(hb):
+                hit = _SpatialHash._ray_hitbox(hb, ox, oy, dx, dy)
+                if hit is not None and hit[0] <= max_dist and hit[0] < best_t:
+                    best_t, best_nx, best_ny = hit
+                    best_hb = hb
+
+        # clip the ray to the bounds of the grid
+        t0, t1 = 0.0, max_dist
+        for o, d, lo, hi in ((ox, dx, self.left, self.right), (oy, dy, self.bottom, self.top)):
+            if d == 0:
+                if o < lo or o > hi:
+                    t1 = -1
+            else:
+                ta, tb = (lo - o) / d, (hi - o) / d
+                if ta > tb:
+                    ta, tb = tb, ta
+                t0, t1 = max(t0, ta), min(t1, tb)
+
+        if self.cells and t0 <= t1:
+            # walk the cells along the ray (Amanatides and Woo)
+            cs = self.cell_size
+            px, py = ox + dx * t0, oy + dy * t0
+            cx, cy = math.floor(px / cs), math.floor(py / cs)
+            step_x, step_y = (1 if dx > 0 else -1), (1 if dy > 0 else -1)
+            delta_x = cs / abs(dx) if dx else Math.INF
+            delta_y = cs / abs(dy) if dy else Math.INF
+            if dx > 0:
+                next_x = t0 + ((cx + 1) * cs - px) / dx
+            elif dx < 0:
+                next_x = t0 + (cx * cs - px) / dx
+            else:
+                next_x = Math.INF
+            if dy > 0:
+                next_y = t0 + ((cy + 1) * cs - py) / dy
+            elif dy < 0:
+                next_y = t0 + (cy * cs - py) / dy
+            else:
+                next_y = Math.INF
+
+            seen: set[Hitbox] = set()
+            while True:
+                for hb in self.cells.get((cx, cy), ()):
+                    if hb in seen:
+                        continue
+                    seen.add(hb)
+                    if should_hit is None or should_hit(hb):
+                        hit = _SpatialHash._ray_hitbox(hb, ox, oy, dx, dy)
+                        if hit is not None and hit[0] <= max_dist and hit[0] < best_t:
+                            best_t, best_nx, best_ny = hit
+                            best_hb = hb
+
+                exit_t = min(next_x, next_y)
+                if exit_t > t1 or best_t <= exit_t:
+                    break
+                if next_x < next_y:
+                    cx += step_x
+                    next_x += delta_x
+                else:
+                    cy += step_y
+                    next_y += delta_y
+
+        if best_hb is None:
+            return None
+        return RaycastHit(best_hb, Vector(ox + dx * best_t, oy + dy * best_t), Vector(best_nx, best_ny), best_t)
+
+    def shape_cast(
+        self,
+        shape: Hitbox,
+        dx: float,
+        dy: float,
+        distance: float,
+        should_hit: Optional[Callable[[Hitbox], bool]],
+        ignore_overlapping: bool = False,
+    ) -> Optional[RaycastHit]:
+        """
+        Finds the first hitbox a shape hits when moved along a direction. The direction must be a unit vector.
+        The shape must be the only component of a game object that can be moved freely.
+
+        Circles are swept exactly. Other shapes are sampled along the path at steps of half the smaller side of their
+        AABB, so that nothing they sweep through is skipped, and the first overlap is refined with a bisection.
+        Hitboxes that already overlap the shape are hit at a distance of 0, or skipped if ignore_overlapping is set.
+        """
+        probe = shape.gameobj
+        start = probe.pos.clone()
+        bl, tr = shape.get_aabb()
+        step = max(min(tr.x - bl.x, tr.y - bl.y) / 2, 1e-3)
+
+        l, r = min(bl.x, bl.x + dx * distance), max(tr.x, tr.x + dx * distance)
+        b, t = min(bl.y, bl.y + dy * distance), max(tr.y, tr.y + dy * distance)
+        candidates = self.query_aabb(l, b, r, t, should_hit)
+
+        def overlap(hb: Hitbox, at: float):
+            probe.pos.x, probe.pos.y = start.x + dx * at, start.y + dy * at
+            return _Engine.overlap(shape, hb)
+
+        best_at, best_normal = distance, Vector()
+        best_hb: Optional[Hitbox] = None
+        for hb in candidates:
+            if not isinstance(hb, Circle | Polygon | Rectangle):
+                continue
+            limit = best_at
+
+            if (col := overlap(hb, 0)) is not None:
+                if not ignore_overlapping:
+                    best_at, best_normal, best_hb = 0, col.normal.normalized(), hb
+                continue
+
+            if isinstance(shape, Circle):
+                probe.pos.x, probe.pos.y = start.x, start.y
+                hit = _SpatialHash._sweep_circle(shape, hb, dx, dy)
+                if hit is not None and hit[0] <= limit:
+                    best_at, best_normal, best_hb = hit[0], Vector(hit[1], hit[2]), hb
+                continue
+
+            prev, at = 0.0, min(step, limit)
+            while True:
+                if (col := overlap(hb, at)) is not None:
+                    lo, hi = prev, at
+                    for _ in range(self.bisections):
+                        mid = (lo + hi) / 2
+                        if (mid_col := overlap(hb, mid)) is not None:
+                            hi, col = mid, mid_col
+                        else:
+                            lo = mid
+                    best_at, best_normal, best_hb = hi, col.normal.normalized(), hb
+                    break
+                if at >= limit:
+                    break
+                prev, at = at, min(at + step, limit)
+
+        probe.pos = start
+        if best_hb is None:
+            return None
+        return RaycastHit(best_hb, Vector(start.x + dx * best_at, start.y + dy * best_at), best_normal, best_at)
+
+    @staticmethod
+    def _sweep_circle(circle: Circle, target: Hitbox, dx: float, dy: float) -> Optional[tuple]:
+        """
+        Finds when a moving circle first touches a hitbox it does not overlap yet, by casting its center against the
+        hitbox grown by the radius of the circle. Returns the distance and the normal of the hit, if any.
+        """
+        center = circle.true_pos()
+        ox, oy, radius = center.x, center.y, circle.true_radius()
+
+        if isinstance(target, Circle):
+            other = target.true_pos()
+            return _SpatialHash._ray_disc(other.x, other.y, radius + target.true_radius(), ox, oy, dx, dy)
+
+        verts = target.true_verts()  # type: ignore
+        n = len(verts)
+        cx, cy = sum(v.x for v in verts) / n, sum(v.y for v in verts) / n
+        best_t, best_nx, best_ny = Math.INF, 0.0, 0.0
+
+        for i in range(n):
+            a, b = verts[i], verts[(i + 1) % n]
+            # the rounded corners of the grown polygon
+            hit = _SpatialHash._ray_disc(a.x, a.y, radius, ox, oy, dx, dy)
+            if hit is not None and hit[0] < best_t:
+                best_t, best_nx, best_ny = hit
+
+            # the sides of the grown polygon
+            ex, ey = b.x - a.x, b.y - a.y
+            length = math.sqrt(ex * ex + ey * ey)
+            if length == 0:
+                continue
+            nx, ny = ey / length, -ex / length
+            if nx * (cx - a.x) + ny * (cy - a.y) > 0:
+                nx, ny = -nx, -ny
+            denom = nx * dx + ny * dy
+            if denom >= 0:
+                continue
+            t = (nx * (a.x + nx * radius - ox) + ny * (a.y + ny * radius - oy)) / denom
+            if t < 0:
+                continue
+            along = ((ox + dx * t - a.x) * ex + (oy + dy * t - a.y) * ey) / (length * length)
+            if 0 <= along <= 1 and t < best_t:
+                best_t, best_nx, best_ny = t, nx, ny
+
+        return (best_t, best_nx, best_ny) if best_t < Math.INF else None
+
+    @staticmethod
+    def _ray_hitbox(hb: Hitbox, ox: float, oy: float, dx: float, dy: float) -> Optional[tuple]:
+        """Intersects a ray with a hitbox. Returns the distance and the normal of the hit, if any."""
+        if isinstance(hb, Circle):
+            return _SpatialHash._ray_circle(hb, ox, oy, dx, dy)
+        if isinstance(hb, Polygon | Rectangle):
+            return _SpatialHash._ray_polygon(hb, ox, oy, dx, dy)
+        return None
+
+    @staticmethod
+    def _ray_circle(circle: Circle, ox: float, oy: float, dx: float, dy: float) -> Optional[tuple]:
+        """Intersects a ray with a circle."""
+        center = circle.true_pos()
+        return _SpatialHash._ray_disc(center.x, center.y, circle.true_radius(), ox, oy, dx, dy)
+
+    @staticmethod
+    def _ray_disc(x: float, y: float, radius: float, ox: float, oy: float, dx: float, dy: float) -> Optional[tuple]:
+        """Intersects a ray with a disc."""
+        if radius <= 0:
+            return None
+        mx, my = ox - x, oy - y
+        b = mx * dx + my * dy
+        c = mx * mx + my * my - radius * radius
+        if c <= 0:  # the ray starts inside the disc
+            return 0, -dx, -dy
+        if b > 0:
+            return None
+        disc = b * b - c
+        if disc < 0:
+            return None
+        t = -b - math.sqrt(disc)
+        return t, (mx + dx * t) / radius, (my + dy * t) / radius
+
+    @staticmethod
+    def _ray_polygon(polygon: Polygon | Rectangle, ox: float, oy: float, dx: float, dy: float) -> Optional[tuple]:
+        """Intersects a ray with a convex polygon (Cyrus-Beck clipping)."""
+        verts = polygon.true_verts()
+        n = len(verts)
+        if n < 3:
+            return None
+        cx, cy = sum(v.x for v in verts) / n, sum(v.y for v in verts) / n
+
+        t_enter, t_exit = -Math.INF, Math.INF
+        nx_enter, ny_enter = 0.0, 0.0
+        for i in range(n):
+            a, b = verts[i], verts[(i + 1) % n]
+            nx, ny = b.y - a.y, a.x - b.x
+            length = math.sqrt(nx * nx + ny * ny)
+            if length == 0:
+                continue
+            nx, ny = nx / length, ny / length
+            if nx * (cx - a.x) + ny * (cy - a.y) > 0:  # make the normal point outwards, whatever the winding
+                nx, ny = -nx, -ny
+
+            denom = nx * dx + ny * dy
+            num = nx * (a.x - ox) + ny * (a.y - oy)
+            if denom == 0:
+                if num < 0:
+                    return None
+                continue
+
+            t = num / denom
+            if denom < 0:
+                if t > t_enter:
+                    t_enter, nx_enter, ny_enter = t, nx, ny
+            elif t < t_exit:
+                t_exit = t
+
+            if t_enter > t_exit:
+                return None
+
+        if t_exit < 0:
+            return None
+        if t_enter < 0:  # the ray starts inside the polygon
+            return 0, -dx, -dy
+        return t_enter, nx_enter, ny_enter
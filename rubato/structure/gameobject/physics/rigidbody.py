@@ -2,10 +2,15 @@
 The Rigidbody component describes how the physics engine handles a game object.
 """
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
+from . import Hitbox
 from .. import Component
 from .... import Vector, Time, Math
 
+if TYPE_CHECKING:
+    from ... import Scene
+
 
 class RigidBody(Component):
     """
@@ -25,8 +30,13 @@ class RigidBody(Component):
         offset: The offset of the rigidbody from the gameobject. Defaults to (0, 0).
         rot_offset: The offset of the rigidbody's rotation from the gameobject. Defaults to 0.
         z_index: The z-index of the rigidbody. Defaults to 0.
+        ccd: Whether the rigidbody uses continuous collision detection. Defaults to False.
+        interpolate: Whether the gameobject is drawn between its last two physics positions. Defaults to False.
     """
 
+    _ccd_skin: float = 0.01
+    """How far past the time of impact a continuous move goes, so that the collision is always detected."""
+
     def __init__(
         self,
         mass: float = 1,
@@ -40,7 +50,9 @@ def __init__(
         pos_correction: float = 0.25,
         offset: Vector | tuple[float, float] = (0, 0),
         rot_offset: float = 0,
-        z_index: int = 0
+        z_index: int = 0,
+        ccd: bool = False,
+        interpolate: bool = False,
     ):
         super().__init__(offset=offset, rot_offset=rot_offset, z_index=z_index)
 
@@ -73,6 +85,22 @@ def __init__(
         self.bounciness: float = bounciness
         """How bouncy the rigidbody is (usually a value between 0 and 1)."""
 
+        self.ccd: bool = ccd
+        """
+        Whether the rigidbody uses continuous collision detection. If it does, its hitboxes are swept along its movement
+        every physics step and it stops where they first touch another hitbox, so it cannot pass through thin hitboxes
+        when moving fast. This is more expensive, so only enable it on fast rigidbodies.
+        """
+
+        self.interpolate: bool = interpolate
+        """
+        Whether the gameobject is drawn between its position before and after the last fixed update, according to
+        Time.fixed_alpha. This smooths the motion when the physics runs slower than the game draws, at the cost of
+        showing the gameobject up to one fixed update behind.
+        """
+        self._prev_pos: Vector | None = None
+        self._prev_rot: float = 0
+
     @property
     def mass(self) -> float:
         """The mass of the Rigidbody."""
@@ -93,8 +121,42 @@ def _tick(self):
         self.velocity += self.gravity * Time.fixed_delta
         self.velocity.clamp(-self.max_speed, self.max_speed)  # pylint: disable=invalid-unary-operand-type
 
-        self.gameobj.pos += self.velocity * Time.fixed_delta
-        self.gameobj.rotation += self.ang_vel * Time.fixed_delta
+        scene = self.gameobj._scene
+        move = self.velocity * Time.fixed_delta
+        if self.ccd and scene is not None:
+            move = self._sweep(scene, move)
+
+        # moved without the setters, which would drop the whole grid of the scene, as the grid is kept current below
+        self.gameobj._pos += move
+        self.gameobj._rotation += self.ang_vel * Time.fixed_delta
+
+        # keeps the grid of the scene current, so that the sweeps of the next bodies see this one where it is now
+        if scene is not None and scene._spatial is not None and (move.x != 0 or move.y != 0 or self.ang_vel != 0):
+            if self.gameobj._children:
+                scene._spatial = None
+            else:
+                for hb in self.gameobj.get_all(Hitbox):
+                    scene._spatial.move(hb)
+
+    def _sweep(self, scene: Scene, move: Vector) -> Vector:
+        """Shortens a move so that the hitboxes of the game object stop where they first touch another hitbox."""
+        dist = move.magnitude
+        if dist == 0:
+            return move
+        direction = move / dist
+
+        for hb in self.gameobj.get_all(Hitbox):
+            if hb.trigger:
+                continue
+
+            def should_hit(other: Hitbox, hb: Hitbox = hb) -> bool:
+                return not other.trigger and hb.should_collide(hb, other) and other.should_collide(other, hb)
+
+            hit = scene.shape_cast(hb, direction, dist, should_hit, ignore_overlapping=True)
+            if hit is not None:
+                dist = min(dist, hit.distance + self._ccd_skin)
+
+        return direction * dist
 
     def add_force(self, force: Vector | tuple[float, float]):
         """
@@ -151,8 +213,21 @@ def add_cont_impulse(self, impulse: Vector | tuple[float, float], time: float):
     def fixed_update(self):
         """The physics loop for the rigidbody component."""
         if not self.static:
+            if self.interpolate:
+                self._prev_pos = self.gameobj.pos.clone()
+                self._prev_rot = self.gameobj.rotation
             self._tick()
 
+    def _interpolated(self) -> tuple[Vector, float]:
+        """The position and rotation to draw the gameobject at."""
+        if self._prev_pos is None:
+            return self.gameobj.pos, self.gameobj.rotation
+        alpha = Time.fixed_alpha
+        return (
+            self._prev_pos.lerp(self.gameobj.pos, alpha),
+            self._prev_rot + (self.gameobj.rotation - self._prev_rot) * alpha,
+        )
+
     def stop(self):
         """Stops the rigidbody by setting velocity and ang_vel to 0."""
         self.velocity.x = 0
@@ -172,5 +247,7 @@ def clone(self) -> RigidBody:
             pos_correction=self.pos_correction,
             offset=self.offset.clone(),
             rot_offset=self.rot_offset,
-            z_index=self.z_index
+            z_index=self.z_index,
+            ccd=self.ccd,
+            interpolate=self.interpolate,
         )
@@ -1,4 +1,5 @@
 """Holds the UI-related components."""
 from .text import Text
 from .button import Button
+from .button_index import _ButtonIndex
 # from .slider import Slider # not implemented yet
@@ -10,6 +10,9 @@ class Button(Component):
     """
     A Button component. Add this to game objects or UI elements to give them clickable areas.
 
+    The buttons of a scene are checked together once per frame, before its gameobjects update. Only the topmost button
+    under the mouse is hovered or pressed, and buttons follow the camera unless their gameobject ignores it.
+
     Args:
         width: The width of the button. Defaults to 10.
         height: The height of the button. Defaults to 10.
@@ -53,7 +56,10 @@ def __init__(
         """The function to call when the mouse exits the button."""
 
     def update(self):
-        """The update function for buttons."""
+        """The update function for buttons. Buttons in a scene are updated by the scene instead."""
+        if self.gameobj._scene is not None:
+            return
+
         inside = Input.mouse_in(self.true_pos(), self.dims, self.true_rotation())
         mouse_down = Input.mouse_state()[0]
 
@@ -0,0 +1,148 @@
+"""The index a scene keeps of its buttons, to find the one under the mouse once per frame."""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import sdl2
+
+from .button import Button
+from .... import Input, Camera, Vector
+
+if TYPE_CHECKING:
+    from ... import GameObject
+
+
+class _ButtonIndex:
+    """
+    The bounds of the buttons of a scene, topmost first. Each frame, it finds the button under the mouse and calls the
+    callbacks of the buttons whose hover or press changed.
+
+    The bounds are only rebuilt when a button or one of its gameobjects moved, and the mouse is only tested against
+    them when it or the camera moved, or the bounds were rebuilt.
+    """
+
+    def __init__(self):
+        self.buttons: dict[Button, None] = {}
+        """The buttons of the scene, in the order they were added."""
+        self.layouts: list[tuple] = []
+        """The transforms the bounds were built from, one per button."""
+        self.entries: list[tuple[Button, bool, int, tuple[float, float, float, float], tuple | None]] = []
+        """
+        The bounds of the active buttons, topmost first, as the button, whether it ignores the camera, the z-index of
+        its root gameobject, its AABB and its corners if it is rotated.
+        """
+        self.view: tuple[float, ...] | None = None
+        """The mouse position and camera the hovered button was found with."""
+        self.hovered: Button | None = None
+        """The button under the mouse."""
+        self.pressed: dict[Button, None] = {}
+        """The buttons being pressed."""
+        self.dirty: bool = True
+        """Whether buttons were added or removed since the bounds were built."""
+
+    def add(self, button: Button):
+        self.buttons[button] = None
+        self.dirty = True
+
+    def remove(self, button: Button):
+        if button not in self.buttons:
+            return
+        del self.buttons[button]
+        self.pressed.pop(button, None)
+        if self.hovered is button:
+            self.hovered = None
+        self.dirty = True
+
+    @staticmethod
+    def _layout(button: Button) -> tuple:
+        """The values the bounds of a button depend on."""
+        go: GameObject | None = button.gameobj
+        layout = (button.offset.x, button.offset.y, button.rot_offset, button.z_index, button.dims.x, button.dims.y)
+        while go is not None:
+            layout += (go.pos.x, go.pos.y, go.rotation, go.z_index, go.ignore_cam, go.active)
+            go = go._parent
+        return layout
+
+    def _build(self):
+        """Builds the bounds of the active buttons, sorted from the topmost down."""
+        ranked = []
+        for order, button in enumerate(self.buttons):
+            go: GameObject = button.gameobj
+            ignore_cam, active = go.ignore_cam, go.active
+            while go._parent is not None:
+                go = go._parent
+                ignore_cam, active = ignore_cam or go.ignore_cam, active and go.active
+            if not active:
+                continue
+
+            center, dims, angle = button.true_pos(), button.dims, button.true_rotation()
+            if angle == 0:
+                lt = (center - dims / 2).ceil()  # left top
+                rb = (center + dims / 2).ceil()  # right bottom
+                box, corners = (lt.x, lt.y, rb.x, rb.y), None
+            else:
+                corners = (
+                    (-dims / 2).rotate(angle) + center,  # pylint: disable=invalid-unary-operand-type
+                    (Vector(dims.x, -dims.y) / 2).rotate(angle) + center,
+                    (dims / 2).rotate(angle) + center,
+                    (Vector(-dims.x, dims.y) / 2).rotate(angle) + center,
+                )
+                xs, ys = [c.x for c in corners], [c.y for c in corners]
+                box = (min(xs), min(ys), max(xs), max(ys))
+
+            ranked.append(((button.true_z(), order), (button, ignore_cam, go.z_index, box, corners)))
+
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        self.entries = [entry for _, entry in ranked]
+
+    def _hit(self, camera: Camera) -> Button | None:
+        """Finds the topmost button under the mouse."""
+        screen = Input.get_mouse_pos()
+        world = camera.i_transform(screen)
+        for button, ignore_cam, root_z, (left, bottom, right, top), corners in self.entries:
+            if root_z > camera.z_index:
+                continue
+            mo = screen if ignore_cam else world
+            if not (left <= mo.x <= right and bottom <= mo.y <= top):
+                continue
+            if corners is None:
+                return button
+            lt, rt, rb, lb = corners
+            if Input._is_left(lt, rt, mo) and Input._is_left(rt, rb, mo) and Input._is_left(rb, lb, mo) and \
+                Input._is_left(lb, lt, mo):
+                return button
+        return None
+
+    def update(self, camera: Camera):
+        """Finds the button under the mouse, if anything moved, and calls the callbacks of the affected buttons."""
+        layouts = [self._layout(button) for button in self.buttons]
+        rebuilt = self.dirty or layouts != self.layouts
+        if rebuilt:
+            self.layouts, self.dirty = layouts, False
+            self._build()
+
+        mouse = Input.get_mouse_pos()
+        view = (mouse.x, mouse.y, camera.pos.x, camera.pos.y, camera.zoom, camera.z_index)
+        if rebuilt or view != self.view:
+            self.view = view
+            top = self._hit(camera)
+            if top is not self.hovered:
+                old, self.hovered = self.hovered, top
+                if old is not None and old.hover:
+                    old.hover = False
+                    old.onexit()
+                if top is not None and not top.hover:
+                    top.hover = True
+                    top.onhover()
+
+        mouse_down = Input._buttons & sdl2.SDL_BUTTON_LMASK != 0
+        top = self.hovered
+        if mouse_down:
+            if top is not None and not top.pressed:
+                top.pressed = True
+                self.pressed[top] = None
+                top.onclick()
+        elif self.pressed:
+            pressed, self.pressed = self.pressed, {}
+            for button in pressed:
+                if button.pressed:
+                    button.pressed = False
+                    button.onrelease()
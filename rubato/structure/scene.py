@@ -2,10 +2,19 @@
 An abstraction for a "level", or scene, in rubato.
 """
 from __future__ import annotations
+from typing import Callable, Type, TypeVar, TYPE_CHECKING
 
-from . import GameObject, Hitbox
+from . import GameObject, Component, Hitbox, Polygon, Rectangle, Circle, RaycastHit, Button
+from .gameobject.ui.button_index import _ButtonIndex
 from .gameobject.physics.qtree import _QTree
-from .. import Game, Color, Draw, Camera
+from .gameobject.physics.engine import _Engine
+from .gameobject.physics.query import _SpatialHash
+from .. import Game, Color, Draw, Camera, Vector, Math, Profiler, Time
+
+if TYPE_CHECKING:
+    from ..utils.rb_time import _Clock
+
+T = TypeVar("T", bound=Component)
 
 
 class Scene:
@@ -26,8 +35,28 @@ def __init__(
         background_color: Color = Color.white,
         border_color: Color = Color.black,
     ):
-        self._root: list[GameObject] = []
-        """The list of gameobjects in this scene."""
+        self._root: dict[GameObject, None] = {}
+        """The gameobjects in this scene, in the order they were added."""
+        self._pending: list[tuple[GameObject, bool]] = []
+        """The adds (True) and removes (False) waiting for the scene to finish iterating over its gameobjects."""
+        self._locked: bool = False
+        self._components: dict[type, dict[Component, None]] = {}
+        """Every component in this scene, grouped by type."""
+        self._hitboxes: dict[GameObject, dict[Hitbox, None]] = {}
+        """The hitboxes in this scene, grouped by the root gameobject they belong to."""
+        self._spatial: _SpatialHash | None = None
+        """
+        The grid used by spatial queries. Built on the first query after the hitboxes move, which is after each update
+        and physics step, and whenever the pos or rotation of a gameobject of the scene is set.
+        """
+        self._probes: dict[Hitbox, Hitbox] = {}
+        """The copies of the hitboxes that shape casts move, reused from one cast to the next."""
+        self._contact_cache: dict[tuple[Hitbox, Hitbox], tuple[float, float]] = {}
+        """The impulses the physics solver applied to each colliding pair of hitboxes during the last step."""
+        self._buttons: _ButtonIndex | None = None
+        """The buttons in this scene, indexed to find the one under the mouse. Created when the first one is added."""
+        self._clock: _Clock | None = None
+        """The time of the scene and the tasks it owns. Created when it is given its first task."""
         self.camera = Camera()
         """The camera of this scene."""
         self.started = False
@@ -35,6 +64,11 @@ def __init__(
         """The color of the border of the window."""
         self.background_color = background_color
         """The color of the background of the window."""
+        self.solver_iterations: int = 8
+        """
+        How many times the physics solver goes over every collision each physics step. More iterations make stacks
+        of rigidbodies more stable, at the cost of speed. Defaults to 8.
+        """
 
         self.__id = Game._add(self, name)
 
@@ -51,20 +85,50 @@ def switch(self):
         """
         Game.set_scene(self.name)
 
+    @property
+    def root_count(self) -> int:
+        """
+        The number of gameobjects at the root of this scene. Read-only.
+        """
+        return len(self._root)
+
+    @property
+    def pending_count(self) -> int:
+        """
+        The number of adds and removes waiting to be applied at the end of the current update, fixed update or draw.
+        Read-only.
+        """
+        return len(self._pending)
+
     def add(self, *gos: GameObject):
         """
-        Adds gameobject(s) to the scene.
+        Adds gameobject(s) to the scene. Adding a gameobject that is already in the scene does nothing.
+
+        Note:
+            A gameobject can only be in one scene at a time. Adding it to this scene removes it from its previous
+            scene.
+
+        Note:
+            Gameobjects added while the scene is updating or drawing its gameobjects are added once it is done.
 
         Args:
             *gos: The gameobjects to add to the scene.
         """
-        self._root.extend(gos)
+        if self._locked:
+            self._pending.extend((go, True) for go in gos)
+            return
+
+        for go in gos:
+            self._add(go)
 
     def remove(self, *gos: GameObject) -> bool:
         """
         Removes gameobject(s) from the scene. This will return false if any of the gameobjects are not in the scene,
         but it will guarantee that all the gameobjects are removed.
 
+        Note:
+            Gameobjects removed while the scene is updating or drawing its gameobjects are removed once it is done.
+
         Args:
             *gos: The gameobjects to remove.
 
@@ -73,12 +137,277 @@ def remove(self, *gos: GameObject) -> bool:
         """
         success: bool = True
         for go in gos:
-            try:
-                self._root.remove(go)
-            except ValueError:
+            if go not in self._root:
                 success = False
+            if self._locked:
+                self._pending.append((go, False))
+            else:
+                self._remove(go)
         return success
 
+    def _add(self, go: GameObject):
+        if go in self._root:
+            return
+        if go._scene is not self:
+            if go._scene:
+                go.parent = None
+                go._scene.remove(go)
+            if go._scene:  # the previous scene is busy and will remove the gameobject later
+                go._scene._unregister_tree(go)
+            self._register_tree(go)
+        self._root[go] = None
+
+    def _remove(self, go: GameObject):
+        if go not in self._root:
+            return
+        del self._root[go]
+        if go._scene is self and not go._parent:
+            self._unregister_tree(go)
+            self._stop_tasks(go)
+
+    def _lock(self):
+        """Defers adds and removes until :meth:`_unlock` is called."""
+        self._locked = True
+
+    def _unlock(self):
+        """Applies the deferred adds and removes."""
+        self._locked = False
+        while self._pending:
+            pending, self._pending = self._pending, []
+            for go, add in pending:
+                if add:
+                    self._add(go)
+                else:
+                    self._remove(go)
+
+    def get_all(self, comp_type: Type[T]) -> list[T]:
+        """
+        Gets all the components of a type from every gameobject in the scene.
+
+        Args:
+            comp_type: The type of component to search for.
+
+        Returns:
+            A list containing all the components of that type. If no components were found, the
+                list is empty.
+        """
+        fin = []
+        for key, val in self._components.items():
+            if issubclass(key, comp_type):
+                fin.extend(val)
+        return fin
+
+    def query_point(
+        self,
+        pt: Vector | tuple[float, float],
+        should_hit: Callable[[Hitbox], bool] | None = None,
+    ) -> list[Hitbox]:
+        """
+        Gets the hitboxes in the scene that contain a point.
+
+        Args:
+            pt: The point to check, in game-world coordinates.
+            should_hit: A function that decides whether a hitbox can be found. Defaults to None (all hitboxes).
+
+        Returns:
+            A list of the hitboxes containing the point.
+        """
+        pt = Vector.create(pt)
+        return self._get_spatial().query_point(pt.x, pt.y, should_hit)
+
+    def query_aabb(
+        self,
+        bottom_left: Vector | tuple[float, float],
+        top_right: Vector | tuple[float, float],
+        should_hit: Callable[[Hitbox], bool] | None = None,
+    ) -> list[Hitbox]:
+        """
+        Gets the hitboxes in the scene whose axis-aligned bounding boxes overlap a box.
+
+        Args:
+            bottom_left: The bottom left corner of the box, in game-world coordinates.
+            top_right: The top right corner of the box, in game-world coordinates.
+            should_hit: A function that decides whether a hitbox can be found. Defaults to None (all hitboxes).
+
+        Returns:
+            A list of the hitboxes overlapping the box.
+        """
+        bottom_left, top_right = Vector.create(bottom_left), Vector.create(top_right)
+        return self._get_spatial().query_aabb(bottom_left.x, bottom_left.y, top_right.x, top_right.y, should_hit)
+
+    def raycast(
+        self,
+        origin: Vector | tuple[float, float],
+        direction: Vector | tuple[float, float],
+        max_dist: float = Math.INF,
+        should_hit: Callable[[Hitbox], bool] | None = None,
+    ) -> RaycastHit | None:
+        """
+        Casts a ray through the scene and finds the first hitbox it hits. Only Rectangle, Polygon and Circle hitboxes
+        can be hit. A ray that starts inside a hitbox hits it at a distance of 0.
+
+        Args:
+            origin: Where the ray starts, in game-world coordinates.
+            direction: The direction of the ray.
+            max_dist: How far the ray goes. Defaults to Math.INF.
+            should_hit: A function that decides whether a hitbox can be hit. Defaults to None (all hitboxes).
+
+        Raises:
+            ValueError: The direction is the zero vector.
+
+        Returns:
+            The closest hit, or None if nothing was hit.
+        """
+        origin, direction = Vector.create(origin), Vector.create(direction)
+        if direction.x == 0 and direction.y == 0:
+            raise ValueError("The direction of a raycast cannot be the zero vector.")
+        direction = direction.normalized()
+        return self._get_spatial().raycast(origin.x, origin.y, direction.x, direction.y, max_dist, should_hit)
+
+    def shape_cast(
+        self,
+        shape: Hitbox,
+        direction: Vector | tuple[float, float],
+        distance: float,
+        should_hit: Callable[[Hitbox], bool] | None = None,
+        ignore_overlapping: bool = False,
+    ) -> RaycastHit | None:
+        """
+        Moves a copy of a hitbox along a direction and finds the first hitbox it hits. The hitbox itself does not move,
+        and hitboxes on the same gameobject are ignored. Only Rectangle, Polygon and Circle hitboxes are supported.
+
+        Args:
+            shape: The hitbox to cast. It must be attached to a gameobject.
+            direction: The direction to move the hitbox in.
+            distance: How far to move the hitbox.
+            should_hit: A function that decides whether a hitbox can be hit. Defaults to None (all hitboxes).
+            ignore_overlapping: Whether to ignore the hitboxes that the hitbox already overlaps. Otherwise, they are
+                hit at a distance of 0. Defaults to False.
+
+        Raises:
+            ValueError: The direction is the zero vector.
+
+        Returns:
+            The first hit, or None if nothing was hit. The point of the hit is the position of the gameobject when the
+            hitbox hits.
+        """
+        direction = Vector.create(direction)
+        if direction.x == 0 and direction.y == 0:
+            raise ValueError("The direction of a shape cast cannot be the zero vector.")
+        direction = direction.normalized()
+
+        owner = shape.gameobj
+
+        def check(hb: Hitbox) -> bool:
+            return hb.gameobj is not owner and (should_hit is None or should_hit(hb))
+
+        return self._get_spatial().shape_cast(
+            self._probe(shape), direction.x, direction.y, distance, check, ignore_overlapping
+        )
+
+    def _probe(self, shape: Hitbox) -> Hitbox:
+        """Gets the copy of a hitbox that shape casts move, with its current shape and placed where it is now."""
+        probe = self._probes.get(shape)
+        if probe is None:
+            probe = shape.clone()
+            GameObject().add(probe)
+            self._probes[shape] = probe
+        else:
+            probe.offset.x, probe.offset.y = shape.offset.x, shape.offset.y
+            probe.rot_offset, probe.scale = shape.rot_offset, shape.scale
+            if isinstance(shape, Circle):
+                probe.radius = shape.radius
+            else:
+                if isinstance(shape, Rectangle):
+                    probe.width, probe.height = shape.width, shape.height
+                elif isinstance(shape, Polygon):
+                    probe.verts = shape.verts
+                probe.regen()
+
+        pos = shape.gameobj.true_pos()
+        probe.gameobj.pos.x, probe.gameobj.pos.y = pos.x, pos.y
+        probe.gameobj.rotation = shape.gameobj.true_rotation()
+        return probe
+
+    def _get_spatial(self) -> _SpatialHash:
+        """Gets the grid used by spatial queries, building it if the hitboxes moved since it was last built."""
+        if self._spatial is None:
+            self._spatial = _SpatialHash([hb for group in self._hitboxes.values() for hb in group])
+        return self._spatial
+
+    def _register_tree(self, go: GameObject):
+        """Registers a gameobject and all of its children with this scene."""
+        go._scene = self
+        for comps in go._components.values():
+            for comp in comps:
+                self._register(comp)
+        for child in go._children:
+            self._register_tree(child)
+
+    def _unregister_tree(self, go: GameObject):
+        """Unregisters a gameobject and all of its children from this scene."""
+        go._scene = None
+        for comps in go._components.values():
+            for comp in comps:
+                self._unregister(comp)
+        for child in go._children:
+            self._unregister_tree(child)
+
+    def _register(self, comp: Component):
+        """Adds a component to the registries of this scene."""
+        comp_type = type(comp)
+        if comp_type not in self._components:
+            self._components[comp_type] = {}
+        elif comp in self._components[comp_type]:
+            return
+        self._components[comp_type][comp] = None
+
+        if isinstance(comp, Hitbox):
+            self._spatial = None
+            root = self._root_of(comp.gameobj)
+            if root in self._hitboxes:
+                self._hitboxes[root][comp] = None
+            else:
+                self._hitboxes[root] = {comp: None}
+        elif isinstance(comp, Button):
+            if self._buttons is None:
+                self._buttons = _ButtonIndex()
+            self._buttons.add(comp)
+
+    def _unregister(self, comp: Component):
+        """Removes a component from the registries of this scene."""
+        comps = self._components.get(type(comp))
+        if comps is None or comp not in comps:
+            return
+        del comps[comp]
+        if not comps:
+            del self._components[type(comp)]
+
+        if isinstance(comp, Hitbox):
+            self._spatial = None
+            self._probes.pop(comp, None)
+            root = self._root_of(comp.gameobj)
+            group = self._hitboxes[root]
+            del group[comp]
+            if not group:
+                del self._hitboxes[root]
+        elif isinstance(comp, Button) and self._buttons is not None:
+            self._buttons.remove(comp)
+
+    @staticmethod
+    def _stop_tasks(go: GameObject):
+        """Stops the tasks owned by a gameobject and all of its children."""
+        Time.stop_all(go)
+        for child in go._children:
+            Scene._stop_tasks(child)
+
+    @staticmethod
+    def _root_of(go: GameObject) -> GameObject:
+        """Gets the topmost ancestor of a gameobject."""
+        while go._parent:
+            go = go._parent
+        return go
+
     def _setup(self):
         self.started = True
         self.setup()
@@ -87,10 +416,21 @@ def _update(self):
         if not self.started:
             self._setup()
 
+        if self._clock is not None:
+            self._clock.advance(self._clock.now + Time._delta_time)
+
         self.update()
 
-        for go in self._root:
-            go._update()
+        if self._buttons is not None:
+            self._buttons.update(self.camera)
+
+        self._lock()
+        try:
+            for go in self._root:
+                go._update()
+        finally:
+            self._unlock()
+            self._spatial = None
 
     def _paused_update(self):
         if not self.started:
@@ -101,22 +441,42 @@ def _paused_update(self):
     def _fixed_update(self):
         self.fixed_update()
 
-        all_hts = []
-        for go in self._root:
-            go._fixed_update()
-            hts = go._deep_get_all(Hitbox)
-            if hts:
-                all_hts.append(hts)
-
-        _QTree(all_hts)
+        self._lock()
+        try:
+            for go in self._root:
+                go._fixed_update()
+
+            if self._hitboxes:
+                Profiler.begin("collisions")
+                _Engine._contacts = cols = []  # collisions are solved together once they are all found
+                _Engine._pairs = 0
+                try:
+                    # a copy of the groups, since the callbacks of the collisions may add and remove hitboxes
+                    _QTree([list(group) for group in self._hitboxes.values()])
+                finally:
+                    _Engine._contacts = None
+                    Profiler.end()
+                Profiler.count("collision pairs", _Engine._pairs)
+                Profiler.count("contacts", len(cols))
+
+                Profiler.begin("solve")
+                self._contact_cache = _Engine._solve(cols, self._contact_cache, self.solver_iterations)
+                Profiler.end()
+        finally:
+            self._unlock()
+            self._spatial = None
 
     def _draw(self):
         Draw.clear(self.background_color, self.border_color)
         self.draw()
 
-        for go in self._root:
-            if go.z_index <= self.camera.z_index:
-                go._draw(self.camera)
+        self._lock()
+        try:
+            for go in self._root:
+                if go.z_index <= self.camera.z_index:
+                    go._draw(self.camera)
+        finally:
+            self._unlock()
 
     def setup(self):
         """
@@ -172,7 +532,7 @@ def clone(self) -> Scene:
         new_scene = Scene(
             name=f"{self.name} (clone)", background_color=self.background_color, border_color=self.border_color
         )
-        new_scene._root = [go.clone() for go in self._root]
+        new_scene.add(*[go.clone() for go in self._root])
 
         return new_scene
 
@@ -4,6 +4,7 @@
 from .path import get_path
 from .error import *
 from .rb_time import DelayedTask, FramesTask, RecurrentTask, Time
+from .profiler import Profiler
 from .computation import *
 from .hardware import *
 from .radio import *
@@ -0,0 +1,26 @@
+"""Helper method for calling callbacks that may or may not take an argument."""
+from typing import Callable
+import inspect
+
+
+def _takes_argument(func: Callable) -> bool:
+    """
+    Checks whether a callback can be called with one positional argument. Callbacks whose signature cannot be read
+    (some builtins and extension functions) are assumed to take it.
+
+    Args:
+        func: The callback.
+
+    Returns:
+        Whether the callback should be called with the argument.
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return True
+
+    try:
+        signature.bind(None)
+    except TypeError:
+        return False
+    return True
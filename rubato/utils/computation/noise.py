@@ -1,17 +1,28 @@
 """
 A modified implementation of the OpenSimplex2 algorithm.
 """
+from array import array
+from typing import Sequence
+
 from . import Math
 from .. import InitError
+from ...c_src import c_noise
 
 
 # THIS IS A STATIC CLASS
 class Noise:
     """
     A utility for generating simple smooth noise, based on OpenSimplex2.
+
+    Large amounts of noise, like a whole terrain or texture, are best made with :meth:`noise2_grid` or
+    :meth:`noise2_tile`, which compute every sample in compiled code and give the same values as :meth:`noise2`.
     """
     seed: int = 0
     """The seed for the random noise. Setting to a fixed value will result in the same noise every time."""
+    tile_cache: int = 16
+    """How many tiles made by :meth:`noise2_tile` are kept to be reused. Set to 0 to keep none. Defaults to 16."""
+
+    _tiles: dict[tuple, array] = {}
 
     _PRIME_X = 0x5205402B9270C86F
     _PRIME_Y = 0x598CD327003817B5
@@ -66,6 +77,149 @@ def noise2(cls, x: float, y: float) -> float:
         ys = y + s
         return cls._noise2_base(cls.seed, xs, ys)
 
+    @classmethod
+    def fbm2(cls, x: float, y: float, octaves: int = 4, lacunarity: float = 2, gain: float = 0.5) -> float:
+        """
+        Creates fractal noise from 2 dimensional input, by adding octaves of noise together. Each octave is more
+        detailed and fainter than the last.
+
+        Args:
+            x: the x coordinate of noise.
+            y: the y coordinate of noise.
+            octaves: the number of octaves. Defaults to 4.
+            lacunarity: how much the frequency is multiplied by from one octave to the next. Defaults to 2.
+            gain: how much the amplitude is multiplied by from one octave to the next. Defaults to 0.5.
+
+        Returns:
+            float: the random noise value, between -1 and 1.
+        """
+        if octaves == 1:
+            return cls.noise2(x, y)
+
+        value, total, amplitude, frequency = 0.0, 0.0, 1.0, 1.0
+        for _ in range(octaves):
+            value += amplitude * cls.noise2(x * frequency, y * frequency)
+            total += amplitude
+            amplitude *= gain
+            frequency *= lacunarity
+        return value / total
+
+    @classmethod
+    def noise2_array(
+        cls,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        octaves: int = 1,
+        lacunarity: float = 2,
+        gain: float = 0.5,
+    ) -> array:
+        """
+        Creates noise for many 2 dimensional points at once.
+
+        Args:
+            xs: the x coordinates of the points.
+            ys: the y coordinates of the points.
+            octaves: the number of octaves, like in :meth:`fbm2`. Defaults to 1 (plain noise).
+            lacunarity: how much the frequency is multiplied by from one octave to the next. Defaults to 2.
+            gain: how much the amplitude is multiplied by from one octave to the next. Defaults to 0.5.
+
+        Raises:
+            ValueError: xs and ys are not the same length.
+
+        Returns:
+            array: the noise value of each point, as an array of doubles.
+        """
+        if len(xs) != len(ys):
+            raise ValueError(f"Got {len(xs)} x coordinates for {len(ys)} y coordinates.")
+        return c_noise.noise2_points(
+            array("d", xs), array("d", ys), cls.seed, max(octaves, 1), lacunarity, gain, cls._GRADS_ARRAY
+        )
+
+    @classmethod
+    def noise2_grid(
+        cls,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        octaves: int = 1,
+        lacunarity: float = 2,
+        gain: float = 0.5,
+    ) -> array:
+        """
+        Creates noise for every point of a grid at once.
+
+        Args:
+            xs: the x coordinates of the columns of the grid.
+            ys: the y coordinates of the rows of the grid.
+            octaves: the number of octaves, like in :meth:`fbm2`. Defaults to 1 (plain noise).
+            lacunarity: how much the frequency is multiplied by from one octave to the next. Defaults to 2.
+            gain: how much the amplitude is multiplied by from one octave to the next. Defaults to 0.5.
+
+        Returns:
+            array: the noise values as an array of doubles, row by row. The value at (xs[i], ys[j]) is at
+            index j * len(xs) + i.
+
+        Example:
+            .. code-block:: python
+
+                heights = rb.Noise.noise2_grid([x / 50 for x in range(256)], [y / 50 for y in range(256)], octaves=4)
+        """
+        return c_noise.noise2_grid(
+            array("d", xs), array("d", ys), cls.seed, max(octaves, 1), lacunarity, gain, cls._GRADS_ARRAY
+        )
+
+    @classmethod
+    def noise2_tile(
+        cls,
+        x: float,
+        y: float,
+        width: int,
+        height: int,
+        step: float = 1,
+        octaves: int = 1,
+        lacunarity: float = 2,
+        gain: float = 0.5,
+    ) -> array:
+        """
+        Creates noise for a grid of evenly spaced points, like a chunk of a procedural world. The last
+        :attr:`tile_cache` tiles are kept, so asking for the same tile with the same seed again is a copy.
+
+        Args:
+            x: the x coordinate of the first column.
+            y: the y coordinate of the first row.
+            width: the number of columns.
+            height: the number of rows.
+            step: the distance between two columns or rows. Defaults to 1.
+            octaves: the number of octaves, like in :meth:`fbm2`. Defaults to 1 (plain noise).
+            lacunarity: how much the frequency is multiplied by from one octave to the next. Defaults to 2.
+            gain: how much the amplitude is multiplied by from one octave to the next. Defaults to 0.5.
+
+        Returns:
+            array: the noise values as an array of doubles, row by row, like :meth:`noise2_grid`.
+        """
+        key = (cls.seed, x, y, width, height, step, octaves, lacunarity, gain)
+        tile = cls._tiles.pop(key, None)
+        if tile is None:
+            tile = cls.noise2_grid(
+                [x + i * step for i in range(width)],
+                [y + j * step for j in range(height)],
+                octaves,
+                lacunarity,
+                gain,
+            )
+
+        if cls.tile_cache > 0:
+            cls._tiles[key] = tile
+            while len(cls._tiles) > cls.tile_cache:
+                del cls._tiles[next(iter(cls._tiles))]
+            return tile[:]
+        cls._tiles.clear()
+        return tile
+
+    @classmethod
+    def clear_tiles(cls):
+        """Forgets the tiles kept by :meth:`noise2_tile`."""
+        cls._tiles.clear()
+
     @classmethod
     def _noise2_base(cls, seed: int, xs: float, ys: float) -> float:
         xsb = Math.floor(xs)
@@ -177,3 +331,5 @@ def _grad2(cls, seed: int, xsvp: int, ysvp: int, dx: float, dy: float) -> float:
             _gradient_j = 0
         _GRADIENTS_2D.append(_gradient2[_gradient_j])
         _gradient_j += 1
+
+    _GRADS_ARRAY = array("d", _GRADIENTS_2D)
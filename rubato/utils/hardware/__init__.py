@@ -1,4 +1,5 @@
 """This module contains hardware interaction utilities"""
 from .display import Display
 from .sound import Sound
+from .music import Music
 from .rb_input import Input
@@ -79,6 +79,8 @@ class Display(metaclass=_DisplayProperties):
         window_pos (Vector): The current position of the window in terms of screen pixels.
         window_name (str): The name of the window.
         hidden (bool): Whether the window is currently hidden.
+        headless (bool): Whether rubato was initialized without a display. The renderer then draws to an offscreen
+            target the size of the resolution instead of a window.
     """
 
     window: sdl2.ext.Window
@@ -89,6 +91,9 @@ class Display(metaclass=_DisplayProperties):
         0, 1, 1, 32, sdl2.SDL_PIXELFORMAT_RGBA8888
     ).contents.format.contents
     hidden: bool = True
+    headless: bool = False
+
+    _target: sdl2.SDL_Surface | None = None
 
     _saved_window_size: Vector | None = None
     _saved_window_pos: Vector | None = None
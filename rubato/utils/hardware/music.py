@@ -0,0 +1,160 @@
+"""
+Music streamed from its file while it plays.
+"""
+from __future__ import annotations
+
+import sdl2.sdlmixer as mixer
+
+from .sound import Sound
+from .. import IdError, Math
+
+
+class Music:
+    """
+    Used to play long tracks, like soundtracks, in rubato. Unlike a :class:`Sound`, music is decoded bit by bit from its
+    file while it plays instead of all at once into memory, so it loads instantly and takes little memory however long
+    it is. Only one music plays at a time, alongside any number of sounds. Supports the same file formats as Sound.
+
+    Args:
+        path: The relative path to the music file you wish to import.
+        music_name: The name of the music. Defaults to the name of the file.
+    """
+    STOPPED = Sound.STOPPED
+    PLAYING = Sound.PLAYING
+    PAUSED = Sound.PAUSED
+
+    loaded_music: dict[str, Music] = {}
+    """A dictionary housing all the loaded music, stored by their name."""
+
+    _playing: Music | None = None
+
+    def __init__(self, path: str, music_name: str = ""):
+        if music_name == "":
+            self.name = path.split("/")[-1].split(".")[0]
+        else:
+            self.name = music_name
+
+        if self.name in Music.loaded_music:
+            raise IdError(f"There is already a music with the name {self.name}")
+
+        self.music = mixer.Mix_LoadMUS(path.encode("utf-8"))
+        self._volume = int(mixer.MIX_MAX_VOLUME / 2)
+
+        Music.loaded_music[self.name] = self
+
+    @property
+    def state(self) -> int:
+        """
+        The current state of the music.
+
+        The possible states are::
+
+            Music.STOPPED
+            Music.PLAYING
+            Music.PAUSED
+
+        Returns:
+            int: The current state of the music.
+        """
+        if Music._playing is not self or not mixer.Mix_PlayingMusic():
+            return self.STOPPED
+        elif mixer.Mix_PausedMusic():
+            return self.PAUSED
+        else:
+            return self.PLAYING
+
+    def play(self, loops: int = 0, fade_in: float = 0):
+        """
+        Plays the music, stopping any other music.
+
+        Args:
+            loops: The number of times to loop the music after the first play through. Use -1 to loop forever.
+                Defaults to 0.
+            fade_in: The time to fade the music in over, in seconds. Defaults to 0.
+        """
+        loops = loops + 1 if loops >= 0 else -1
+        if fade_in > 0:
+            mixer.Mix_FadeInMusic(self.music, loops, round(fade_in * 1000))
+        else:
+            mixer.Mix_PlayMusic(self.music, loops)
+
+        Music._playing = self
+        self.set_volume(self._volume)
+
+    def stop(self, fade_out: float = 0):
+        """
+        Stops the music if it is playing.
+
+        Args:
+            fade_out: The time to fade the music out over, in seconds. Defaults to 0.
+        """
+        if Music._playing is not self:
+            return
+        if fade_out > 0:
+            mixer.Mix_FadeOutMusic(round(fade_out * 1000))
+        else:
+            mixer.Mix_HaltMusic()
+
+    def pause(self):
+        """
+        Pauses the music if it is playing.
+        """
+        if Music._playing is self:
+            mixer.Mix_PauseMusic()
+
+    def resume(self):
+        """
+        Resumes the music if it is paused.
+        """
+        if Music._playing is self:
+            mixer.Mix_ResumeMusic()
+
+    def seek(self, position: float):
+        """
+        Jumps to a position in the music if it is playing.
+
+        Args:
+            position: The position to jump to, in seconds from the start.
+        """
+        if Music._playing is self:
+            mixer.Mix_RewindMusic()
+            mixer.Mix_SetMusicPosition(position)
+
+    def set_volume(self, volume: int):
+        """
+        Sets the volume of the music.
+
+        Args:
+            volume: The volume of the music. range(0, MIX_MAX_VOLUME=>128)
+        """
+        self._volume = int(Math.clamp(volume, 0, mixer.MIX_MAX_VOLUME))
+        if Music._playing is self:
+            mixer.Mix_VolumeMusic(self._volume)
+
+    def get_volume(self) -> int:
+        """
+        Gets the volume of the music.
+
+        Returns:
+            The volume of the music. range(0, MIX_MAX_VOLUME=>128)
+        """
+        return self._volume
+
+    @classmethod
+    def get_music(cls, music_name: str) -> Music:
+        """
+        Gets the music based on the music name.
+
+        Args:
+            music_name: The name of the music.
+
+        Raises:
+            IdError: No music is associated to the music name.
+
+        Returns:
+            Music: The music.
+        """
+        try:
+            return cls.loaded_music[music_name]
+        except KeyError as e:
+            raise IdError(f"No music with the name {music_name} found") from e
@@ -9,12 +9,18 @@
 from . import Display
 from .. import Vector, Math, InitError
 
+_BUTTONS = sdl2.SDL_BUTTON_LMASK | sdl2.SDL_BUTTON_MMASK | sdl2.SDL_BUTTON_RMASK | sdl2.SDL_BUTTON_X1MASK | \
+    sdl2.SDL_BUTTON_X2MASK
+
 
 # THIS IS A STATIC CLASS
 class Input:
     """
     The input class, handling keyboard, mouse, and controller functionality.
 
+    The state of the keyboard, mouse and controllers is read once at the start of every frame, so every check made
+    during a frame sees the same state and costs a lookup.
+
     Go :doc:`here <key-names>` for a list of all the available keys.
     """
 
@@ -25,6 +31,8 @@ def __init__(self) -> None:
 
     _controllers: dict[int, sdl2.SDL_Joystick] = {}
     _joystick_max: int = 32768
+    _pads: dict[int, tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]] = {}
+    """The axes, buttons and hats of each controller at the start of the frame."""
 
     @classmethod
     def controllers(cls) -> list[int]:
@@ -74,6 +82,9 @@ def controller_axis(cls, controller: int, axis: int) -> float:
         """
         if controller not in cls._controllers:
             raise IndexError(f"Controller {controller} is not registered.")
+        pad = cls._pads.get(controller)
+        if pad is not None and 0 <= axis < len(pad[0]):
+            return pad[0][axis] / cls._joystick_max
         return sdl2.SDL_JoystickGetAxis(cls._controllers[controller], axis) / cls._joystick_max
 
     @classmethod
@@ -106,6 +117,9 @@ def controller_button(cls, controller: int, button: int) -> bool:
         """
         if controller not in cls._controllers:
             raise IndexError(f"Controller {controller} is not registered.")
+        pad = cls._pads.get(controller)
+        if pad is not None and 0 <= button < len(pad[1]):
+            return pad[1][button] == 1
         return sdl2.SDL_JoystickGetButton(cls._controllers[controller], button) == 1
 
     @classmethod
@@ -125,6 +139,9 @@ def controller_hat(cls, controller: int, hat: int) -> int:
         """
         if controller not in cls._controllers:
             raise IndexError(f"Controller {controller} is not registered.")
+        pad = cls._pads.get(controller)
+        if pad is not None and 0 <= hat < len(pad[2]):
+            return pad[2][hat]
         return sdl2.SDL_JoystickGetHat(cls._controllers[controller], hat)
 
     @classmethod
@@ -178,6 +195,23 @@ def translate_hat(cls, val: int) -> str:
         "altgr": sdl2.KMOD_MODE,
     }
 
+    _keys: bytes = bytes(sdl2.SDL_NUM_SCANCODES)
+    """The keyboard state at the start of the frame, indexed by scancode."""
+    _last_keys: bytes = bytes(sdl2.SDL_NUM_SCANCODES)
+    """The keyboard state at the start of the last frame."""
+    _mod_state: int = 0
+    """The modifier state at the start of the frame."""
+    _scancodes: dict[str, int] = {}
+    """The scancode of every key name SDL knows, in lowercase."""
+    _codes: dict[str, tuple[int, ...]] = {}
+    """The scancodes each key name checked so far stands for, as it was given."""
+    _sides: dict[str, tuple[str, str]] = {
+        "shift": ("left shift", "right shift"),
+        "ctrl": ("left ctrl", "right ctrl"),
+        "alt": ("left alt", "right alt"),
+        "gui": ("left gui", "right gui"),
+    }
+
     @classmethod
     def key_pressed(cls, *keys: str) -> bool:
         """
@@ -198,29 +232,73 @@ def key_pressed(cls, *keys: str) -> bool:
                 if rb.Input.key_pressed("shift", "w"):
                     # handle the "shift+w" keypress
         """
-        state = cls.get_keyboard_state()
+        state = cls._keys
 
         for key in keys:
-            key = key.lower()
-            if key in cls._mods and len(keys) > 1:
-                if not sdl2.SDL_GetModState() & cls._mods[key]:
-                    return False
+            if len(keys) > 1:
+                mod = cls._mods.get(key.lower())
+                if mod is not None:
+                    if not cls._mod_state & mod:
+                        return False
+                    continue
+
+            for code in cls._codes.get(key) or cls._resolve(key):
+                if state[code]:
+                    break
             else:
-                if key == "shift":
-                    key1, key2 = "left shift", "right shift"
-                elif key == "ctrl":
-                    key1, key2 = "left ctrl", "right ctrl"
-                elif key == "alt":
-                    key1, key2 = "left alt", "right alt"
-                elif key == "gui":
-                    key1, key2 = "left gui", "right gui"
-                else:
-                    key1, key2 = key, key
-
-                if not (state[cls.scancode_from_name(key1)] or state[cls.scancode_from_name(key2)]):
-                    return False
+                return False
         return True
 
+    @classmethod
+    def pressed_this_frame(cls, key: str) -> bool:
+        """
+        Checks if a key went down since the last frame. Case insensitive.
+
+        Args:
+            key: The name of the key to check. "shift", "ctrl", "alt" and "gui" count either side.
+
+        Returns:
+            bool: Whether the key was pressed this frame.
+
+        Example:
+            .. code-block:: python
+
+                if rb.Input.pressed_this_frame("space"):
+                    player.jump()
+        """
+        codes = cls._codes.get(key) or cls._resolve(key)
+        state, last = cls._keys, cls._last_keys
+        return any(state[code] for code in codes) and not any(last[code] for code in codes)
+
+    @classmethod
+    def released_this_frame(cls, key: str) -> bool:
+        """
+        Checks if a key went up since the last frame. Case insensitive.
+
+        Args:
+            key: The name of the key to check. "shift", "ctrl", "alt" and "gui" count either side.
+
+        Returns:
+            bool: Whether the key was released this frame.
+        """
+        codes = cls._codes.get(key) or cls._resolve(key)
+        state, last = cls._keys, cls._last_keys
+        return any(last[code] for code in codes) and not any(state[code] for code in codes)
+
+    @classmethod
+    def _resolve(cls, key: str) -> tuple[int, ...]:
+        """Finds the scancodes a key name stands for and remembers them."""
+        if not cls._scancodes:
+            for code in range(sdl2.SDL_NUM_SCANCODES):
+                name = sdl2.SDL_GetScancodeName(code).decode("utf-8").lower()
+                if name:
+                    cls._scancodes.setdefault(name, code)
+
+        name = key.lower()
+        codes = tuple(cls._scancodes.get(side, sdl2.SDL_SCANCODE_UNKNOWN) for side in cls._sides.get(name, (name,)))
+        cls._codes[key] = codes
+        return codes
+
     @classmethod
     def get_keyboard_state(cls):
         """Returns a list with the current SDL keyboard state."""
@@ -293,6 +371,15 @@ def window_focused(cls) -> bool:
 
     # MOUSE FUNCTIONS
 
+    _buttons: int = 0
+    """The mouse button mask at the start of the frame."""
+    _last_buttons: int = 0
+    """The mouse button mask at the start of the last frame."""
+    _mouse_abs: tuple[int, int] = (0, 0)
+    """The mouse position in display coordinates at the start of the frame."""
+    _mouse_pos: tuple[float, float] | None = None
+    """The mouse position in screen coordinates, once it was asked for this frame."""
+
     @classmethod
     def mouse_state(cls) -> tuple[bool, bool, bool, bool, bool]:
         """
@@ -302,7 +389,7 @@ def mouse_state(cls) -> tuple[bool, bool, bool, bool, bool]:
             A tuple with 5 booleans representing the state of each
             mouse button. (button1, button2, button3, button4, button5)
         """
-        info = sdl2.SDL_GetMouseState(ctypes.byref(c_int(0)), ctypes.byref(c_int(0)))
+        info = cls._buttons
         return (
             (info & sdl2.SDL_BUTTON_LMASK) != 0,
             (info & sdl2.SDL_BUTTON_MMASK) != 0,
@@ -319,7 +406,35 @@ def mouse_pressed(cls) -> bool:
         Returns:
             True if any button is pressed, false otherwise.
         """
-        return any(cls.mouse_state())
+        return cls._buttons & _BUTTONS != 0
+
+    @classmethod
+    def mouse_pressed_this_frame(cls, button: int = 1) -> bool:
+        """
+        Checks if a mouse button went down since the last frame.
+
+        Args:
+            button: The button to check, from 1 to 5 like in :meth:`mouse_state`. Defaults to 1 (left).
+
+        Returns:
+            Whether the button was pressed this frame.
+        """
+        mask = sdl2.SDL_BUTTON(button)
+        return cls._buttons & mask != 0 and cls._last_buttons & mask == 0
+
+    @classmethod
+    def mouse_released_this_frame(cls, button: int = 1) -> bool:
+        """
+        Checks if a mouse button went up since the last frame.
+
+        Args:
+            button: The button to check, from 1 to 5 like in :meth:`mouse_state`. Defaults to 1 (left).
+
+        Returns:
+            Whether the button was released this frame.
+        """
+        mask = sdl2.SDL_BUTTON(button)
+        return cls._buttons & mask == 0 and cls._last_buttons & mask != 0
 
     @staticmethod
     def _display_to_screen(x: float, y: float) -> tuple[float, float]:
@@ -344,29 +459,32 @@ def get_mouse_pos(cls) -> Vector:
         Returns:
             A Vector representing position.
         """
-        return Vector.create(Display._sdl_to_cartesian(cls._display_to_screen(*cls.get_mouse_abs_pos())))
+        pos = cls._mouse_pos
+        if pos is None:
+            pos = cls._mouse_pos = Display._sdl_to_cartesian(cls._display_to_screen(*cls._mouse_abs))
+        return Vector(pos[0], pos[1])
 
-    @staticmethod
-    def get_mouse_abs_pos() -> Vector:
+    @classmethod
+    def get_mouse_abs_pos(cls) -> Vector:
         """
         The current absolute position of the mouse, in display coordinates.
 
         Returns:
             A Vector representing position.
         """
-        x_window, y_window = c_int(0), c_int(0)
-        sdl2.SDL_GetMouseState(ctypes.byref(x_window), ctypes.byref(y_window))
-        return Vector(x_window.value, y_window.value)
+        return Vector(cls._mouse_abs[0], cls._mouse_abs[1])
 
-    @staticmethod
-    def set_mouse_pos(v: Vector | tuple[float, float]):
+    @classmethod
+    def set_mouse_pos(cls, v: Vector | tuple[float, float]):
         """
         Sets the position of the mouse.
 
         Args:
             v: The position to set the mouse to.
         """
-        sdl2.SDL_WarpMouseInWindow(Display.window.window, c_int(round(v[0])), c_int(round(v[1])))
+        x, y = round(v[0]), round(v[1])
+        sdl2.SDL_WarpMouseInWindow(Display.window.window, c_int(x), c_int(y))
+        cls._mouse_abs, cls._mouse_pos = (x, y), None
 
     @classmethod
     def mouse_is_visible(cls) -> bool:
@@ -454,3 +572,23 @@ def _is_left(p0: Vector, p1: Vector, p2: Vector) -> bool:
         # not sure what this does but I got it from:
         # https://gamedev.stackexchange.com/a/110233
         return ((p1.x - p0.x) * (p2.y - p0.y) - (p2.x - p0.x) * (p1.y - p0.y)) > 0
+
+    @classmethod
+    def _snapshot(cls):
+        """Reads the state of the keyboard, mouse and controllers for the frame. Called once per frame."""
+        numkeys = c_int()
+        keystate = sdl2.SDL_GetKeyboardState(ctypes.byref(numkeys))
+        cls._last_keys, cls._keys = cls._keys, ctypes.string_at(keystate, numkeys.value)
+        cls._mod_state = sdl2.SDL_GetModState()
+
+        x, y = c_int(0), c_int(0)
+        cls._last_buttons, cls._buttons = cls._buttons, sdl2.SDL_GetMouseState(ctypes.byref(x), ctypes.byref(y))
+        cls._mouse_abs, cls._mouse_pos = (x.value, y.value), None
+
+        cls._pads = {}
+        for index, joystick in cls._controllers.items():
+            cls._pads[index] = (
+                tuple(sdl2.SDL_JoystickGetAxis(joystick, i) for i in range(sdl2.SDL_JoystickNumAxes(joystick))),
+                tuple(sdl2.SDL_JoystickGetButton(joystick, i) for i in range(sdl2.SDL_JoystickNumButtons(joystick))),
+                tuple(sdl2.SDL_JoystickGetHat(joystick, i) for i in range(sdl2.SDL_JoystickNumHats(joystick))),
+            )
@@ -2,6 +2,8 @@
 A multi-channel sound system for rubato.
 """
 from __future__ import annotations
+from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
 from os import path as os_path, walk
 from ctypes import c_int, CFUNCTYPE
 from warnings import warn
@@ -11,14 +13,16 @@
 
 from .. import IdError, get_path, Math
 
+if TYPE_CHECKING:
+    from .. import Camera, Vector
+
 if mixer.Mix_OpenAudio(48000, AUDIO_F32, 2, 2048):
     warn("Could not open audio device.")
 
 
 @CFUNCTYPE(None, c_int)
 def channel_finish_callback(channel_num: int):
-    sound = Sound.active_channels.pop(channel_num)
-    sound.channels &= ~(2**channel_num)
+    Sound._finish(channel_num)
 
 
 mixer.Mix_ChannelFinished(channel_finish_callback)
@@ -37,9 +41,22 @@ class Sound:
         * AIFF
         * VOC
 
+    A sound is decoded whole into memory, which keeps playing it cheap but costs several times the size of a compressed
+    file. Use :class:`Music` for long tracks.
+
+    Sounds play on a fixed pool of :attr:`max_channels` channels. When every channel is busy, a new sound takes over the
+    channel of the oldest sound with the lowest priority, as long as that priority is not higher than its own.
+
     Args:
         path: The relative path to the sound file you wish to import.
         sound_name: The name of the sound. Defaults to the name of the file.
+        background: Whether to decode the sound on a worker thread instead of waiting for it. The sound can be used
+            right away, and playing it before it is decoded waits for it. Defaults to False.
+        priority: How important the sound is when there are not enough channels. Defaults to 0.
+        max_instances: How many copies of the sound can play at once. Playing another one stops the oldest.
+            Defaults to 0 (no limit).
+        max_distance: How far from the camera the sound can be heard. Sounds played further away are not played.
+            Defaults to Math.INF.
     """
     STOPPED = 0
     PLAYING = 1
@@ -49,23 +66,90 @@ class Sound:
     """A dictionary housing all the loaded sounds, stored by their name."""
     active_channels: dict[int, Sound] = {}
     """A dictionary housing all the active sounds, stored by their name."""
-
-    def __init__(self, path: str, sound_name: str = ""):
-        self.chunk = mixer.Mix_LoadWAV(path.encode("utf-8"))
-        self.channels = 0
-        self._paused = False
-        self._volume = int(mixer.MIX_MAX_VOLUME / 2)
-
+    workers: int = 2
+    """The number of threads that decode sounds loaded in the background. Read when the first one is loaded."""
+    max_channels: int = 16
+    """The number of sounds that can play at once. Defaults to 16."""
+
+    _pool: ThreadPoolExecutor | None = None
+    _allocated: int = 0
+    """The number of channels allocated in the mixer."""
+    _voices: dict[int, tuple[int, int]] = {}
+    """The priority and the play order of the sound on each busy channel."""
+    _plays: int = 0
+    """The number of times sounds were played, to order them."""
+    _camera: Camera | None = None
+    """The camera of the current scene, that distances are measured from."""
+
+    def __init__(
+        self,
+        path: str,
+        sound_name: str = "",
+        background: bool = False,
+        priority: int = 0,
+        max_instances: int = 0,
+        max_distance: float = Math.INF,
+    ):
         if sound_name == "":
             self.name = path.split("/")[-1].split(".")[0]
         else:
             self.name = sound_name
 
         if self.name in Sound.loaded_sounds:
-            mixer.Mix_FreeChunk(self.chunk)
             raise IdError(f"There is already a sound with the name {self.name}")
+
+        self.chunk = None
+        self.priority: int = priority
+        """How important the sound is when there are not enough channels."""
+        self.max_instances: int = max_instances
+        """How many copies of the sound can play at once. 0 means no limit."""
+        self.max_distance: float = max_distance
+        """How far from the camera the sound can be heard."""
+        self._channels: dict[int, None] = {}
+        """The channels the sound plays on, oldest first."""
+        self._paused = False
+        self._volume = int(mixer.MIX_MAX_VOLUME / 2)
+        self._future: Future | None = None
+
+        if background:
+            if Sound._pool is None:
+                Sound._pool = ThreadPoolExecutor(Sound.workers, "rubato sound")
+            self._future = Sound._pool.submit(mixer.Mix_LoadWAV, path.encode("utf-8"))
         else:
-            Sound.loaded_sounds[self.name] = self
+            self.chunk = mixer.Mix_LoadWAV(path.encode("utf-8"))
+
+        Sound.loaded_sounds[self.name] = self
+
+    @property
+    def ready(self) -> bool:
+        """Whether the sound is decoded and can be played without waiting."""
+        return self._future is None or self._future.done()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes the decoded sound takes in memory, or 0 if it is still being decoded."""
+        if not self.ready:
+            return 0
+        chunk = self.wait()
+        return chunk.contents.alen if chunk else 0
+
+    def wait(self, timeout: float | None = None):
+        """
+        Waits for the sound to be decoded.
+
+        Args:
+            timeout: The longest time to wait for, in seconds. Defaults to waiting for as long as it takes.
+
+        Raises:
+            TimeoutError: The sound was not decoded in time.
+
+        Returns:
+            The decoded SDL_mixer chunk.
+        """
+        if self._future is not None:
+            self.chunk = self._future.result(timeout)
+            self._future = None
+        return self.chunk
 
     @property
     def state(self) -> int:
@@ -81,14 +165,24 @@ def state(self) -> int:
         Returns:
             int: The current state of the sound.
         """
-        if not self.channels:
+        if not self._channels:
             return self.STOPPED
         elif self._paused:
             return self.PAUSED
         else:
             return self.PLAYING
 
-    def play(self, loops: int = 0, init_volume: int = 128):
+    @property
+    def channels(self) -> int:
+        """The channels the sound plays on, as a bitmask."""
+        return sum(1 << channel for channel in self._channels)
+
+    def play(
+        self,
+        loops: int = 0,
+        init_volume: int = 128,
+        pos: Vector | tuple[float, float] | None = None,
+    ) -> int:
         """
         Plays a sound.
 
@@ -97,51 +191,89 @@ def play(self, loops: int = 0, init_volume: int = 128):
                 through. Use -1 to loop forever. Defaults to 0.'
             init_volume: The initail volume of the sound. Defaults to the volume of the sound.
                 range(0, MIX_MAX_VOLUME=>128)
+            pos: Where the sound comes from, in world coordinates. Sounds further than max_distance from the camera
+                are not played. Defaults to None (always played).
+
+        Returns:
+            The channel the sound plays on, or -1 if it was not played.
         """
-        channel: int = mixer.Mix_PlayChannel(-1, self.chunk, loops)
+        camera = Sound._camera
+        if pos is not None and camera is not None and self.max_distance < Math.INF:
+            dx, dy = pos[0] - camera.pos.x, pos[1] - camera.pos.y
+            if dx * dx + dy * dy > self.max_distance * self.max_distance:
+                return -1
+
+        chunk = self.wait()
+        if Sound._allocated != Sound.max_channels:
+            Sound._allocated = mixer.Mix_AllocateChannels(Sound.max_channels)
+
+        target = -1
+        if self.max_instances and len(self._channels) >= self.max_instances:
+            target = next(iter(self._channels))
+            Sound._halt(target)
+
+        channel: int = mixer.Mix_PlayChannel(target, chunk, loops)
 
         if channel == -1:
-            mixer.Mix_AllocateChannels(mixer.Mix_AllocateChannels(-1) + 1)
-            channel: int = mixer.Mix_PlayChannel(-1, self.chunk, loops)
+            # steal the channel of the oldest of the least important sounds, unless they all matter more
+            victim = min(Sound._voices, key=Sound._voices.__getitem__, default=-1)
+            if victim == -1 or Sound._voices[victim][0] > self.priority:
+                return -1
+            Sound._halt(victim)
+            channel = mixer.Mix_PlayChannel(victim, chunk, loops)
+            if channel == -1:
+                return -1
 
         if self._paused:
             mixer.Mix_Pause(channel)
 
+        Sound._plays += 1
         Sound.active_channels[channel] = self
-        self.channels |= 2**channel
+        Sound._voices[channel] = (self.priority, Sound._plays)
+        self._channels[channel] = None
 
         if init_volume:
             self._volume = init_volume
         self.set_volume(self._volume)
+        return channel
 
     def stop(self):
         """
         Stops all instances of the sound.
         """
-        for i in range(self.channels.bit_count()):
-            if self.channels & (1 << i):
-                mixer.Mix_HaltChannel(i)
-                if not self.channels:
-                    return
+        for channel in list(self._channels):
+            Sound._halt(channel)
 
     def pause(self):
         """
         Pauses all instances of the sound.
         """
-        for i in range(self.channels.bit_count()):
-            if self.channels & (1 << i):
-                mixer.Mix_Pause(i)
+        for channel in list(self._channels):
+            mixer.Mix_Pause(channel)
         self._paused = True
 
     def resume(self):
         """
         Resumes all instance of the sound.
         """
-        for i in range(self.channels.bit_count()):
-            if self.channels & (1 << i):
-                mixer.Mix_Resume(i)
+        for channel in list(self._channels):
+            mixer.Mix_Resume(channel)
         self._paused = False
 
+    @staticmethod
+    def _halt(channel: int):
+        """Stops a channel and frees it right away, whether or not the mixer reports it."""
+        mixer.Mix_HaltChannel(channel)
+        Sound._finish(channel)
+
+    @staticmethod
+    def _finish(channel: int):
+        """Frees a channel once its sound finished or was stopped."""
+        sound = Sound.active_channels.pop(channel, None)
+        Sound._voices.pop(channel, None)
+        if sound is not None:
+            sound._channels.pop(channel, None)
+
     def set_volume(self, volume: int):
         """
         Sets the volume of the sound.
@@ -150,7 +282,8 @@ def set_volume(self, volume: int):
             volume: The volume of the sound. range(0, MIX_MAX_VOLUME=>128)
         """
         self._volume = int(Math.clamp(volume, 0, mixer.MIX_MAX_VOLUME))
-        mixer.Mix_VolumeChunk(self.chunk, c_int(self._volume))
+        if self.ready:
+            mixer.Mix_VolumeChunk(self.wait(), c_int(self._volume))
 
     def get_volume(self) -> int:
         """
@@ -162,7 +295,7 @@ def get_volume(self) -> int:
         return self._volume
 
     @classmethod
-    def import_sound_folder(cls, path: str, duplicate_names=False, recursive: bool = True):
+    def import_sound_folder(cls, path: str, duplicate_names=False, recursive: bool = True, background: bool = False):
         """
         Imports a folder of sounds, saving each one in the loaded_sounds
         dictionary by filename.
@@ -172,6 +305,8 @@ def import_sound_folder(cls, path: str, duplicate_names=False, recursive: bool =
             duplicate_names: if you wish to have duplicate names to your sounds,
             it will use the relative and the sound path for the sounds name
             recursive: Whether it will import an animation shallowly or recursively. Defaults to True.
+            background: Whether to decode the sounds on worker threads and return before they are ready.
+                Defaults to False.
         """
         p = get_path(path)
 
@@ -182,7 +317,7 @@ def import_sound_folder(cls, path: str, duplicate_names=False, recursive: bool =
                 path_to_sound = os_path.join(p, sound_path)
                 name = (p + sound_path).split(".")[0] if duplicate_names else sound_path.split(".")[0]
                 try:
-                    cls(path_to_sound, name)
+                    cls(path_to_sound, name, background)
                 except IdError as err:
                     raise Warning(
                         "If you have files with duplicate names you must set duplicate_names"
@@ -195,7 +330,7 @@ def import_sound_folder(cls, path: str, duplicate_names=False, recursive: bool =
                     path_to_sound = os_path.join(p, sound_path)
                     name = (path + "/" + sound_path).split(".")[0] if duplicate_names else sound_path.split(".")[0]
                     try:
-                        cls(path_to_sound, name)
+                        cls(path_to_sound, name, background)
                     except IdError as err:
                         raise Warning(
                             "If you have files with duplicate names you must set duplicate_names"
@@ -220,3 +355,23 @@ def get_sound(cls, sound_name: str) -> Sound:
             return cls.loaded_sounds[sound_name]
         except KeyError as e:
             raise IdError(f"No sound with the name {sound_name} found") from e
+
+    @classmethod
+    def pending(cls) -> int:
+        """
+        The number of loaded sounds still being decoded.
+
+        Returns:
+            The number of sounds that are not ready.
+        """
+        return sum(1 for sound in cls.loaded_sounds.values() if not sound.ready)
+
+    @classmethod
+    def memory(cls) -> int:
+        """
+        The memory taken by the decoded sounds.
+
+        Returns:
+            The total size of the loaded sounds that are ready, in bytes.
+        """
+        return sum(sound.size for sound in cls.loaded_sounds.values())
@@ -0,0 +1,221 @@
+"""
+A static class to measure where the time of each frame goes.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Iterator
+import json
+import time
+
+from . import InitError
+
+
+class _Frame:
+    """The measurements of a single frame."""
+
+    def __init__(self, start: int):
+        self.start: int = start
+        """When the frame started, in nanoseconds."""
+        self.end: int = start
+        """When the frame ended, in nanoseconds."""
+        self.phases: dict[str, float] = {}
+        """The total time spent in each phase, in milliseconds."""
+        self.counters: dict[str, int] = {}
+        """The counters of the frame."""
+        self.spans: list[tuple[str, int, int, int]] = []
+        """Every phase measured, as its name, start and end in nanoseconds, and nesting depth."""
+
+
+# THIS IS A STATIC CLASS
+class Profiler:
+    """
+    Measures how long each phase of a frame takes and counts what happens during it (draw calls, collision pairs,
+    texture uploads...). rubato measures its own phases and you can add yours with :meth:`section`.
+
+    Nothing is recorded unless :attr:`enabled` is True, and a disabled profiler costs one attribute check per phase.
+    """
+
+    enabled: bool = False
+    """Whether frames are being measured. Defaults to False."""
+    overlay: bool = False
+    """Whether to draw the average phase times under the fps counter. Needs enabled to be True. Defaults to False."""
+    history: int = 120
+    """How many of the last frames are kept. Defaults to 120."""
+
+    _frames: list[_Frame] = []
+    _index: int = 0
+    _frame: _Frame | None = None
+    _stack: list[tuple[str, int]] = []
+
+    def __init__(self) -> None:
+        raise InitError(self)
+
+    @classmethod
+    def begin(cls, name: str):
+        """
+        Starts measuring a phase of the current frame. Every call must be matched by a call to :meth:`end`.
+
+        Args:
+            name: The name of the phase. Phases with the same name in a frame are added together.
+        """
+        if cls._frame is not None:
+            cls._stack.append((name, time.perf_counter_ns()))
+
+    @classmethod
+    def end(cls):
+        """Stops measuring the phase started last."""
+        frame = cls._frame
+        if frame is None or not cls._stack:
+            return
+
+        now = time.perf_counter_ns()
+        name, start = cls._stack.pop()
+        frame.phases[name] = frame.phases.get(name, 0) + (now - start) / 1e6
+        frame.spans.append((name, start, now, len(cls._stack)))
+
+    @classmethod
+    @contextmanager
+    def section(cls, name: str) -> Iterator[None]:
+        """
+        Measures the code inside a with statement as a phase of the current frame.
+
+        Args:
+            name: The name of the phase.
+
+        Example:
+            .. code-block:: python
+
+                with rb.Profiler.section("pathfinding"):
+                    find_paths()
+        """
+        cls.begin(name)
+        try:
+            yield
+        finally:
+            cls.end()
+
+    @classmethod
+    def count(cls, name: str, amount: int = 1):
+        """
+        Adds to a counter of the current frame.
+
+        Args:
+            name: The name of the counter.
+            amount: How much to add. Defaults to 1.
+        """
+        frame = cls._frame
+        if frame is not None:
+            frame.counters[name] = frame.counters.get(name, 0) + amount
+
+    @classmethod
+    def frames(cls) -> int:
+        """The number of frames kept."""
+        return len(cls._frames)
+
+    @classmethod
+    def averages(cls) -> dict[str, float]:
+        """
+        The average time spent in each phase over the kept frames, in milliseconds. The whole frame is under "frame".
+
+        Returns:
+            The average times by phase, in the order the phases were first seen.
+        """
+        totals: dict[str, float] = {}
+        for frame in cls._frames:
+            totals["frame"] = totals.get("frame", 0) + (frame.end - frame.start) / 1e6
+            for name, ms in frame.phases.items():
+                totals[name] = totals.get(name, 0) + ms
+        return {name: total / len(cls._frames) for name, total in totals.items()}
+
+    @classmethod
+    def counters(cls) -> dict[str, float]:
+        """
+        The average value of each counter over the kept frames.
+
+        Returns:
+            The average values by counter name.
+        """
+        totals: dict[str, int] = {}
+        for frame in cls._frames:
+            for name, value in frame.counters.items():
+                totals[name] = totals.get(name, 0) + value
+        return {name: total / len(cls._frames) for name, total in totals.items()}
+
+    @classmethod
+    def export(cls, path: str):
+        """
+        Writes the kept frames to a file in the Chrome trace format, which can be opened in chrome://tracing or
+        https://ui.perfetto.dev.
+
+        Args:
+            path: The path of the file to write.
+        """
+        frames = cls._frames[cls._index:] + cls._frames[:cls._index]
+        origin = frames[0].start if frames else 0
+        events = []
+
+        for i, frame in enumerate(frames):
+            events.append(
+                {
+                    "name": "frame",
+                    "ph": "X",
+                    "ts": (frame.start - origin) / 1000,
+                    "dur": (frame.end - frame.start) / 1000,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": {"frame": i},
+                }
+            )
+            for name, start, end, _ in frame.spans:
+                events.append(
+                    {
+                        "name": name,
+                        "ph": "X",
+                        "ts": (start - origin) / 1000,
+                        "dur": (end - start) / 1000,
+                        "pid": 0,
+                        "tid": 0
+                    }
+                )
+            for name, value in frame.counters.items():
+                events.append(
+                    {
+                        "name": name,
+                        "ph": "C",
+                        "ts": (frame.start - origin) / 1000,
+                        "pid": 0,
+                        "args": {name: value}
+                    }
+                )
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    @classmethod
+    def clear(cls):
+        """Forgets every kept frame."""
+        cls._frames.clear()
+        cls._index = 0
+
+    @classmethod
+    def _start_frame(cls):
+        cls._stack.clear()
+        cls._frame = _Frame(time.perf_counter_ns()) if cls.enabled else None
+
+    @classmethod
+    def _end_frame(cls):
+        frame = cls._frame
+        if frame is None:
+            return
+
+        frame.end = time.perf_counter_ns()
+        cls._frame = None
+
+        # the kept frames are a ring, _index being the oldest once it is full. it starts over if history changed
+        if len(cls._frames) > cls.history or (cls._index and len(cls._frames) < cls.history):
+            cls.clear()
+        if len(cls._frames) < cls.history:
+            cls._frames.append(frame)
+        else:
+            cls._frames[cls._index] = frame
+            cls._index = (cls._index + 1) % cls.history
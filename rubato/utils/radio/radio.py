@@ -9,17 +9,22 @@
 :ref:`Go here <api:events>` to see all the events that can be broadcast.
 """
 from __future__ import annotations
-import ctypes
+import time
+from collections import deque
 from typing import Any, Callable
 from contextlib import suppress
 import sdl2
 import cython
 
-from .. import Input, Display, InitError, Time
+from .. import Input, Display, InitError, Time, Profiler
+from ..callbacks import _takes_argument
 from .events import Events, KeyResponse, MouseButtonResponse, MouseMotionResponse, MouseWheelResponse, EventResponse, \
     JoyAxisMotionResponse, JoyButtonResponse, JoyHatMotionResponse, ResizeResponse, JoystickConnectResponse, \
         JoystickDisconnectResponse
 
+_COALESCED = (sdl2.SDL_MOUSEMOTION, sdl2.SDL_MOUSEWHEEL, sdl2.SDL_JOYAXISMOTION)
+"""The SDL events that can be merged by coalescing."""
+
 
 # THIS IS A STATIC CLASS
 class Radio:
@@ -30,6 +35,34 @@ class Radio:
     """
     listeners: dict[str, list[Listener]] = {}
     """A dictionary with all of the active listeners."""
+    coalesce: bool = False
+    """
+    Whether the mouse motion, mouse wheel and joystick axis events of a frame are merged into one event per mouse or
+    axis. A merged mouse motion has the last position and the total movement, a merged mouse wheel has the total
+    scroll, and a merged axis motion has the last value. Only events of the same type in a row are merged, so events
+    of other types, including the other merged ones, keep their order relative to them. Defaults to False.
+    """
+
+    _events = (sdl2.SDL_Event * 64)()
+    """The events taken off the SDL queue at once."""
+    _coalesced: dict[tuple[int, int, int], list] = {}
+    """The fields of the events being merged, by SDL event type, mouse or joystick, and axis."""
+    _coalesced_type: int = 0
+    """The SDL event type of the events being merged."""
+    _batched: dict[Listener, None] = {}
+    """The batch listeners that received responses since they were last called."""
+
+    drain_budget: float = 0.002
+    """
+    The most time spent each frame broadcasting posted events, in seconds. The events left over are broadcast on the
+    next frame, and at least one is broadcast every frame. 0 means that there is no limit. Defaults to 0.002.
+    """
+
+    _posted: dict[int, deque[tuple[str, Any]]] = {}
+    """The posted events waiting to be broadcast, by priority, each in the order they were posted."""
+    _priorities: list[int] = []
+    """The priorities of the posted events, from highest to lowest."""
+    _posted_count: int = 0
 
     def __init__(self) -> None:
         raise InitError(self)
@@ -42,151 +75,220 @@ def _handle(cls) -> bool:
         Returns:
             bool: Whether an SDL Quit event was fired.
         """
-        event = sdl2.SDL_Event()
-
-        while sdl2.SDL_PeepEvents(
-            ctypes.byref(event), 1, sdl2.SDL_GETEVENT, sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT
-        ) > 0:
-            if event.type == sdl2.SDL_QUIT:
-                return True
-            elif event.type == sdl2.SDL_WINDOWEVENT:
-                if event.window.event == sdl2.SDL_WINDOWEVENT_RESIZED:
-                    if Events.RESIZE.value in cls.listeners:
-                        cls.broadcast(
-                            Events.RESIZE,
-                            ResizeResponse(
-                                event.window.timestamp / 1000,
-                                event.window.data1,
-                                event.window.data2,
-                                Display.window_size.x,  # type: ignore
-                                Display.window_size.y,  # type: ignore
-                            )
-                        )
-                    Display.window_size = (
-                        event.window.data1,
-                        event.window.data2,
-                    )
-            elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                key_info, unicode = event.key.keysym, ""
-                with suppress(ValueError):
-                    unicode = chr(key_info.sym)
+        events = cls._events
+        size = len(events)
 
-                if event.type == sdl2.SDL_KEYUP:
-                    event_name = Events.KEYUP
-                else:
-                    event_name = (Events.KEYDOWN, Events.KEYHOLD)[event.key.repeat]
+        # take the events off the queue in batches rather than one call per event
+        while True:
+            count = sdl2.SDL_PeepEvents(events, size, sdl2.SDL_GETEVENT, sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+            for i in range(count):
+                if cls._dispatch(events[i]):
+                    return True
+            if count < size:
+                break
+
+        cls._flush_coalesced()
+        cls._flush_batches()
+        return False
+
+    @classmethod
+    def _dispatch(cls, event: sdl2.SDL_Event) -> bool:
+        """
+        Broadcasts a single SDL event.
+
+        Returns:
+            bool: Whether it was an SDL Quit event.
+        """
+        # coalesced events are sent before the next event of another type, so that listeners see events in order
+        if cls._coalesced and event.type != cls._coalesced_type:
+            cls._flush_coalesced()
+        if event.type in _COALESCED:
+            cls._coalesced_type = event.type
 
-                if event_name.value in cls.listeners:
+        if event.type == sdl2.SDL_QUIT:
+            return True
+        elif event.type == sdl2.SDL_WINDOWEVENT:
+            if event.window.event == sdl2.SDL_WINDOWEVENT_RESIZED:
+                if Events.RESIZE.value in cls.listeners:
                     cls.broadcast(
-                        event_name,
-                        KeyResponse(
-                            event.key.timestamp / 1000,
-                            Input.get_name(key_info.sym),
-                            unicode,
-                            int(key_info.sym),
-                            key_info.mod,
+                        Events.RESIZE,
+                        ResizeResponse(
+                            event.window.timestamp / 1000,
+                            event.window.data1,
+                            event.window.data2,
+                            Display.window_size.x,  # type: ignore
+                            Display.window_size.y,  # type: ignore
                         )
                     )
-            elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
-                if event.type == sdl2.SDL_MOUSEBUTTONUP:
-                    event_name = Events.MOUSEUP
-                else:
-                    event_name = Events.MOUSEDOWN
+                Display.window_size = (
+                    event.window.data1,
+                    event.window.data2,
+                )
+        elif event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
+            key_info, unicode = event.key.keysym, ""
+            with suppress(ValueError):
+                unicode = chr(key_info.sym)
 
-                if event_name.value in cls.listeners:
-                    cls.broadcast(
-                        event_name,
-                        MouseButtonResponse(
-                            event.button.timestamp / 1000,
-                            event.button.button,
-                            event.button.x - Display._half_res[0],
-                            Display._half_res[1] - event.button.y,
-                            event.button.clicks,
-                            event.button.which,
-                        )
+            if event.type == sdl2.SDL_KEYUP:
+                event_name = Events.KEYUP
+            else:
+                event_name = (Events.KEYDOWN, Events.KEYHOLD)[event.key.repeat]
+
+            if event_name.value in cls.listeners:
+                cls.broadcast(
+                    event_name,
+                    KeyResponse(
+                        event.key.timestamp / 1000,
+                        Input.get_name(key_info.sym),
+                        unicode,
+                        int(key_info.sym),
+                        key_info.mod,
                     )
-            elif event.type == sdl2.SDL_MOUSEWHEEL:
-                if Events.MOUSEWHEEL.value in cls.listeners:
+                )
+        elif event.type in (sdl2.SDL_MOUSEBUTTONDOWN, sdl2.SDL_MOUSEBUTTONUP):
+            if event.type == sdl2.SDL_MOUSEBUTTONUP:
+                event_name = Events.MOUSEUP
+            else:
+                event_name = Events.MOUSEDOWN
+
+            if event_name.value in cls.listeners:
+                cls.broadcast(
+                    event_name,
+                    MouseButtonResponse(
+                        event.button.timestamp / 1000,
+                        event.button.button,
+                        event.button.x - Display._half_res[0],
+                        Display._half_res[1] - event.button.y,
+                        event.button.clicks,
+                        event.button.which,
+                    )
+                )
+        elif event.type == sdl2.SDL_MOUSEWHEEL:
+            if Events.MOUSEWHEEL.value in cls.listeners:
+                wheel = event.wheel
+                if cls.coalesce:
+                    key = (sdl2.SDL_MOUSEWHEEL, wheel.which, 0)
+                    last = cls._coalesced.get(key)
+                    if last is not None:
+                        cls._coalesced[key] = [
+                            wheel.timestamp / 1000, last[1] + wheel.preciseX, last[2] - wheel.preciseY, wheel.which
+                        ]
+                        return False
+                    cls._coalesced[key] = [wheel.timestamp / 1000, wheel.preciseX, -wheel.preciseY, wheel.which]
+                else:
                     cls.broadcast(
                         Events.MOUSEWHEEL,
-                        MouseWheelResponse(
-                            event.wheel.timestamp / 1000,
-                            event.wheel.preciseX,
-                            -event.wheel.preciseY,
-                            event.wheel.which,
-                        )
+                        MouseWheelResponse(wheel.timestamp / 1000, wheel.preciseX, -wheel.preciseY, wheel.which),
                     )
-            elif event.type == sdl2.SDL_MOUSEMOTION:
-                if Events.MOUSEMOTION.value in cls.listeners:
+        elif event.type == sdl2.SDL_MOUSEMOTION:
+            if Events.MOUSEMOTION.value in cls.listeners:
+                motion = event.motion
+                x, y = motion.x - Display._half_res[0], Display._half_res[1] - motion.y
+                if cls.coalesce:
+                    key = (sdl2.SDL_MOUSEMOTION, motion.which, 0)
+                    last = cls._coalesced.get(key)
+                    if last is not None:
+                        cls._coalesced[key] = [
+                            motion.timestamp / 1000, x, y, last[3] + motion.xrel, last[4] - motion.yrel, motion.which
+                        ]
+                        return False
+                    cls._coalesced[key] = [motion.timestamp / 1000, x, y, motion.xrel, -motion.yrel, motion.which]
+                else:
                     cls.broadcast(
                         Events.MOUSEMOTION,
-                        MouseMotionResponse(
-                            event.motion.timestamp / 1000,
-                            event.motion.x - Display._half_res[0],
-                            Display._half_res[1] - event.motion.y,
-                            event.motion.xrel,
-                            -event.motion.yrel,
-                            event.motion.which,
-                        )
+                        MouseMotionResponse(motion.timestamp / 1000, x, y, motion.xrel, -motion.yrel, motion.which),
                     )
-            elif event.type == sdl2.SDL_JOYDEVICEADDED:
-                Input._controllers[event.jdevice.which] = sdl2.SDL_JoystickOpen(event.jdevice.which)
-                if Events.JOYSTICKCONNECT.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYSTICKCONNECT,
-                        JoystickConnectResponse(event.jdevice.timestamp / 1000, event.jdevice.which),
-                    )
-            elif event.type == sdl2.SDL_JOYDEVICEREMOVED:
-                sdl2.SDL_JoystickClose(Input._controllers[event.jdevice.which])
-                del Input._controllers[event.jdevice.which]
-                if Events.JOYSTICKDISCONNECT.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYSTICKDISCONNECT,
-                        JoystickDisconnectResponse(event.jdevice.timestamp / 1000, event.jdevice.which),
-                    )
-            elif event.type == sdl2.SDL_JOYAXISMOTION:
-                mag: float = event.jaxis.value / Input._joystick_max
-                if Events.JOYAXISMOTION.value in cls.listeners:
+        elif event.type == sdl2.SDL_JOYDEVICEADDED:
+            Input._controllers[event.jdevice.which] = sdl2.SDL_JoystickOpen(event.jdevice.which)
+            if Events.JOYSTICKCONNECT.value in cls.listeners:
+                cls.broadcast(
+                    Events.JOYSTICKCONNECT,
+                    JoystickConnectResponse(event.jdevice.timestamp / 1000, event.jdevice.which),
+                )
+        elif event.type == sdl2.SDL_JOYDEVICEREMOVED:
+            sdl2.SDL_JoystickClose(Input._controllers[event.jdevice.which])
+            del Input._controllers[event.jdevice.which]
+            if Events.JOYSTICKDISCONNECT.value in cls.listeners:
+                cls.broadcast(
+                    Events.JOYSTICKDISCONNECT,
+                    JoystickDisconnectResponse(event.jdevice.timestamp / 1000, event.jdevice.which),
+                )
+        elif event.type == sdl2.SDL_JOYAXISMOTION:
+            if Events.JOYAXISMOTION.value in cls.listeners:
+                jaxis = event.jaxis
+                if cls.coalesce:
+                    # only the last position of the axis matters
+                    cls._coalesced[(sdl2.SDL_JOYAXISMOTION, jaxis.which, jaxis.axis)] = [
+                        jaxis.timestamp / 1000, jaxis.which, jaxis.axis, jaxis.value
+                    ]
+                else:
+                    mag: float = jaxis.value / Input._joystick_max
                     cls.broadcast(
                         Events.JOYAXISMOTION,
                         JoyAxisMotionResponse(
-                            event.jaxis.timestamp / 1000,
-                            event.jaxis.which,
-                            event.jaxis.axis,
-                            mag,
-                            Input.axis_centered(mag),
-                        )
+                            jaxis.timestamp / 1000, jaxis.which, jaxis.axis, mag, Input.axis_centered(mag)
+                        ),
                     )
-            elif event.type in (sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP):
-                if event.type == sdl2.SDL_JOYBUTTONUP:
-                    event_name = Events.JOYBUTTONUP
-                else:
-                    event_name = Events.JOYBUTTONDOWN
+        elif event.type in (sdl2.SDL_JOYBUTTONDOWN, sdl2.SDL_JOYBUTTONUP):
+            if event.type == sdl2.SDL_JOYBUTTONUP:
+                event_name = Events.JOYBUTTONUP
+            else:
+                event_name = Events.JOYBUTTONDOWN
 
-                if event_name.value in cls.listeners:
-                    cls.broadcast(
-                        event_name,
-                        JoyButtonResponse(
-                            event.jbutton.timestamp / 1000,
-                            event.jbutton.which,
-                            event.jbutton.button,
-                        )
+            if event_name.value in cls.listeners:
+                cls.broadcast(
+                    event_name,
+                    JoyButtonResponse(
+                        event.jbutton.timestamp / 1000,
+                        event.jbutton.which,
+                        event.jbutton.button,
                     )
-            elif event.type == sdl2.SDL_JOYHATMOTION:
-                if Events.JOYHATMOTION.value in cls.listeners:
-                    cls.broadcast(
-                        Events.JOYHATMOTION,
-                        JoyHatMotionResponse(
-                            event.jhat.timestamp / 1000,
-                            event.jhat.which,
-                            event.jhat.hat,
-                            event.jhat.value,
-                            Input.translate_hat(event.jhat.value),
-                        )
+                )
+        elif event.type == sdl2.SDL_JOYHATMOTION:
+            if Events.JOYHATMOTION.value in cls.listeners:
+                cls.broadcast(
+                    Events.JOYHATMOTION,
+                    JoyHatMotionResponse(
+                        event.jhat.timestamp / 1000,
+                        event.jhat.which,
+                        event.jhat.hat,
+                        event.jhat.value,
+                        Input.translate_hat(event.jhat.value),
                     )
+                )
 
         return False
 
+    @classmethod
+    def _flush_coalesced(cls):
+        """Broadcasts the events merged by coalescing."""
+        if not cls._coalesced:
+            return
+
+        coalesced, cls._coalesced = cls._coalesced, {}
+        for key, fields in coalesced.items():
+            if key[0] == sdl2.SDL_MOUSEMOTION:
+                cls.broadcast(Events.MOUSEMOTION, MouseMotionResponse(*fields))
+            elif key[0] == sdl2.SDL_MOUSEWHEEL:
+                cls.broadcast(Events.MOUSEWHEEL, MouseWheelResponse(*fields))
+            else:
+                timestamp, which, axis, value = fields
+                mag: float = value / Input._joystick_max
+                cls.broadcast(
+                    Events.JOYAXISMOTION,
+                    JoyAxisMotionResponse(timestamp, which, axis, mag, Input.axis_centered(mag)),
+                )
+
+    @classmethod
+    def _flush_batches(cls):
+        """Calls the batch listeners with the responses they received since they were last called."""
+        if not cls._batched:
+            return
+
+        batched, cls._batched = cls._batched, {}
+        for listener in batched:
+            listener._deliver()
+
     @classmethod
     def broadcast(cls, event: str | Events, params: Any | None = None):
         """
@@ -197,20 +299,98 @@ def broadcast(cls, event: str | Events, params: Any | None = None):
             params: The event parameters (usually a dictionary). Defaults to None.
         """
         # pylint: disable=isinstance-second-argument-not-valid-type
-        for listener in cls.listeners.get(event.value if isinstance(event, Events) else event, []):
-            listener._ping(params or EventResponse(Time.now()))
+        listeners = cls.listeners.get(event.value if isinstance(event, Events) else event)
+        if not listeners:
+            return
+
+        params = params or EventResponse(Time.now())
+        for listener in listeners:
+            listener._ping(params)
+
+    @classmethod
+    def post(cls, event: str | Events, params: Any | None = None, priority: int = 0):
+        """
+        Queues an event to be broadcast at the start of a later frame, right after the SDL events are handled.
+        Unlike :meth:`broadcast`, the listeners are not called from the middle of the code posting the event, which
+        makes posting safe from callbacks like on_collide. Events posted by the listeners of posted events are
+        broadcast on the next frame.
+
+        Args:
+            event: The event key to broadcast.
+            params: The event parameters (usually a dictionary). Defaults to None.
+            priority: The priority of the event. Events with a higher priority are broadcast first and events with
+                the same priority are broadcast in the order they were posted. Defaults to 0.
+        """
+        # pylint: disable=isinstance-second-argument-not-valid-type
+        key = event.value if isinstance(event, Events) else event
+        if params is None and key in cls.listeners:
+            params = EventResponse(Time.now())
+
+        posted = cls._posted.get(priority)
+        if posted is None:
+            posted = cls._posted[priority] = deque()
+            cls._priorities = sorted(cls._posted, reverse=True)
+        posted.append((key, params))
+        cls._posted_count += 1
+
+    @classmethod
+    def pending(cls) -> int:
+        """The number of posted events waiting to be broadcast."""
+        return cls._posted_count
 
     @classmethod
-    def listen(cls, event: str | Events, func: Callable[[], None] | Callable[[Any], None]):
+    def _drain(cls):
+        """Broadcasts the posted events until the budget of the frame is spent."""
+        if not cls._posted_count:
+            return
+
+        start = time.perf_counter()
+        budget = cls.drain_budget
+        profile = Profiler.enabled  # the phase names are only built when something records them
+        sent = 0
+
+        # only the events posted before now are sent, the ones their listeners post wait for the next frame
+        for priority, count in [(p, len(cls._posted[p])) for p in cls._priorities]:
+            posted = cls._posted[priority]
+            for _ in range(count):
+                if budget and sent and time.perf_counter() - start >= budget:
+                    Profiler.count("posted events", sent)
+                    return
+
+                key, params = posted.popleft()
+                cls._posted_count -= 1
+                sent += 1
+
+                if not profile:
+                    cls.broadcast(key, params)
+                    continue
+
+                Profiler.begin(f"event {key}")
+                try:
+                    cls.broadcast(key, params)
+                finally:
+                    Profiler.end()
+
+        Profiler.count("posted events", sent)
+
+    @classmethod
+    def listen(
+        cls,
+        event: str | Events,
+        func: Callable[[], None] | Callable[[Any], None] | Callable[[list[Any]], None],
+        batch: bool = False,
+    ):
         """
         Creates an event listener and registers it.
 
         Args:
             event: The event key to listen for.
             func: The function to run once the event is broadcast. It may take in an EventResponse as an argument.
+            batch: Whether to call the function once per frame, after the SDL events are handled, with the list of
+                every response broadcast since its last call. Defaults to False.
         """
         # pylint: disable=isinstance-second-argument-not-valid-type
-        return cls.register(Listener(event.value if isinstance(event, Events) else event, func))
+        return cls.register(Listener(event.value if isinstance(event, Events) else event, func, batch))
 
     @classmethod
     def register(cls, listener: Listener):
@@ -243,18 +423,35 @@ class Listener:
     Args:
         event: The event key to listen for.
         callback: The function to run once the event is broadcast.
+        batch: Whether the callback is called once per frame with the list of responses. Defaults to False.
     """
     event: str = cython.declare(str, visibility="public")  # type: ignore
     """The event descriptor"""
-    callback: Callable = cython.declare(object, visibility="public")  # type: ignore
-    """The function called when the event occurs"""
     registered: cython.bint = cython.declare(cython.bint, visibility="public")  # type: ignore
     """Describes whether the listener is registered"""
+    batch: cython.bint = cython.declare(cython.bint, visibility="public")  # type: ignore
+    """Whether the callback is called once per frame with the list of responses broadcast since its last call"""
+    _callback: Callable = cython.declare(object)  # type: ignore
+    _takes_params: cython.bint = cython.declare(cython.bint)  # type: ignore
+    _responses: list = cython.declare(list)  # type: ignore
 
-    def __init__(self, event: str, callback: Callable):
+    def __init__(self, event: str, callback: Callable, batch: bool = False):
         self.event = event
         self.callback = callback
         self.registered = False
+        self.batch = batch
+        self._responses = []
+
+    @property
+    def callback(self) -> Callable:
+        """The function called when the event occurs"""
+        return self._callback
+
+    @callback.setter
+    def callback(self, callback: Callable):
+        # whether to pass the event parameters is decided once here rather than on every call
+        self._callback = callback
+        self._takes_params = _takes_argument(callback)
 
     def _ping(self, params: Any):
         """
@@ -263,10 +460,19 @@ def _ping(self, params: Any):
         Args:
             params: The event parameters (usually a dictionary)
         """
-        try:
-            self.callback(params)  # type: ignore
-        except TypeError:
-            self.callback()  # type: ignore
+        if self.batch:
+            self._responses.append(params)
+            Radio._batched[self] = None
+        elif self._takes_params:
+            self._callback(params)
+        else:
+            self._callback()
+
+    def _deliver(self):
+        """Calls the callback of this batch listener with the responses it received."""
+        responses, self._responses = self._responses, []
+        if responses and self.registered:
+            self._callback(responses)
 
     def remove(self):
         """
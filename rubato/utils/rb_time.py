@@ -1,11 +1,16 @@
 """
 A static class to monitor time and to call functions at delay/interval.
 """
+from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Callable
-import heapq
+from typing import Callable, TYPE_CHECKING
+import math
 import sdl2
 from . import InitError
+from .callbacks import _takes_argument
+
+if TYPE_CHECKING:
+    from .. import Scene, GameObject
 
 
 @dataclass(order=True)
@@ -16,19 +21,34 @@ class DelayedTask:
     Args:
         task: The task to invoke.
         delay: The number of seconds to wait before invoking the task.
+        owner: The scene or gameobject that owns the task. Defaults to None.
+        pausable: Whether the task runs on game time, which stops while the game is paused. Defaults to False.
     """
     task: Callable[[], None] = field(compare=False)
     """The task to run."""
     delay: float
     """The delay until the task is run, in seconds."""
+    owner: Scene | GameObject | None = field(default=None, compare=False)
+    """
+    The scene or gameobject that owns the task. The task runs on the time of its owner, which only passes while the
+    owner updates, and is stopped when the owner is removed from its scene.
+    """
+    pausable: bool = field(default=False, compare=False)
+    """Whether the task runs on game time, which stops while the game is paused. Tasks with an owner always do."""
     is_stopped: bool = field(init=False, default=False, compare=False)
     """Whether the DelayedTask is stopped."""
     next_run: float = field(init=False, compare=False)
-    """The time at which the task will be run next, in seconds."""
+    """The time at which the task will be run next, in seconds of the clock it runs on."""
+
+    _wheel: _TimingWheel | None = field(init=False, default=None, compare=False, repr=False)
+    _slot: dict | None = field(init=False, default=None, compare=False, repr=False)
+    _tick: int = field(init=False, default=0, compare=False, repr=False)
 
     def stop(self):
-        """Stop the DelayedTask from invoking."""
+        """Stop the DelayedTask from invoking. It is removed from the schedule right away."""
         self.is_stopped = True
+        if self._wheel is not None:
+            self._wheel.remove(self)
 
 
 @dataclass(order=True)
@@ -39,19 +59,34 @@ class FramesTask:
     Args:
         task: The task to invoke.
         delay: The number of frames to wait before invoking the task.
+        owner: The scene or gameobject that owns the task. Defaults to None.
+        pausable: Whether the task runs on game time, which stops while the game is paused. Defaults to False.
     """
     task: Callable[[], None] = field(compare=False)
     """The task to run."""
     delay: int
     """The delay until the task is run, in frames."""
+    owner: Scene | GameObject | None = field(default=None, compare=False)
+    """
+    The scene or gameobject that owns the task. The task runs on the time of its owner, which only passes while the
+    owner updates, and is stopped when the owner is removed from its scene.
+    """
+    pausable: bool = field(default=False, compare=False)
+    """Whether the task runs on game time, which stops while the game is paused. Tasks with an owner always do."""
     is_stopped: bool = field(init=False, default=False, compare=False)
     """Whether the FramesTask is stopped."""
     next_run: int = field(init=False, compare=False)
-    """The frame at which the task will be run next."""
+    """The frame at which the task will be run next, counted by the clock it runs on."""
+
+    _wheel: _TimingWheel | None = field(init=False, default=None, compare=False, repr=False)
+    _slot: dict | None = field(init=False, default=None, compare=False, repr=False)
+    _tick: int = field(init=False, default=0, compare=False, repr=False)
 
     def stop(self):
-        """Stop the FramesTask from invoking."""
+        """Stop the FramesTask from invoking. It is removed from the schedule right away."""
         self.is_stopped = True
+        if self._wheel is not None:
+            self._wheel.remove(self)
 
 
 @dataclass(order=True)
@@ -63,6 +98,8 @@ class RecurrentTask:
         task: The task to invoke.
         interval: The number of seconds between task invocations.
         delay: The number of seconds to wait before starting the invocations.
+        owner: The scene or gameobject that owns the task. Defaults to None.
+        pausable: Whether the task runs on game time, which stops while the game is paused. Defaults to False.
     """
     task: Callable[[], None] | Callable[["RecurrentTask"], None] = field(compare=False)
     """The task to run."""
@@ -70,14 +107,252 @@ class RecurrentTask:
     """The interval between task invocations, in seconds."""
     delay: float = field(default=0)
     """The initial delay until the task is run, in seconds."""
+    owner: Scene | GameObject | None = field(default=None, compare=False)
+    """
+    The scene or gameobject that owns the task. The task runs on the time of its owner, which only passes while the
+    owner updates, and is stopped when the owner is removed from its scene.
+    """
+    pausable: bool = field(default=False, compare=False)
+    """Whether the task runs on game time, which stops while the game is paused. Tasks with an owner always do."""
     is_stopped: bool = field(init=False, default=False, compare=False)
     """Whether the RecurrentTask is stopped."""
     next_run: float = field(init=False, compare=False)
-    """The time at which the task will be run next, in seconds."""
+    """The time at which the task will be run next, in seconds of the clock it runs on."""
+
+    _wheel: _TimingWheel | None = field(init=False, default=None, compare=False, repr=False)
+    _slot: dict | None = field(init=False, default=None, compare=False, repr=False)
+    _tick: int = field(init=False, default=0, compare=False, repr=False)
+    _takes_task: bool = field(init=False, default=False, compare=False, repr=False)
 
     def stop(self):
-        """Stop the RecurrentTask from invoking."""
+        """Stop the RecurrentTask from invoking. It is removed from the schedule right away."""
         self.is_stopped = True
+        if self._wheel is not None:
+            self._wheel.remove(self)
+
+
+class _TimingWheel:
+    """
+    A hierarchical timing wheel. Each level is a ring of slots holding the tasks due in one span of ticks, every slot
+    of a level spanning a whole ring of the level below. Adding and removing a task is O(1), and advancing only looks
+    at the slots of the ticks that passed, moving the tasks of a higher slot down when the level below wraps around.
+    """
+
+    bits: int = 6
+    """The number of bits of a tick indexing each level, so each level has 2 ** bits slots."""
+    levels: int = 4
+    """The number of levels. Tasks further away than 2 ** (bits * levels) ticks wait in the last slot."""
+
+    def __init__(self):
+        self.slots: list[list[dict[int, DelayedTask | FramesTask | RecurrentTask]]] = [
+            [{} for _ in range(1 << self.bits)] for _ in range(self.levels)
+        ]
+        """The slots of each level, holding tasks by id."""
+        self.held: dict[int, DelayedTask | FramesTask | RecurrentTask] = {}
+        """The tasks added for ticks that were already processed, returned by the next advance."""
+        self.tick: int = 0
+        """The next tick to process."""
+        self.count: int = 0
+        """The number of tasks in the wheel."""
+        self.counts: list[int] = [0] * self.levels
+        """The number of tasks in each level, used to skip over the ticks where nothing happens."""
+        self.wake: int = 0
+        """A tick before which no slot holding tasks is reached."""
+        self._levels: dict[int, int] = {id(slot): level for level, ring in enumerate(self.slots) for slot in ring}
+        """The level of each slot, by id."""
+
+    def add(self, task: DelayedTask | FramesTask | RecurrentTask, tick: int):
+        """Adds a task due at the given tick. Tasks for ticks already processed are returned by the next advance."""
+        if task._wheel is not None:
+            task._wheel.remove(task)
+
+        task._tick = tick
+        delta = tick - self.tick
+        if delta < 0:
+            slot = self.held
+        else:
+            bits = self.bits
+            level = min(delta.bit_length() - 1, bits * self.levels - 1) // bits if delta else 0
+            if level == self.levels - 1 and delta >> (bits * self.levels):
+                delta = (1 << (bits * self.levels)) - 1
+            due = self.tick + delta
+            slot = self.slots[level][(due >> (bits * level)) & ((1 << bits) - 1)]
+            self.counts[level] += 1
+            self.wake = min(self.wake, (due >> (bits * level)) << (bits * level))
+
+        slot[id(task)] = task
+        task._wheel = self
+        task._slot = slot
+        self.count += 1
+
+    def remove(self, task: DelayedTask | FramesTask | RecurrentTask):
+        """Removes a task from the wheel."""
+        slot = task._slot
+        if slot is not None:
+            del slot[id(task)]
+            self.count -= 1
+            if slot is not self.held:
+                self.counts[self._levels[id(slot)]] -= 1
+        task._wheel = None
+        task._slot = None
+
+    def advance(self, tick: int) -> list[DelayedTask | FramesTask | RecurrentTask]:
+        """
+        Processes every tick up to and including the given one.
+
+        Returns:
+            The tasks that came due, in the order of their ticks. They are no longer in the wheel.
+        """
+        due = self._take(self.held) if self.held else []
+        if tick < self.wake or not self.count:
+            self.tick = max(self.tick, tick + 1)
+            return due
+
+        bits = self.bits
+        mask = (1 << bits) - 1
+
+        while self.tick <= tick:
+            # nothing happens before the next tick where the lowest level holding tasks moves them down
+            if not self.counts[0]:
+                if not self.count:
+                    self.tick = tick + 1
+                    break
+                level = 1
+                while level < self.levels - 1 and not self.counts[level]:
+                    level += 1
+                span = bits * level
+                wake = ((self.tick + (1 << span) - 1) >> span) << span
+                if wake > tick:
+                    self.wake = wake
+                    self.tick = tick + 1
+                    break
+                self.tick = wake
+
+            current = self.tick
+            level = 1
+            while level < self.levels and not (current >> (bits * (level - 1))) & mask:
+                for task in self._take(self.slots[level][(current >> (bits * level)) & mask], level):
+                    self.add(task, task._tick)
+                level += 1
+
+            self.tick = current + 1
+            for task in self._take(self.slots[0][current & mask], 0):
+                if task._tick > current:  # it was further away than the wheel reaches
+                    self.add(task, task._tick)
+                else:
+                    due.append(task)
+
+        return due
+
+    def clear(self):
+        """Stops every task in the wheel."""
+        for task in self._take(self.held):
+            task.is_stopped = True
+        for level, ring in enumerate(self.slots):
+            for slot in ring:
+                if slot:
+                    for task in self._take(slot, level):
+                        task.is_stopped = True
+
+    def _take(self, slot: dict, level: int = -1) -> list[DelayedTask | FramesTask | RecurrentTask]:
+        """Empties a slot of the given level, or the held tasks if no level is given, returning its tasks."""
+        tasks = list(slot.values())
+        slot.clear()
+        self.count -= len(tasks)
+        if level >= 0:
+            self.counts[level] -= len(tasks)
+        for task in tasks:
+            task._wheel = None
+            task._slot = None
+        return tasks
+
+
+class _Clock:
+    """
+    A clock and the tasks scheduled on it. Time keeps one for real time and one for game time, and each scene or
+    gameobject that owns tasks gets its own.
+    """
+
+    def __init__(self):
+        self.now: float = 0
+        """The time of the clock, in milliseconds."""
+        self.frames: int = 0
+        """The number of frames the clock has run for."""
+        self.frame_wheel: _TimingWheel = _TimingWheel()
+        """The FramesTasks, by frame."""
+        self.task_wheel: _TimingWheel = _TimingWheel()
+        """The DelayedTasks, by millisecond."""
+        self.recurrent_wheel: _TimingWheel = _TimingWheel()
+        """The RecurrentTasks, by millisecond."""
+
+    def schedule(self, task: DelayedTask | FramesTask | RecurrentTask, now: float):
+        """Schedules a task from the given time of the clock, in milliseconds."""
+        if isinstance(task, DelayedTask):
+            task.next_run = now / 1000 + task.delay
+            self.task_wheel.add(task, int(task.next_run * 1000))
+        elif isinstance(task, FramesTask):
+            task.next_run = self.frames + task.delay
+            self.frame_wheel.add(task, task.next_run)
+        elif isinstance(task, RecurrentTask):
+            task.next_run = now / 1000 + task.delay
+            task._takes_task = _takes_argument(task.task)
+            self.recurrent_wheel.add(task, int(task.next_run * 1000))
+        else:
+            raise TypeError("Task argument must of of type DelayedTask, FramesTask or RecurrentTask.")
+
+    def advance(self, now: float):
+        """
+        Moves the clock to the given time, in milliseconds, and runs every task that came due in one pass.
+        """
+        self.now = now
+        self.frames += 1
+        tick = int(now)
+
+        # wheels that cannot have tasks due are not advanced. they catch up on the ticks they skipped later
+        wheel = self.frame_wheel
+        if wheel.held or (wheel.count and self.frames >= wheel.wake):
+            # a task stopped or scheduled again by an earlier task of the frame is skipped
+            for frame_task in wheel.advance(self.frames):
+                if not frame_task.is_stopped and frame_task._wheel is None:
+                    frame_task.task()
+
+        wheel = self.task_wheel
+        other = self.recurrent_wheel
+        if not (wheel.held or other.held) and not (wheel.count and tick >= wheel.wake) and not (
+            other.count and tick >= other.wake
+        ):
+            return
+
+        # tasks are in the slot of the millisecond they are due in, so the ones of this millisecond might not be yet.
+        # those are added again and come back on the next frame
+        seconds = now / 1000
+
+        for delayed_task in self.task_wheel.advance(tick):
+            if delayed_task.is_stopped or delayed_task._wheel is not None:
+                continue
+            if delayed_task.next_run <= seconds:
+                delayed_task.task()
+            else:
+                self.task_wheel.add(delayed_task, tick)
+
+        for recurrent_task in self.recurrent_wheel.advance(tick):
+            if recurrent_task._wheel is not None:
+                continue
+            while not recurrent_task.is_stopped and recurrent_task.next_run <= seconds:
+                if recurrent_task._takes_task:
+                    recurrent_task.task(recurrent_task)  # type: ignore
+                else:
+                    recurrent_task.task()  # type: ignore
+                recurrent_task.next_run += recurrent_task.interval
+
+            if not recurrent_task.is_stopped:
+                self.recurrent_wheel.add(recurrent_task, int(recurrent_task.next_run * 1000))
+
+    def clear(self):
+        """Stops every task on the clock."""
+        self.frame_wheel.clear()
+        self.task_wheel.clear()
+        self.recurrent_wheel.clear()
 
 
 # THIS IS A STATIC CLASS
@@ -93,20 +368,40 @@ class Time:
     fps = 60
     """The fps estimate using the last frame."""
 
-    _frame_queue: list[FramesTask] = []
-    _task_queue: list[DelayedTask] = []
-    _recurrent_queue: list[RecurrentTask] = []
+    _clock: _Clock = _Clock()
+    """The tasks that run on real time."""
+    _game_clock: _Clock = _Clock()
+    """The tasks that run on game time, which stops while the game is paused."""
 
     _next_queue: list[Callable] = []
 
-    _delta_time: int = 1
-    _normal_delta: int = 0
-    _frame_start: int = 0
+    _delta_time: float = 1
+    _normal_delta: float = 0
+    _frame_start: float = 0
+
+    _counter_start: int = sdl2.SDL_GetPerformanceCounter()
+    _counter_freq: int = sdl2.SDL_GetPerformanceFrequency()
 
     _physics_counter: float = 0
 
-    _past_fps = [0] * 120
-    _fps_index: int = 0
+    max_substeps: int = 5
+    """
+    The most fixed updates to run in a single frame. When a frame takes longer than that many fixed updates, the
+    extra time is dropped so that the physics slows down instead of falling further behind every frame.
+    0 means that there is no limit. Defaults to 5.
+    """
+
+    _frame_times: list[float] = [0.0] * 240
+    """The durations of the last frames, in milliseconds."""
+    _frame_index: int = 0
+    _frame_count: int = 0
+
+    spin_time: float = 0.002
+    """
+    How long before the end of a frame capped by target_fps the game stops sleeping and waits actively, in seconds.
+    Sleeping can overshoot by a millisecond or more, so waking up early keeps frame times steady at the cost of some
+    CPU time. Defaults to 0.002.
+    """
 
     target_fps = 0
     """The fps that the game should try to run at. 0 means that the game's fps will not be capped. Defaults to 0."""
@@ -123,27 +418,81 @@ def delta_time(cls) -> float:
         """The number of seconds between the last frame and the current frame (get-only)."""
         return cls._delta_time / 1000
 
+    @classmethod
+    @property
+    def game_time(cls) -> float:
+        """
+        The time the game has been running for, in seconds, not counting the time spent paused (get-only).
+        It moves forward once per frame.
+        """
+        return cls._game_clock.now / 1000
+
+    @classmethod
+    @property
+    def fixed_alpha(cls) -> float:
+        """
+        How far the current frame is between the last fixed update and the next one, from 0 to 1 (get-only).
+        Used to draw rigidbodies between their last two physics positions.
+        """
+        return min(cls._physics_counter / cls.fixed_delta, 1)
+
     @classmethod
     def smooth_fps(cls) -> int:
-        """The average fps over the past 120 frames."""
-        return int(sum(cls._past_fps) / len(cls._past_fps))
+        """The average fps over the past 240 frames."""
+        total = sum(cls._frame_times)
+        return int(1000 * cls._frame_count / total) if total else 0
+
+    @classmethod
+    def frame_time_percentile(cls, percent: float) -> float:
+        """
+        The duration of a frame that the given percent of the past 240 frames did not exceed. For example, the 99th
+        percentile is the frame time the game only goes over once every 100 frames.
+
+        Args:
+            percent: The percentile, between 0 and 100.
+
+        Returns:
+            The frame time, in seconds. 0 if no frame has ended yet.
+        """
+        if not cls._frame_count:
+            return 0
+        times = sorted(cls._frame_times[:cls._frame_count])
+        index = min(max(math.ceil(percent / 100 * len(times)) - 1, 0), len(times) - 1)
+        return times[index] / 1000
+
+    @classmethod
+    def frame_time_histogram(cls, bucket: float = 0.001) -> dict[float, int]:
+        """
+        Counts how many of the past 240 frames took each range of time.
+
+        Args:
+            bucket: The width of each range, in seconds. Defaults to 0.001.
+
+        Returns:
+            The number of frames by the start of their range, in seconds, from the shortest frames to the longest.
+        """
+        counts: dict[float, int] = {}
+        for time in cls._frame_times[:cls._frame_count]:
+            start = round(math.floor(time / 1000 / bucket + 1e-9) * bucket, 9)  # keep float error out of the keys
+            counts[start] = counts.get(start, 0) + 1
+        return dict(sorted(counts.items()))
 
     @classmethod
     def frame_start(cls) -> float:
         """
         Time from the start of the game to the start of the current frame, in seconds.
         """
-        return cls._frame_start * 1000
+        return cls._frame_start / 1000
 
     @classmethod
-    def _now(cls) -> int:
-        """The time since the start of the game, in milliseconds."""
-        return sdl2.SDL_GetTicks64()
+    def _now(cls) -> float:
+        """The time since the start of the game, in milliseconds, from the high resolution counter."""
+        return (sdl2.SDL_GetPerformanceCounter() - cls._counter_start) * 1000 / cls._counter_freq
 
     @classmethod
     def now(cls) -> float:
         """The time since the start of the game, in seconds."""
-        return sdl2.SDL_GetTicks64() / 1000
+        return cls._now() / 1000
 
     @classmethod
     def _start_frame(cls):
@@ -151,15 +500,19 @@ def _start_frame(cls):
 
     @classmethod
     def _end_frame(cls):
+        now = cls._now()
+
         if Time.target_fps != 0:
-            delay = cls._normal_delta + cls._frame_start - cls._now()
-            if delay > 0:
-                sdl2.SDL_Delay(delay)
+            end = cls._frame_start + cls._normal_delta
 
-        while cls._now() == cls._frame_start:
-            sdl2.SDL_Delay(1)
+            # sleep for most of the wait, then spin for the rest since sleeping is not precise
+            sleep = int(end - now - cls.spin_time * 1000)
+            if sleep > 0:
+                sdl2.SDL_Delay(sleep)
+            while now < end:
+                now = cls._now()
 
-        cls._delta_time = cls._now() - cls._frame_start
+        cls._delta_time = now - cls._frame_start
 
     @classmethod
     def next_frame(cls, func: Callable[[], None]):
@@ -172,33 +525,64 @@ def next_frame(cls, func: Callable[[], None]):
         cls._next_queue.append(func)
 
     @classmethod
-    def delayed_frames(cls, task: Callable[[], None], delay: int):
+    def delayed_frames(
+        cls,
+        task: Callable[[], None],
+        delay: int,
+        owner: Scene | GameObject | None = None,
+        pausable: bool = False,
+    ) -> FramesTask:
         """
         Calls the function func to be called at a later frame.
 
         Args:
             task: The function to call
             delay: The number of frames to wait.
-        """
+            owner: The scene or gameobject that owns the task. Only the frames in which it updates are counted.
+                Defaults to None.
+            pausable: Whether frames in which the game is paused are skipped. Defaults to False.
 
-        cls.schedule(FramesTask(task, delay))
+        Returns:
+            The scheduled task, which can be stopped.
+        """
+        frames_task = FramesTask(task, delay, owner, pausable)
+        cls.schedule(frames_task)
+        return frames_task
 
     @classmethod
-    def delayed_call(cls, task: Callable[[], None], delay: float):
+    def delayed_call(
+        cls,
+        task: Callable[[], None],
+        delay: float,
+        owner: Scene | GameObject | None = None,
+        pausable: bool = False,
+    ) -> DelayedTask:
         """
         Calls the function func to be called at a later time.
 
         Args:
             task: The function to call.
             delay: The time from now (in seconds) to run the function at.
-        """
+            owner: The scene or gameobject that owns the task. Its time only passes while it updates, and the task is
+                stopped when it is removed from its scene. Defaults to None.
+            pausable: Whether the delay runs on game time, which stops while the game is paused. Defaults to False.
 
-        cls.schedule(DelayedTask(task, delay))
+        Returns:
+            The scheduled task, which can be stopped.
+        """
+        delayed_task = DelayedTask(task, delay, owner, pausable)
+        cls.schedule(delayed_task)
+        return delayed_task
 
     @classmethod
     def recurrent_call(
-        cls, task: Callable[[], None] | Callable[[RecurrentTask], None], interval: float, delay: float = 0
-    ):
+        cls,
+        task: Callable[[], None] | Callable[[RecurrentTask], None],
+        interval: float,
+        delay: float = 0,
+        owner: Scene | GameObject | None = None,
+        pausable: bool = False,
+    ) -> RecurrentTask:
         """
         Schedules the function func to be repeatedly called every interval.
 
@@ -207,71 +591,98 @@ def recurrent_call(
                 This method may take a RecurrentTask as an argument, which will be passed to it when it is invoked.
             interval: The interval (in seconds) to run the function at.
             delay: The delay (in seconds) to wait before starting the task.
-        """
+            owner: The scene or gameobject that owns the task. Its time only passes while it updates, and the task is
+                stopped when it is removed from its scene. Defaults to None.
+            pausable: Whether the task runs on game time, which stops while the game is paused. Defaults to False.
 
-        cls.schedule(RecurrentTask(task, interval, delay))
+        Returns:
+            The scheduled task, which can be stopped.
+        """
+        recurrent_task = RecurrentTask(task, interval, delay, owner, pausable)
+        cls.schedule(recurrent_task)
+        return recurrent_task
 
     @classmethod
     def schedule(cls, task: DelayedTask | FramesTask | RecurrentTask):
         """
-        Schedules a task for execution based on what type of task it is.
+        Schedules a task for execution based on what type of task it is. A task that is already scheduled is moved
+        to its new time.
 
         Args:
             task: The task to queue.
         """
-        if isinstance(task, DelayedTask):
-            task.next_run = cls.now() + task.delay
-            heapq.heappush(cls._task_queue, task)
-        elif isinstance(task, FramesTask):
-            task.next_run = cls.frames + task.delay
-            heapq.heappush(cls._frame_queue, task)
-        elif isinstance(task, RecurrentTask):
-            task.next_run = cls.now() + task.delay
-            heapq.heappush(cls._recurrent_queue, task)
+        if task.owner is not None:
+            clock = cls._clock_of(task.owner)
+            clock.schedule(task, clock.now)
+        elif task.pausable:
+            cls._game_clock.schedule(task, cls._game_clock.now)
         else:
-            raise TypeError("Task argument must of of type DelayedTask, FramesTask or RecurrentTask.")
+            cls._clock.schedule(task, cls._now())
 
     @classmethod
-    def _process_calls(cls):
-        """Processes the delayed function call as needed"""
+    def stop_all(cls, owner: Scene | GameObject):
+        """
+        Stops every task owned by a scene or gameobject. Gameobjects do this when they are removed from their scene.
+
+        Args:
+            owner: The owner of the tasks.
+        """
+        if owner._clock is not None:
+            owner._clock.clear()
+
+    @classmethod
+    def pending(cls, owner: Scene | GameObject | None = None) -> dict[str, int]:
+        """
+        Counts the tasks waiting to run. Stopped tasks are not counted since stopping a task removes it.
+
+        Args:
+            owner: Only count the tasks of this scene or gameobject. Defaults to None, which counts the tasks without
+                an owner.
+
+        Returns:
+            The number of tasks of each kind, under "next frame", "frames", "delayed" and "recurrent".
+        """
+        if owner is not None:
+            clocks = [owner._clock] if owner._clock is not None else []
+            next_frame = 0
+        else:
+            clocks = [cls._clock, cls._game_clock]
+            next_frame = len(cls._next_queue)
+
+        return {
+            "next frame": next_frame,
+            "frames": sum(clock.frame_wheel.count for clock in clocks),
+            "delayed": sum(clock.task_wheel.count for clock in clocks),
+            "recurrent": sum(clock.recurrent_wheel.count for clock in clocks),
+        }
+
+    @staticmethod
+    def _clock_of(owner: Scene | GameObject) -> _Clock:
+        """Gets the clock of a scene or gameobject, giving it one if it has none yet."""
+        if owner._clock is None:
+            owner._clock = _Clock()
+        return owner._clock
+
+    @classmethod
+    def _process_calls(cls, paused: bool = False):
+        """
+        Processes the delayed function calls that came due.
+
+        Args:
+            paused: Whether the game is paused, which stops game time.
+        """
         cls.frames += 1
         cls.fps = 1 / cls.delta_time
 
-        cls._past_fps[cls._fps_index] = int(cls.fps)
-        cls._fps_index = (cls._fps_index + 1) % len(cls._past_fps)
+        cls._frame_times[cls._frame_index] = cls._delta_time
+        cls._frame_index = (cls._frame_index + 1) % len(cls._frame_times)
+        cls._frame_count = min(cls._frame_count + 1, len(cls._frame_times))
 
         if cls._next_queue:
             for func in cls._next_queue:
                 func()
             cls._next_queue.clear()
 
-        while cls._frame_queue:
-            if cls._frame_queue[0].next_run <= cls.frames:
-                frame_task: FramesTask = heapq.heappop(cls._frame_queue)
-                if not frame_task.is_stopped:
-                    frame_task.task()
-            else:
-                break
-
-        while cls._task_queue:
-            if cls._task_queue[0].next_run <= cls.now():
-                delayed_task: DelayedTask = heapq.heappop(cls._task_queue)
-                if not delayed_task.is_stopped:
-                    delayed_task.task()
-            else:
-                break
-
-        while cls._recurrent_queue:
-            if cls._recurrent_queue[0].next_run <= cls.now():
-                recurrent_task: RecurrentTask = heapq.heappop(cls._recurrent_queue)
-
-                if not recurrent_task.is_stopped:
-                    try:
-                        recurrent_task.task(recurrent_task)  # type: ignore
-                    except TypeError:
-                        recurrent_task.task()  # type: ignore
-
-                    recurrent_task.next_run += recurrent_task.interval
-                    heapq.heappush(cls._recurrent_queue, recurrent_task)
-            else:
-                break
+        cls._clock.advance(cls._now())
+        if not paused:
+            cls._game_clock.advance(cls._game_clock.now + cls._delta_time)
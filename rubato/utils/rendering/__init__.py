@@ -1,4 +1,5 @@
 """This module contains rendering utilities"""
+from .texture_pool import TexturePool
 from .surface import Surface
 from .font import Font
 from .draw import Draw
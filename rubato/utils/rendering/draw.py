@@ -6,7 +6,7 @@
 import sdl2, sdl2.ext
 
 from . import Font, Surface
-from .. import Vector, Color, Display, InitError, Math, Time
+from .. import Vector, Color, Display, InitError, Math, Time, Profiler
 
 if TYPE_CHECKING:
     from . import Camera
@@ -62,6 +62,36 @@ def _draw_fps(font: Font):
             af=False
         )
 
+    @staticmethod
+    def _draw_profile(font: Font):
+        """
+        Draws the average phase times of the profiler under the FPS.
+        Called automatically if `Game.show_fps`, `Profiler.enabled` and `Profiler.overlay` are True.
+
+        Args:
+            font: The font to use.
+        """
+        height: int = math.ceil(Display.res.y / 48)
+        pad = max(height / 4, 1)
+
+        scale = height / font.size
+
+        lines = [f"{name}: {ms:.2f} ms" for name, ms in Profiler.averages().items()]
+        lines += [f"{name}: {value:.0f}" for name, value in Profiler.counters().items()]
+        if not lines:
+            return
+
+        Draw.text(
+            "\n".join(lines),
+            font=font,
+            pos=Display.top_left + (pad, -pad - math.ceil(Display.res.y / 32) * 1.5),
+            align=Vector(1, 1),
+            scale=(scale, scale),
+            shadow=True,
+            shadow_pad=(pad, pad),
+            af=False
+        )
+
     @classmethod
     def clear(cls, background_color: Color = Color.white, border_color: Color = Color.black):
         """
@@ -95,6 +125,7 @@ def _dump(cls):
         if not cls._queue:
             return
 
+        Profiler.count("draw calls", len(cls._queue))
         cls._queue.sort(key=lambda x: x.priority)
 
         for task in cls._queue:
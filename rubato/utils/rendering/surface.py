@@ -1,11 +1,12 @@
 """An abstraction for a grid of pixels that can be drawn onto."""
 from __future__ import annotations
 from typing import Optional
-import sdl2, sdl2.ext, sdl2.sdlimage, ctypes
+import sdl2, sdl2.ext, sdl2.sdlimage
 import os
 
 from ...c_src import c_draw
-from .. import Vector, Color, Display, get_path
+from . import TexturePool
+from .. import Vector, Color, Display, get_path, Profiler
 
 
 class Surface:
@@ -39,12 +40,10 @@ def __init__(
         self._width: int = width
         self._height: int = height
         self._color_key: Optional[int] = None
+        self._alpha: int = 255
 
-        sdl2.SDL_SetHint(b"SDL_RENDER_SCALE_QUALITY", b"linear" if self._af else b"nearest")
-        self._tx: sdl2.SDL_Texture = sdl2.SDL_CreateTexture(
-            Display.renderer.sdlrenderer, Display.pixel_format, sdl2.SDL_TEXTUREACCESS_STREAMING, width, height
-        ).contents
-        sdl2.SDL_SetTextureBlendMode(self._tx, sdl2.SDL_BLENDMODE_BLEND)
+        self._tx: sdl2.SDL_Texture | None = None
+        self._tx_gen: int = 0
         self._pixels: int = c_draw.create_pixel_buffer(width, height)
         self._pixels_colorkey: int = 0
         self.uptodate: bool = False
@@ -70,13 +69,10 @@ def af(self):
 
     @af.setter
     def af(self, new: bool):
+        if new == self._af:
+            return
+        self._free_texture()
         self._af = new
-        sdl2.SDL_SetHint(b"SDL_RENDER_SCALE_QUALITY", b"linear" if self._af else b"nearest")
-        self._tx: sdl2.SDL_Texture = sdl2.SDL_CreateTexture(
-            Display.renderer.sdlrenderer, Display.pixel_format, sdl2.SDL_TEXTUREACCESS_STREAMING, self.width,
-            self.height
-        ).contents
-        sdl2.SDL_SetTextureBlendMode(self._tx, sdl2.SDL_BLENDMODE_BLEND)
         self.uptodate = False
 
     def size_scaled(self) -> Vector:
@@ -181,7 +177,12 @@ def flip_anti_diagonal(self):
         self.uptodate = False
 
     def _regen(self):
-        """Updates the texture."""
+        """Updates the texture, creating it if the surface has never been drawn."""
+        if self._tx is None:
+            self._tx = TexturePool._acquire(self._width, self._height, self._af)
+            self._tx_gen = TexturePool._generation
+            sdl2.SDL_SetTextureAlphaMod(self._tx, self._alpha)
+
         if self._color_key is not None:
             c_draw.colorkey_copy(self._pixels, self._pixels_colorkey, self._width, self._height, self._color_key)
 
@@ -189,6 +190,7 @@ def _regen(self):
             self._tx, None, self._pixels if self._color_key is None else self._pixels_colorkey, self.width * 4
         )
         self.uptodate = True
+        Profiler.count("texture uploads")
 
     def clear(self):
         """
@@ -449,16 +451,15 @@ def set_alpha(self, new: int):
         Args:
             new: The new alpha. (value between 0-255)
         """
-        new = max(min(new, 255), 0)
-        sdl2.SDL_SetTextureAlphaMod(self._tx, new)
+        self._alpha = max(min(new, 255), 0)
+        if self._tx is not None:
+            sdl2.SDL_SetTextureAlphaMod(self._tx, self._alpha)
 
     def get_alpha(self) -> int:
         """
         Gets the surface wide alpha.
         """
-        y = ctypes.c_uint8()
-        sdl2.SDL_GetTextureAlphaMod(self._tx, ctypes.byref(y))
-        return y.value
+        return self._alpha
 
     def save_as(
         self,
@@ -505,13 +506,13 @@ def save_as(
 
     def _as_surf(self) -> sdl2.SDL_Surface:
         """
-        Converts the underlying texture to a SDL_Surface.
+        Converts the underlying pixels to a SDL_Surface.
 
         Returns:
             The SDL_Surface.
         """
-        if not self.uptodate:
-            self._regen()
+        if self._color_key is not None:
+            c_draw.colorkey_copy(self._pixels, self._pixels_colorkey, self._width, self._height, self._color_key)
 
         surf = sdl2.SDL_CreateRGBSurfaceWithFormatFrom(
             self._pixels if self._pixels_colorkey == 0 else self._pixels_colorkey,
@@ -589,6 +590,12 @@ def _from_surf(
         sdl2.SDL_FreeSurface(new_surf)
         return s
 
+    def _free_texture(self):
+        """Hands the texture back to the texture pool."""
+        if self._tx is not None:
+            TexturePool._release(self._tx, self._width, self._height, self._af, self._tx_gen)
+            self._tx = None
+
     def __del__(self):
-        sdl2.SDL_DestroyTexture(self._tx)
+        self._free_texture()
         c_draw.free_pixel_buffer(self._pixels)
@@ -0,0 +1,156 @@
+"""
+A static class that recycles the GPU textures backing surfaces.
+"""
+import sdl2
+
+from .. import Display, InitError
+
+
+# THIS IS A STATIC CLASS
+class TexturePool:
+    """
+    Keeps track of every SDL texture created for a :func:`Surface <rubato.utils.rendering.surface.Surface>`.
+
+    Surfaces only create a texture the first time they are drawn. When a surface is deleted, its texture is handed
+    back to this pool so that the next surface of the same size can reuse it instead of creating a new one.
+    """
+
+    max_per_size: int = 16
+    """The maximum number of free textures kept for a single texture size. Defaults to 16."""
+    max_bytes: int = 32 * 1024 * 1024
+    """The maximum number of bytes the free textures can take up. Defaults to 32 MiB."""
+
+    _free: dict[tuple[int, int, bool], list[sdl2.SDL_Texture]] = {}
+    _renderer = None
+    _generation: int = 0
+
+    _live_count: int = 0
+    _live_bytes: int = 0
+    _pooled_count: int = 0
+    _pooled_bytes: int = 0
+
+    def __init__(self) -> None:
+        raise InitError(self)
+
+    @classmethod
+    def live_textures(cls) -> int:
+        """
+        The number of textures currently held by surfaces.
+
+        Returns:
+            The number of live textures.
+        """
+        return cls._live_count
+
+    @classmethod
+    def live_bytes(cls) -> int:
+        """
+        The approximate amount of video memory used by the textures currently held by surfaces.
+
+        Returns:
+            The number of bytes used by the live textures.
+        """
+        return cls._live_bytes
+
+    @classmethod
+    def pooled_textures(cls) -> int:
+        """
+        The number of free textures waiting to be reused.
+
+        Returns:
+            The number of pooled textures.
+        """
+        return cls._pooled_count
+
+    @classmethod
+    def pooled_bytes(cls) -> int:
+        """
+        The approximate amount of video memory used by the free textures waiting to be reused.
+
+        Returns:
+            The number of bytes used by the pooled textures.
+        """
+        return cls._pooled_bytes
+
+    @classmethod
+    def clear(cls):
+        """Destroys all the free textures in the pool. Textures held by surfaces are not affected."""
+        if cls._renderer is Display.renderer:
+            for txs in cls._free.values():
+                for tx in txs:
+                    sdl2.SDL_DestroyTexture(tx)
+        cls._free.clear()
+        cls._pooled_count = 0
+        cls._pooled_bytes = 0
+
+    @classmethod
+    def _check_renderer(cls):
+        """Forgets the free textures if they belong to a renderer that is no longer used."""
+        if cls._renderer is not Display.renderer:
+            # the old renderer owns (and frees) these textures
+            cls._free.clear()
+            cls._pooled_count = 0
+            cls._pooled_bytes = 0
+            cls._renderer = Display.renderer
+            cls._generation += 1
+
+    @classmethod
+    def _acquire(cls, width: int, height: int, af: bool) -> sdl2.SDL_Texture:
+        """
+        Gets a texture of the given size, reusing a free one if possible.
+
+        Args:
+            width: The width of the texture.
+            height: The height of the texture.
+            af: Whether the texture uses anisotropic filtering.
+
+        Returns:
+            The texture.
+        """
+        cls._check_renderer()
+
+        size = width * height * 4
+        cls._live_count += 1
+        cls._live_bytes += size
+
+        if txs := cls._free.get((width, height, af)):
+            cls._pooled_count -= 1
+            cls._pooled_bytes -= size
+            return txs.pop()
+
+        sdl2.SDL_SetHint(b"SDL_RENDER_SCALE_QUALITY", b"linear" if af else b"nearest")
+        tx: sdl2.SDL_Texture = sdl2.SDL_CreateTexture(
+            Display.renderer.sdlrenderer, Display.pixel_format, sdl2.SDL_TEXTUREACCESS_STREAMING, width, height
+        ).contents
+        sdl2.SDL_SetTextureBlendMode(tx, sdl2.SDL_BLENDMODE_BLEND)
+        return tx
+
+    @classmethod
+    def _release(cls, tx: sdl2.SDL_Texture, width: int, height: int, af: bool, generation: int):
+        """
+        Returns a texture to the pool, destroying it if the pool is full.
+
+        Args:
+            tx: The texture to release.
+            width: The width of the texture.
+            height: The height of the texture.
+            af: Whether the texture uses anisotropic filtering.
+            generation: The renderer generation the texture was acquired in.
+        """
+        size = width * height * 4
+        cls._live_count -= 1
+        cls._live_bytes -= size
+
+        if generation != cls._generation:
+            # the texture was already freed along with its renderer
+            return
+
+        key = (width, height, af)
+        txs = cls._free.setdefault(key, [])
+        if len(txs) >= cls.max_per_size or cls._pooled_bytes + size > cls.max_bytes:
+            sdl2.SDL_DestroyTexture(tx)
+            return
+
+        txs.append(tx)
+        cls._pooled_count += 1
+        cls._pooled_bytes += size
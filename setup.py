@@ -14,7 +14,8 @@ def package_files(directory):
 
 setup(
     package_data={"rubato": [*package_files("rubato/static"),
-                             os.path.join("..", "rubato/c_src/", "cdraw.pxd")]},
+                             os.path.join("..", "rubato/c_src/", "cdraw.pxd"),
+                             os.path.join("..", "rubato/c_src/", "cnoise.pxd")]},
     ext_modules=[
         *cythonize(
             Extension(
@@ -24,6 +25,14 @@ def package_files(directory):
                 language="c++",
             ),
         ),
+        *cythonize(
+            Extension(
+                "rubato.c_src.c_noise",
+                ["rubato/c_src/c_noise.py", "rubato/c_src/cnoise.cpp"],
+                extra_compile_args=["-std=c++14", "-ffp-contract=off"],
+                language="c++",
+            ),
+        ),
         *cythonize(
             "rubato/**/*.py",
             exclude=["rubato/__pyinstaller/**/*", "rubato/static/**/*", "rubato/c_src/**/*"],
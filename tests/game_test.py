@@ -68,6 +68,28 @@ def test_start(monkeypatch: pytest.MonkeyPatch):
     Game.state = Game.STOPPED
 
 
+def test_substeps(monkeypatch: pytest.MonkeyPatch, rub):
+    monkeypatch.setattr(Radio, "_handle", Mock(return_value=False))
+    monkeypatch.setattr(Display.renderer, "present", Mock())
+    monkeypatch.setattr(Time, "_end_frame", Mock())
+    monkeypatch.setattr(Time, "fixed_delta", 0.1)
+    monkeypatch.setattr(Time, "_delta_time", 10000)
+    monkeypatch.setattr(Time, "_physics_counter", 0)
+    monkeypatch.setattr(Game, "state", Game.RUNNING)
+    monkeypatch.setattr(Game, "_scenes", {})
+    fixed_update = Mock()
+    monkeypatch.setattr(Scene, "_fixed_update", fixed_update)
+    Scene()
+
+    Game._tick()
+    assert fixed_update.call_count == Time.max_substeps
+    assert Time.fixed_alpha == pytest.approx(0, abs=1e-9)
+
+    monkeypatch.setattr(Time, "max_substeps", 0)
+    Game._tick()
+    assert fixed_update.call_count >= 5 + 99  # no limit, give or take rounding
+
+
 def test_loop(monkeypatch: pytest.MonkeyPatch, rub):
     now = Mock(side_effect=[0] + [i * 1000 for i in range(20)])
     monkeypatch.setattr(Time, "now", now)
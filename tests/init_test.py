@@ -50,7 +50,7 @@ def test_init(monkeypatch):
     assert rubato.Game.state == rubato.Game.STOPPED
 
     assert rubato.Time.target_fps == 60
-    assert rubato.Time._normal_delta == int(1000 / 60)
+    assert rubato.Time._normal_delta == 1000 / 60
     assert rubato.Time._physics_fps == 30
 
     set_icon.assert_called_once_with(str(files("rubato.static.png").joinpath("logo_filled.png")))
@@ -66,3 +66,35 @@ def test_init(monkeypatch):
         maximize=True,
     )
     set_icon.assert_called_once_with(str(files("rubato.static.png").joinpath("logo_filled.ico")))
+
+
+@pytest.mark.parametrize("draw", [False, True])
+def test_headless(monkeypatch, tmp_path, draw):
+    monkeypatch.setattr(rubato.Game, "_scenes", {})
+    monkeypatch.setattr(rubato.Game, "state", rubato.Game.RUNNING)
+    monkeypatch.setattr(rubato.Game, "headless_draw", draw)
+    monkeypatch.setattr(rubato.Radio, "_handle", Mock(return_value=False))
+    present = Mock()
+
+    rubato.init(res=(40, 30), headless=True)
+    monkeypatch.setattr(rubato.Display.renderer, "present", present)
+    assert rubato.Display.headless and rubato.Display.hidden
+    assert rubato.Display.res == rubato.Vector(40, 30)
+
+    scene = rubato.Scene(background_color=rubato.Color.red)
+    scene.add(rubato.wrap(rubato.RigidBody(velocity=(10, 0))))
+    draw_mock = Mock(wraps=scene._draw)
+    monkeypatch.setattr(scene, "_draw", draw_mock)
+
+    rubato.Draw.queue_pixel((0, 0))
+    rubato.Game._tick()
+    present.assert_not_called()
+    assert draw_mock.call_count == draw
+    assert not rubato.Draw._queue
+
+    if draw:
+        assert rubato.Display.save_screenshot("frame", str(tmp_path), "bmp")
+        image = rubato.Surface.from_file(str(tmp_path / "frame.bmp"))
+        assert image.get_pixel((0, 0)) == rubato.Color.red
+
+    rubato.Game._initialized = False
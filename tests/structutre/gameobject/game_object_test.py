@@ -0,0 +1,40 @@
+"""Tests for the game object class"""
+import pytest
+from rubato.structure.gameobject.component import Component
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.physics.hitbox import Hitbox, Rectangle, Circle
+from rubato.structure.gameobject.physics.rigidbody import RigidBody
+# pylint: disable=unused-argument
+
+
+def test_lookup(rub):
+    go = GameObject()
+    rect, circle = Rectangle(1, 1), Circle(1)
+    go.add(rect, circle)
+
+    assert go.get(Hitbox) is rect
+    assert go.get_all(Hitbox) == [rect, circle]
+    assert Hitbox in go
+    assert RigidBody not in go
+    assert go._first(RigidBody) is None
+
+    go.add(rb := RigidBody())
+    assert RigidBody in go
+    assert go.get(RigidBody) is rb
+    assert go._first(RigidBody) is rb
+    assert len(go.get_all(Component)) == 3
+
+    go.remove(Rectangle)
+    assert Rectangle not in go
+    assert go.get(Hitbox) is circle
+
+    go.remove_by_ref(circle)
+    assert Hitbox not in go
+    assert go.get_all(Hitbox) == []
+    with pytest.raises(ValueError):
+        go.get(Hitbox)
+
+    go.remove_all(Component)
+    assert go.get_all(Component) == []
+    with pytest.raises(IndexError):
+        go.remove_all(Component)
@@ -0,0 +1,114 @@
+"""Tests for the physics engine"""
+import pytest
+from rubato.structure.scene import Scene
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.physics.engine import _Engine
+from rubato.structure.gameobject.physics.hitbox import Rectangle, Circle
+from rubato.structure.gameobject.physics.rigidbody import RigidBody
+from rubato.utils.computation.vector import Vector
+from rubato.utils.rb_time import Time
+# pylint: disable=unused-argument
+
+
+def test_contacts(rub):
+    GameObject().add(box_a := Rectangle(20, 20))
+    GameObject(pos=(0, 13)).add(box_b := Rectangle(10, 10))
+    col = _Engine.overlap(box_a, box_b)
+    assert col is not None
+    assert sorted(round(p.x) for p in col.contacts) == [-5, 5]
+    assert all(8 <= p.y <= 10 for p in col.contacts)
+    assert col._flip().contacts == col.contacts
+
+    GameObject(pos=(0, 14)).add(circle := Circle(5))
+    col = _Engine.overlap(circle, box_a)
+    assert col is not None
+    assert len(col.contacts) == 1
+    assert col.contacts[0] == Vector(0, 9.5)
+
+
+def test_stack(rub, monkeypatch):
+    monkeypatch.setattr(Time, "fixed_delta", 1 / 30)
+    scene = Scene()
+    scene.add(GameObject(pos=(0, -10)).add(Rectangle(200, 20), RigidBody(static=True)))
+    boxes = [GameObject(pos=(0, 10 + 20 * i)).add(Rectangle(20, 20), RigidBody(gravity=(0, -500))) for i in range(4)]
+    scene.add(*boxes)
+
+    for _ in range(90):
+        scene._fixed_update()
+
+    assert len(scene._contact_cache) == 4
+    assert boxes[-1].pos.y == pytest.approx(70, abs=6)
+    assert boxes[-1].get(RigidBody).velocity.magnitude < 20
+
+
+def test_islands(rub):
+    scene = Scene()
+    scene.add(GameObject(pos=(0, -10)).add(Rectangle(400, 20), RigidBody(static=True)))
+    left = [GameObject(pos=(-100, 9 + 19 * i)).add(Rectangle(20, 20), RigidBody()) for i in range(2)]
+    right = [GameObject(pos=(100, 9 + 19 * i)).add(Rectangle(20, 20), RigidBody()) for i in range(3)]
+    scene.add(*left, *right)
+
+    scene._fixed_update()
+
+    # the static floor does not link the two stacks
+    assert _Engine._island_count == 2
+    assert len(scene._contact_cache) == 5
+
+
+@pytest.mark.parametrize("pos", [(0, 13), (13, 0), (-12, 3), (4, -14), (-9, -11), (30, 0)])
+def test_aabb(rub, pos):
+    GameObject().add(box_a := Rectangle(20, 20))
+    GameObject(pos=pos).add(box_b := Rectangle(10, 12))
+
+    col = _Engine.overlap(box_a, box_b)
+    sat = _Engine._polygon_polygon_test(box_a, box_b)
+    if sat is None:
+        assert col is None
+    else:
+        assert col.penetration == pytest.approx(sat.penetration)
+        assert col.normal.x == pytest.approx(sat.normal.x) and col.normal.y == pytest.approx(sat.normal.y)
+        assert len(col.contacts) == 2
+
+
+@pytest.mark.parametrize("pos", [(0, 12), (-14, 2), (3, -12), (13, 11), (17, 17), (0, 3)])
+def test_circle_aabb(rub, pos):
+    GameObject(rotation=90).add(box := Rectangle(16, 20))
+    GameObject(pos=pos).add(circle := Circle(5))
+
+    col = _Engine.overlap(circle, box)
+    sat = _Engine._circle_polygon_test(circle, box)
+    if sat is None:
+        assert col is None
+    else:
+        assert col.normal.x == pytest.approx(sat.normal.x) and col.normal.y == pytest.approx(sat.normal.y)
+        assert col.contacts is not None
+
+
+def test_rotated_rectangle(rub):
+    GameObject().add(box_a := Rectangle(20, 20))
+    GameObject(pos=(0, 16), rotation=45).add(box_b := Rectangle(10, 10))
+    assert _Engine._aabb(box_b) is None
+    assert _Engine.overlap(box_a, box_b) is not None
+
+
+def test_circle_offset_polygon(rub):
+    GameObject().add(box := Rectangle(10, 10, offset=(20, 0)))
+    GameObject(pos=(20, 7)).add(circle := Circle(4))
+
+    col = _Engine._circle_polygon_test(circle, box)
+    assert col is not None
+    assert col.penetration == pytest.approx(2)
+    assert col.normal.x == pytest.approx(0) and col.normal.y == pytest.approx(1)
+
+
+def test_callbacks(rub):
+    seen = []
+    GameObject().add(box_a := Rectangle(20, 20))
+    GameObject(pos=(0, 15)).add(box_b := Rectangle(20, 20, on_enter=seen.append, on_exit=seen.append))
+
+    _Engine.collide(box_a, box_b)
+    assert len(seen) == 1 and seen[0].shape_a is box_b and seen[0].normal == Vector(0, 1)
+
+    box_b.gameobj.pos.y = 30
+    _Engine.collide(box_a, box_b)
+    assert len(seen) == 2 and seen[1].shape_a is box_b and box_a not in box_b.colliding
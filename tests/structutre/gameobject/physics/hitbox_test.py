@@ -0,0 +1,42 @@
+"""Tests for the hitbox components"""
+import pytest
+from rubato.game import Game
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.physics.hitbox import Rectangle, Circle, Polygon
+from rubato.utils.color import Color
+from rubato.utils.computation.vector import Vector
+from rubato.utils.rendering.draw import Draw
+# pylint: disable=unused-argument
+
+
+@pytest.mark.parametrize("hitbox", [Rectangle(10, 10), Circle(5), Polygon(Vector.poly(5, 5))])
+def test_lazy_images(rub, hitbox):
+    GameObject().add(hitbox)
+    hitbox.update()
+    assert hitbox._image is None
+    assert hitbox._debug_image is None
+
+    hitbox.color = Color.red
+    hitbox.update()
+    assert hitbox._image is not None
+    assert hitbox._debug_image is None
+
+    hitbox.debug = True
+    hitbox.draw(Game._zero_cam)
+    assert hitbox._debug_image is not None
+
+    hitbox.color = None
+    hitbox.update()
+    assert hitbox._image is None
+
+    Draw._queue.clear()
+
+
+def test_shared_debug_cross(rub):
+    a, b = GameObject(debug=True), GameObject(debug=True)
+    a._draw(Game._zero_cam)
+    b._draw(Game._zero_cam)
+    assert GameObject._debug_cross is not None
+    assert len(Draw._queue) == 2
+
+    Draw._queue.clear()
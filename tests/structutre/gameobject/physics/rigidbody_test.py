@@ -0,0 +1,70 @@
+"""Tests for the rigidbody component"""
+import pytest
+from rubato.structure.scene import Scene
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.physics.hitbox import Rectangle, Circle
+from rubato.structure.gameobject.physics.rigidbody import RigidBody
+from rubato.utils.rb_time import Time
+# pylint: disable=unused-argument
+
+
+@pytest.mark.parametrize("make_hitbox", [lambda: Circle(5), lambda: Rectangle(10, 10)])
+@pytest.mark.parametrize("ccd", [False, True])
+def test_ccd(rub, monkeypatch, make_hitbox, ccd):
+    hitbox = make_hitbox()
+    monkeypatch.setattr(Time, "fixed_delta", 0.1)
+    scene = Scene()
+    wall = GameObject(pos=(100, 0)).add(Rectangle(2, 100), RigidBody(static=True))
+    bullet = GameObject().add(hitbox, RigidBody(velocity=(3000, 0), ccd=ccd))
+    scene.add(wall, bullet)
+
+    scene._fixed_update()
+
+    if ccd:
+        assert bullet.pos.x < 100
+        assert hitbox in wall.get(Rectangle).colliding
+    else:
+        assert bullet.pos.x > 100
+
+
+def test_ccd_resting(rub, monkeypatch):
+    monkeypatch.setattr(Time, "fixed_delta", 0.1)
+    scene = Scene()
+    floor = GameObject(pos=(0, -10)).add(Rectangle(1000, 10), RigidBody(static=True))
+    ball = GameObject(pos=(0, -0.5)).add(Circle(5), RigidBody(velocity=(100, 0), ccd=True))
+    scene.add(floor, ball)
+
+    scene._fixed_update()
+
+    assert ball.pos.x == pytest.approx(10)
+
+
+def test_ccd_moved(rub, monkeypatch):
+    monkeypatch.setattr(Time, "fixed_delta", 0.1)
+    scene = Scene()
+    other = GameObject(pos=(0, 500)).add(Circle(5), RigidBody(velocity=(10, 0), ccd=True))
+    wall = GameObject(pos=(400, 0)).add(Rectangle(2, 100), RigidBody(velocity=(-3000, 0)))
+    bullet = GameObject().add(Circle(5), RigidBody(velocity=(3000, 0), ccd=True))
+    scene.add(other, wall, bullet)
+
+    scene._fixed_update()
+
+    assert wall.pos.x == pytest.approx(100)
+    assert bullet.pos.x < 100
+
+
+def test_interpolate(rub, monkeypatch):
+    monkeypatch.setattr(Time, "fixed_delta", 0.1)
+    monkeypatch.setattr(Time, "_physics_counter", 0.05)
+    rb = RigidBody(velocity=(10, 0), ang_vel=20, interpolate=True)
+    go = GameObject().add(rb)
+    assert rb._interpolated() == (go.pos, 0)
+
+    rb.fixed_update()
+    pos, rotation = rb._interpolated()
+    assert Time.fixed_alpha == pytest.approx(0.5)
+    assert pos.x == pytest.approx(0.5) and rotation == pytest.approx(1)
+
+    actual = go.pos
+    go._draw(Scene().camera)
+    assert go.pos is actual and go.pos.x == pytest.approx(1)
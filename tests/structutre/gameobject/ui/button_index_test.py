@@ -0,0 +1,171 @@
+"""Tests for the index of the buttons of a scene"""
+import pytest
+from unittest.mock import Mock
+from rubato.structure.scene import Scene
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.ui.button import Button
+from rubato.utils.hardware.rb_input import Input
+from rubato.utils.computation.vector import Vector
+from rubato import sdl2
+# pylint: disable=unused-argument, redefined-outer-name
+
+
+@pytest.fixture
+def mouse(monkeypatch: pytest.MonkeyPatch):
+    """Places the mouse, in screen coordinates, and holds or releases the left button."""
+
+    def move(x: float, y: float, down: bool = False):
+        monkeypatch.setattr(Input, "get_mouse_pos", Mock(return_value=Vector(x, y)))
+        monkeypatch.setattr(Input, "_buttons", sdl2.SDL_BUTTON_LMASK if down else 0)
+
+    return move
+
+
+def make(scene: Scene, pos=(0, 0), z_index: int = 0, **kwargs) -> Button:
+    calls = Mock()
+    button = Button(
+        10,
+        10,
+        onclick=calls.click,
+        onrelease=calls.release,
+        onhover=calls.hover,
+        onexit=calls.exit,
+        z_index=z_index,
+    )
+    button.calls = calls
+    scene.add(GameObject(pos=pos, **kwargs).add(button))
+    return button
+
+
+def test_registry(rub):
+    scene = Scene()
+    assert scene._buttons is None
+
+    button = make(scene)
+    assert list(scene._buttons.buttons) == [button]
+
+    scene.remove(button.gameobj)
+    assert not scene._buttons.buttons
+
+
+def test_topmost(rub, mouse):
+    scene = Scene()
+    bottom = make(scene)
+    top = make(scene, pos=(4, 0), z_index=1)
+    same = make(scene, pos=(-4, 0))
+
+    mouse(2, 0)
+    scene._update()
+    assert top.hover and not bottom.hover
+    top.calls.hover.assert_called_once()
+    bottom.calls.hover.assert_not_called()
+
+    mouse(-2, 0)
+    scene._update()
+    assert same.hover and not top.hover and not bottom.hover
+    top.calls.exit.assert_called_once()
+
+    mouse(100, 0)
+    scene._update()
+    assert not same.hover
+    same.calls.exit.assert_called_once()
+
+
+def test_press(rub, mouse):
+    scene = Scene()
+    button = make(scene)
+
+    mouse(0, 0, True)
+    scene._update()
+    assert button.pressed
+    button.calls.click.assert_called_once()
+
+    mouse(100, 0, True)
+    scene._update()
+    assert button.pressed and not button.hover
+
+    mouse(100, 0)
+    scene._update()
+    assert not button.pressed
+    button.calls.release.assert_called_once()
+
+    mouse(100, 0, True)
+    scene._update()
+    button.calls.click.assert_called_once()
+
+
+def test_only_on_change(rub, mouse, monkeypatch: pytest.MonkeyPatch):
+    scene = Scene()
+    button = make(scene)
+    hit = Mock(wraps=scene._buttons._hit)
+    monkeypatch.setattr(scene._buttons, "_hit", hit)
+
+    mouse(0, 0)
+    scene._update()
+    scene._update()
+    assert hit.call_count == 1
+
+    mouse(1, 0, True)
+    scene._update()
+    assert hit.call_count == 2
+    button.calls.click.assert_called_once()
+
+    button.gameobj.pos.x = 50
+    scene._update()
+    assert hit.call_count == 3
+    assert not button.hover and button.pressed
+
+    scene.camera.pos.x = 50
+    scene._update()
+    assert hit.call_count == 4
+    assert button.hover
+
+
+def test_camera(rub, mouse):
+    scene = Scene()
+    moving = make(scene, pos=(20, 0), z_index=1)
+    fixed = make(scene, pos=(0, 0), ignore_cam=True)
+    scene.camera.pos = Vector(20, 0)
+
+    mouse(0, 0)
+    scene._update()
+    assert moving.hover and not fixed.hover
+
+    fixed.z_index = 2
+    scene._update()
+    assert fixed.hover and not moving.hover
+
+    scene.camera.z_index = -1
+    scene._update()
+    assert not fixed.hover and not moving.hover
+
+
+def test_inactive_and_rotated(rub, mouse):
+    scene = Scene()
+    button = make(scene, rotation=45)
+    parent = GameObject(active=False)
+    scene.add(parent)
+    hidden = make(scene, z_index=1)
+    hidden.gameobj.parent = parent
+
+    mouse(6, 0)
+    scene._update()
+    assert button.hover and not hidden.hover
+
+    mouse(4.5, 4.5)
+    scene._update()
+    assert not button.hover
+
+    parent.active = True
+    mouse(0, 0)
+    scene._update()
+    assert hidden.hover and not button.hover
+
+
+def test_standalone(rub, mouse):
+    button = Button(10, 10)
+    GameObject().add(button)
+
+    mouse(0, 0, True)
+    button.update()
+    assert button.hover and button.pressed
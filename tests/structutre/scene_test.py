@@ -0,0 +1,157 @@
+"""Tests for the scene class"""
+import pytest
+from rubato.structure.scene import Scene
+from rubato.structure.gameobject.component import Component
+from rubato.structure.gameobject.game_object import GameObject
+from rubato.structure.gameobject.physics.hitbox import Hitbox, Rectangle, Circle
+from rubato.structure.gameobject.physics.rigidbody import RigidBody
+from rubato.utils.computation.vector import Vector
+# pylint: disable=unused-argument
+
+
+def test_registry(rub):
+    scene = Scene()
+    root, child = GameObject(), GameObject()
+    root.add(rect := Rectangle(1, 1))
+    child.add(circle := Circle(1))
+    child.parent = root
+
+    scene.add(root)
+    assert scene.get_all(Hitbox) == [rect, circle]
+    assert scene._hitboxes == {root: dict.fromkeys([rect, circle])}
+
+    child.add(rb := RigidBody())
+    assert scene.get_all(RigidBody) == [rb]
+
+    child.parent = None
+    assert scene.get_all(Hitbox) == [rect]
+    assert child._scene is None
+
+    scene.add(child)
+    assert scene._hitboxes == {root: {rect: None}, child: {circle: None}}
+
+    child.remove(RigidBody)
+    assert scene.get_all(RigidBody) == []
+
+    scene.remove(root, child)
+    assert scene.get_all(Hitbox) == []
+    assert not scene._hitboxes
+
+
+def test_move_scene(rub):
+    first, second = Scene(), Scene()
+    go = GameObject().add(rect := Rectangle(1, 1))
+    first.add(go)
+    second.add(go)
+
+    assert not first.contains(go)
+    assert first.get_all(Hitbox) == []
+    assert second.get_all(Hitbox) == [rect]
+
+
+def test_root(rub):
+    scene = Scene()
+    a, b = GameObject(), GameObject()
+    scene.add(a, b, a)
+    assert scene.root_count == 2
+    assert scene.contains(a)
+
+    assert scene.remove(a)
+    assert not scene.remove(a)
+    assert not scene.contains(a)
+    assert list(scene._root) == [b]
+
+
+def test_deferred(rub):
+    scene = Scene()
+    spawned = GameObject()
+
+    class Spawner(Component):
+
+        def update(self):
+            scene.remove(self.gameobj)
+            scene.add(spawned)
+            assert scene.pending_count == 2
+
+    scene.add(spawner := GameObject().add(Spawner()))
+    scene._update()
+
+    assert scene.pending_count == 0
+    assert not scene.contains(spawner)
+    assert scene.contains(spawned)
+
+
+def test_deferred_error(rub):
+    scene = Scene()
+    spawned = GameObject()
+
+    class Failing(Component):
+
+        def update(self):
+            scene.add(spawned)
+            raise ValueError
+
+    scene.add(GameObject().add(Failing()))
+    with pytest.raises(ValueError):
+        scene._update()
+
+    assert not scene._locked
+    assert scene.contains(spawned)
+
+
+def test_queries(rub):
+    scene = Scene()
+    wall = GameObject(pos=(100, 0)).add(Rectangle(20, 200))
+    ball = GameObject(pos=(0, 100)).add(Circle(10))
+    scene.add(wall, ball)
+
+    hit = scene.raycast((0, 0), (1, 0))
+    assert hit is not None
+    assert hit.hitbox is wall.get(Hitbox)
+    assert round(hit.distance, 5) == 90
+    assert hit.normal == Vector(-1, 0)
+    assert hit.point == Vector(90, 0)
+
+    hit = scene.raycast((0, 0), (0, 1))
+    assert hit is not None
+    assert hit.hitbox is ball.get(Hitbox)
+    assert round(hit.distance, 5) == 90
+    assert scene.raycast((0, 0), (1, 0), max_dist=50) is None
+    assert scene.raycast((0, 0), (-1, 0)) is None
+    assert scene.raycast((0, 0), (1, 0), should_hit=lambda hb: hb.gameobj is not wall) is None
+
+    assert scene.query_point((100, 50)) == [wall.get(Hitbox)]
+    assert scene.query_point((50, 50)) == []
+    assert scene.query_aabb((-20, 80), (20, 120)) == [ball.get(Hitbox)]
+
+    ball.pos = Vector(0, 0)
+    scene._update()
+    hit = scene.shape_cast(ball.get(Hitbox), (1, 0), 200)
+    assert hit is not None
+    assert hit.hitbox is wall.get(Hitbox)
+    assert abs(hit.distance - 80) < 0.01
+    assert ball.pos == Vector(0, 0)
+    assert scene.shape_cast(ball.get(Hitbox), (1, 0), 50) is None
+
+    probe = scene._probes[ball.get(Hitbox)]
+    ball.get(Circle).radius = 40
+    hit = scene.shape_cast(ball.get(Hitbox), (1, 0), 50)
+    assert scene._probes[ball.get(Hitbox)] is probe
+    assert hit is not None and abs(hit.distance - 50) < 0.01
+
+    scene.remove(ball)
+    assert not scene._probes
+
+
+def test_queries_moved(rub):
+    scene = Scene()
+    box = GameObject().add(Rectangle(10, 10))
+    scene.add(box)
+    assert scene.query_point((0, 0)) == [box.get(Hitbox)]
+
+    box.pos = Vector(500, 500)
+    assert scene.query_point((500, 500)) == [box.get(Hitbox)]
+    assert scene.query_aabb((-5, -5), (5, 5)) == []
+
+    box.rotation = 45
+    assert scene.query_point((506, 500)) == [box.get(Hitbox)]
@@ -0,0 +1,26 @@
+"""Test the callback helpers"""
+from unittest.mock import Mock
+from rubato.utils.callbacks import _takes_argument
+
+
+def test_takes_argument():
+
+    class Example:
+
+        def method(self, arg):
+            pass
+
+        def no_arg(self):
+            pass
+
+    assert _takes_argument(lambda x: None)
+    assert _takes_argument(lambda x=None: None)
+    assert _takes_argument(lambda *args: None)
+    assert _takes_argument(Example().method)
+    assert _takes_argument(Mock())
+    assert _takes_argument(print)
+
+    assert not _takes_argument(lambda: None)
+    assert not _takes_argument(lambda *, x: None)
+    assert not _takes_argument(lambda x, y: None)
+    assert not _takes_argument(Example().no_arg)
@@ -1,4 +1,6 @@
 """Test the noise class"""
+from random import Random
+from unittest.mock import Mock
 import pytest
 from rubato.utils.computation.noise import Noise
 from rubato.utils.error import InitError
@@ -39,3 +41,64 @@ def test_noise(seed, x, expected):
 def test_noise2(seed, coord, expected):
     Noise.seed = seed
     assert Noise.noise2(*coord) == expected
+
+
+@pytest.mark.parametrize("seed", [0, 12345, -7, 2**70 + 3])
+def test_noise2_array(seed):
+    Noise.seed = seed
+    random = Random(seed)
+    points = [(random.uniform(-1e5, 1e5), random.uniform(-1e5, 1e5)) for _ in range(500)]
+    points += [(random.uniform(-3, 3), random.uniform(-3, 3)) for _ in range(500)] + [(-94.5, -22.3), (1, 1)]
+    xs, ys = [p[0] for p in points], [p[1] for p in points]
+
+    assert list(Noise.noise2_array(xs, ys)) == [Noise.noise2(*p) for p in points]
+    assert list(Noise.noise2_array(xs, ys, 5, 1.9, 0.45)) == [Noise.fbm2(*p, 5, 1.9, 0.45) for p in points]
+    with pytest.raises(ValueError):
+        Noise.noise2_array(xs, ys[1:])
+
+
+def test_noise2_grid():
+    Noise.seed = 12345
+    xs, ys = [-1.5, 0, 0.25, 12345], [3, -22.3]
+    grid = Noise.noise2_grid(xs, ys)
+    assert len(grid) == 8
+    assert grid[0 * 4 + 3] == Noise.noise2(12345, 3)
+    assert list(grid) == [Noise.noise2(x, y) for y in ys for x in xs]
+    assert list(Noise.noise2_grid(xs, ys, 3)) == [Noise.fbm2(x, y, 3) for y in ys for x in xs]
+    assert len(Noise.noise2_grid([], ys)) == 0
+
+
+def test_fbm2():
+    Noise.seed = 0
+    assert Noise.fbm2(1, 0, 1) == Noise.noise(1)
+    values = [Noise.fbm2(x / 7, x / 3) for x in range(-200, 200)]
+    assert all(-1 <= v <= 1 for v in values)
+    assert len(set(values)) > 1
+
+
+def test_noise2_tile(monkeypatch: pytest.MonkeyPatch):
+    Noise.seed = 0
+    Noise.clear_tiles()
+    grid = Mock(wraps=Noise.noise2_grid)
+    monkeypatch.setattr(Noise, "noise2_grid", grid)
+    monkeypatch.setattr(Noise, "tile_cache", 2)
+
+    tile = Noise.noise2_tile(-2, 1, 3, 2, 0.5)
+    assert list(tile) == [Noise.noise2(x, y) for y in (1, 1.5) for x in (-2, -1.5, -1)]
+    tile[0] = 5
+    assert Noise.noise2_tile(-2, 1, 3, 2, 0.5)[0] == Noise.noise2(-2, 1)
+    assert grid.call_count == 1
+
+    Noise.seed = 1
+    Noise.noise2_tile(-2, 1, 3, 2, 0.5)
+    Noise.noise2_tile(0, 0, 3, 2)
+    assert grid.call_count == 3
+    Noise.seed = 0
+    Noise.noise2_tile(-2, 1, 3, 2, 0.5)
+    assert grid.call_count == 4
+
+    monkeypatch.setattr(Noise, "tile_cache", 0)
+    Noise.noise2_tile(0, 0, 3, 2)
+    Noise.noise2_tile(0, 0, 3, 2)
+    assert grid.call_count == 6
+    assert not Noise._tiles
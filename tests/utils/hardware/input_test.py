@@ -3,6 +3,8 @@
 from unittest.mock import Mock
 from rubato.utils.error import InitError
 from rubato.utils.hardware.rb_input import Input
+from rubato.utils.hardware.display import Display
+from rubato.utils.computation.vector import Vector
 from rubato import sdl2
 # pylint: disable=unused-argument, redefined-outer-name
 
@@ -18,10 +20,8 @@ def controller():
     c = Mock(sdl2.SDL_Joystick)
     Input._controllers[0] = c
     yield c
-    try:
-        Input._controllers[0] = c
-    except ValueError:
-        pass
+    Input._controllers.pop(0, None)
+    Input._pads = {}
 
 
 def test_controller_info(controller, monkeypatch: pytest.MonkeyPatch):
@@ -54,6 +54,34 @@ def test_controller_info(controller, monkeypatch: pytest.MonkeyPatch):
     joyhat.assert_called_once_with(controller, 0)
 
 
+def test_controller_snapshot(controller, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sdl2, "SDL_JoystickNumAxes", Mock(return_value=2))
+    monkeypatch.setattr(sdl2, "SDL_JoystickNumButtons", Mock(return_value=1))
+    monkeypatch.setattr(sdl2, "SDL_JoystickNumHats", Mock(return_value=1))
+    joyaxis = Mock(side_effect=[0, -Input._joystick_max])
+    monkeypatch.setattr(sdl2, "SDL_JoystickGetAxis", joyaxis)
+    joybutton = Mock(return_value=1)
+    monkeypatch.setattr(sdl2, "SDL_JoystickGetButton", joybutton)
+    joyhat = Mock(return_value=sdl2.SDL_HAT_LEFT)
+    monkeypatch.setattr(sdl2, "SDL_JoystickGetHat", joyhat)
+
+    Input._snapshot()
+    assert Input._pads[0] == ((0, -Input._joystick_max), (1,), (sdl2.SDL_HAT_LEFT,))
+
+    for _ in range(3):
+        assert Input.controller_axis(0, 1) == -1
+        assert Input.controller_button(0, 0)
+        assert Input.controller_hat(0, 0) == sdl2.SDL_HAT_LEFT
+    assert joyaxis.call_count == 2
+    assert joybutton.call_count == 1
+    assert joyhat.call_count == 1
+
+    joyaxis.side_effect = None
+    joyaxis.return_value = 0
+    assert Input.controller_axis(0, 2) == 0
+    joyaxis.assert_called_with(controller, 2)
+
+
 def test_axis_centered():
     assert Input.axis_centered(0)
     assert Input.axis_centered(0.0999)
@@ -98,40 +126,76 @@ def test_mods():
         assert v in vals
 
 
-def test_key_pressed(monkeypatch: pytest.MonkeyPatch):
-    keyboard_state = Mock(return_value=[True, False, True])
-    monkeypatch.setattr(Input, "get_keyboard_state", keyboard_state)
-    scancode = Mock(side_effect=[0, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2])
-    monkeypatch.setattr(Input, "scancode_from_name", scancode)
+@pytest.fixture
+def keys(monkeypatch: pytest.MonkeyPatch):
+    """Sets the keyboard state of the frame from the names of the keys held now and last frame."""
+
+    def hold(now: list[str], last: list[str] | None = None):
+        for attr, names in (("_keys", now), ("_last_keys", last or [])):
+            state = bytearray(sdl2.SDL_NUM_SCANCODES)
+            for name in names:
+                state[Input.scancode_from_name(name)] = 1
+            monkeypatch.setattr(Input, attr, bytes(state))
+
+    return hold
+
+
+def test_key_pressed(keys, monkeypatch: pytest.MonkeyPatch):
+    keys(["a", "left shift", "right ctrl", "left alt", "right gui"])
     assert Input.key_pressed("a")
+    assert Input.key_pressed("A")
     assert not Input.key_pressed("b")
     assert Input.key_pressed("shift")
     assert Input.key_pressed("ctrl")
     assert Input.key_pressed("alt")
     assert Input.key_pressed("gui")
-    assert keyboard_state.call_count == 6
-    assert scancode.call_count == 11
-    scancode.assert_any_call("a")
-    scancode.assert_any_call("b")
-    scancode.assert_any_call("left shift")
-    scancode.assert_any_call("right shift")
-    scancode.assert_any_call("left ctrl")
-    scancode.assert_any_call("right ctrl")
-    scancode.assert_any_call("left alt")
-    scancode.assert_any_call("right alt")
-    scancode.assert_any_call("left gui")
-    scancode.assert_any_call("right gui")
-
-    keyboard_state.reset_mock()
-    scancode.reset_mock(side_effect=True)
-    scancode.side_effect = [0]
-    modstate = Mock(return_value=3)
-    monkeypatch.setattr(sdl2, "SDL_GetModState", modstate)
+    assert Input.key_pressed("left shift")
+    assert not Input.key_pressed("right shift")
+    assert not Input.key_pressed("not a key")
+
+    monkeypatch.setattr(Input, "_mod_state", sdl2.KMOD_SHIFT)
     assert Input.key_pressed("shift", "a")
-    assert not Input.key_pressed("ctrl", "b")
-    assert modstate.call_count == 2
-    scancode.assert_called_once_with("a")
-    assert keyboard_state.call_count == 2
+    assert not Input.key_pressed("ctrl", "a")
+    assert not Input.key_pressed("shift", "b")
+
+
+def test_resolve(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Input, "_codes", {})
+    assert Input._resolve("a") == (Input.scancode_from_name("a"),)
+    assert Input._resolve("Shift") == (Input.scancode_from_name("left shift"), Input.scancode_from_name("right shift"))
+    assert Input._resolve("not a key") == (sdl2.SDL_SCANCODE_UNKNOWN,)
+    assert Input._codes["Shift"] == Input._resolve("shift")
+
+    scancode = Mock()
+    monkeypatch.setattr(Input, "scancode_from_name", scancode)
+    for name in ("a", "Shift", "space", "return", "f1", "left ctrl", "1"):
+        assert Input._resolve(name) == tuple(
+            sdl2.SDL_GetScancodeFromName(side.encode()) for side in Input._sides.get(name.lower(), (name,))
+        )
+    scancode.assert_not_called()
+
+
+def test_this_frame(keys):
+    keys(["a", "left shift"], ["b", "right shift"])
+    assert Input.pressed_this_frame("a")
+    assert not Input.released_this_frame("a")
+    assert Input.released_this_frame("b")
+    assert not Input.pressed_this_frame("b")
+    assert not Input.pressed_this_frame("shift")
+    assert not Input.released_this_frame("shift")
+    assert Input.pressed_this_frame("left shift")
+    assert Input.released_this_frame("right shift")
+    assert not Input.pressed_this_frame("c")
+    assert not Input.released_this_frame("c")
+
+
+def test_snapshot(rub):
+    Input._snapshot()
+    keys = Input._keys
+    Input._snapshot()
+    assert Input._last_keys is keys
+    assert len(Input._keys) == sdl2.SDL_NUM_SCANCODES
+    assert not Input.pressed_this_frame("a")
 
 
 def test_get_name():
@@ -156,5 +220,39 @@ def test_scancode_from_name():
 
 
 ### MOUSE TESTS ###
+def test_mouse_state(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Input, "_buttons", sdl2.SDL_BUTTON_LMASK | sdl2.SDL_BUTTON_X2MASK)
+    monkeypatch.setattr(Input, "_last_buttons", sdl2.SDL_BUTTON_RMASK | sdl2.SDL_BUTTON_X2MASK)
+    assert Input.mouse_state() == (True, False, False, False, True)
+    assert Input.mouse_pressed()
+    assert Input.mouse_pressed_this_frame()
+    assert not Input.mouse_released_this_frame()
+    assert Input.mouse_released_this_frame(3)
+    assert not Input.mouse_pressed_this_frame(3)
+    assert not Input.mouse_pressed_this_frame(5)
+    assert not Input.mouse_released_this_frame(5)
+
+    monkeypatch.setattr(Input, "_buttons", 0)
+    assert Input.mouse_state() == (False, False, False, False, False)
+    assert not Input.mouse_pressed()
+
+
+def test_mouse_pos(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Input, "_mouse_abs", (3, 4))
+    monkeypatch.setattr(Input, "_mouse_pos", None)
+    to_screen = Mock(return_value=(10, 20))
+    monkeypatch.setattr(Input, "_display_to_screen", to_screen)
+    monkeypatch.setattr(Display, "_half_res", (5, 5))
+
+    assert Input.get_mouse_abs_pos() == Vector(3, 4)
+    pos = Input.get_mouse_pos()
+    assert pos == Vector(5, -15)
+    pos.x = 100
+    assert Input.get_mouse_pos() == Vector(5, -15)
+    to_screen.assert_called_once_with(3, 4)
+    assert Input.mouse_in((5, -15))
+    assert not Input.mouse_in((50, 50))
+    to_screen.assert_called_once()
+
 
 ### OTHER TESTS ###
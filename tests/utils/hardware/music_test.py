@@ -0,0 +1,86 @@
+"""Test the Music class"""
+import wave
+import pytest
+from unittest.mock import Mock
+import sdl2.sdlmixer as mixer
+from rubato.utils.error import IdError
+from rubato.utils.hardware.music import Music
+# pylint: disable=unused-argument, redefined-outer-name
+
+
+@pytest.fixture
+def wav(tmp_path):
+    """Writes a second of silence and forgets the music loaded by the test."""
+    path = tmp_path / "song.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(48000)
+        f.writeframes(bytes(48000 * 4))
+    yield str(path)
+    mixer.Mix_HaltMusic()
+    Music._playing = None
+    Music.loaded_music.clear()
+
+
+def test_load(wav):
+    music = Music(wav)
+    assert music.name == "song"
+    assert Music.get_music("song") is music
+    assert music.music
+    assert music.state == Music.STOPPED
+    with pytest.raises(IdError):
+        Music(wav)
+    with pytest.raises(IdError):
+        Music.get_music("nothing")
+
+
+def test_play(wav, monkeypatch: pytest.MonkeyPatch):
+    music = Music(wav)
+    other = Music(wav, "other")
+    play = Mock(return_value=0)
+    monkeypatch.setattr(mixer, "Mix_PlayMusic", play)
+    fade = Mock(return_value=0)
+    monkeypatch.setattr(mixer, "Mix_FadeInMusic", fade)
+    volume = Mock()
+    monkeypatch.setattr(mixer, "Mix_VolumeMusic", volume)
+
+    music.play()
+    play.assert_called_once_with(music.music, 1)
+    volume.assert_called_once_with(64)
+    music.play(-1)
+    play.assert_called_with(music.music, -1)
+    music.play(2, fade_in=0.5)
+    fade.assert_called_once_with(music.music, 3, 500)
+
+    other.set_volume(200)
+    assert other.get_volume() == mixer.MIX_MAX_VOLUME
+    assert volume.call_count == 3
+    music.set_volume(-1)
+    volume.assert_called_with(0)
+
+
+def test_state(wav, monkeypatch: pytest.MonkeyPatch):
+    music = Music(wav)
+    other = Music(wav, "other")
+    music.play(-1)
+    assert music.state == Music.PLAYING
+    assert other.state == Music.STOPPED
+
+    other.pause()
+    assert music.state == Music.PLAYING
+    music.pause()
+    assert music.state == Music.PAUSED
+    music.resume()
+    assert music.state == Music.PLAYING
+
+    other.stop()
+    assert music.state == Music.PLAYING
+    music.stop()
+    assert music.state == Music.STOPPED
+
+    fade = Mock()
+    monkeypatch.setattr(mixer, "Mix_FadeOutMusic", fade)
+    music.play()
+    music.stop(fade_out=1)
+    fade.assert_called_once_with(1000)
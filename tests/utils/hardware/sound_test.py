@@ -0,0 +1,156 @@
+"""Test the Sound class"""
+import wave
+import pytest
+from unittest.mock import Mock
+import sdl2.sdlmixer as mixer
+from rubato.utils.error import IdError
+from rubato.utils.hardware.sound import Sound
+from rubato.utils.rendering.camera import Camera
+# pylint: disable=unused-argument, redefined-outer-name
+
+
+@pytest.fixture
+def wav(tmp_path):
+    """Writes a second of silence, as 16 bit stereo at 48 kHz, and forgets the sounds loaded by the test."""
+    path = tmp_path / "beep.wav"
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(48000)
+        f.writeframes(bytes(48000 * 4))
+    yield str(path)
+    for sound in Sound.loaded_sounds.values():
+        sound.stop()
+    Sound.loaded_sounds.clear()
+
+
+def test_load(wav):
+    sound = Sound(wav)
+    assert sound.name == "beep"
+    assert Sound.get_sound("beep") is sound
+    assert sound.ready
+    assert sound.chunk
+    with pytest.raises(IdError):
+        Sound(wav)
+
+
+def test_background(wav, monkeypatch: pytest.MonkeyPatch):
+    sound = Sound(wav, "background", background=True)
+    assert Sound.get_sound("background") is sound
+    assert sound.wait(5) is sound.chunk
+    assert sound.chunk
+    assert sound.ready
+    assert Sound.pending() == 0
+
+    load = Mock()
+    monkeypatch.setattr(mixer, "Mix_LoadWAV", load)
+    Sound(wav, "sync")
+    load.assert_called_once()
+
+
+def test_pending(wav, monkeypatch: pytest.MonkeyPatch):
+    sound = Sound(wav, "waiting", background=True)
+    sound.wait()
+    future = Mock()
+    future.done.return_value = False
+    sound._future = future
+
+    assert not sound.ready
+    assert Sound.pending() == 1
+    assert sound.size == 0
+    volume = Mock()
+    monkeypatch.setattr(mixer, "Mix_VolumeChunk", volume)
+    sound.set_volume(10)
+    volume.assert_not_called()
+    assert sound.get_volume() == 10
+
+    future.result.return_value = sound.chunk
+    future.done.return_value = True
+    assert Sound.pending() == 0
+    sound.set_volume(20)
+    volume.assert_called_once()
+
+
+def test_memory(wav):
+    assert Sound.memory() == 0
+    sound = Sound(wav, "one")
+    Sound(wav, "two", background=True).wait()
+    assert sound.size > 0
+    assert Sound.memory() == 2 * sound.size
+
+
+def test_import_folder(wav, monkeypatch: pytest.MonkeyPatch):
+    folder = wav.rsplit("/", 1)[0]
+    Sound.import_sound_folder(folder, background=True)
+    assert Sound.get_sound("beep").wait(5)
+
+
+@pytest.fixture
+def pool(wav, monkeypatch: pytest.MonkeyPatch):
+    """Shrinks the channel pool to two channels."""
+    monkeypatch.setattr(Sound, "max_channels", 2)
+    monkeypatch.setattr(Sound, "_camera", None)
+    yield
+    mixer.Mix_HaltChannel(-1)
+
+
+def test_state(wav, pool):
+    sound = Sound(wav)
+    assert sound.state == Sound.STOPPED
+    channel = sound.play(-1)
+    assert sound.state == Sound.PLAYING
+    assert sound.channels == 1 << channel
+    assert Sound.active_channels[channel] is sound
+    sound.pause()
+    assert sound.state == Sound.PAUSED
+    sound.resume()
+    assert sound.state == Sound.PLAYING
+    sound.stop()
+    assert sound.state == Sound.STOPPED
+    assert channel not in Sound.active_channels
+
+
+def test_pool(wav, pool):
+    first, second, third = Sound(wav, "first"), Sound(wav, "second"), Sound(wav, "third")
+    a = first.play(-1)
+    b = second.play(-1)
+    assert mixer.Mix_AllocateChannels(-1) == 2
+    assert {a, b} == {0, 1}
+
+    assert third.play(-1) == a
+    assert first.state == Sound.STOPPED
+    assert Sound.active_channels == {a: third, b: second}
+    assert first.play(-1) == b
+    assert mixer.Mix_AllocateChannels(-1) == 2
+
+
+def test_priority(wav, pool):
+    low, high, other = Sound(wav, "low"), Sound(wav, "high", priority=1), Sound(wav, "other", priority=1)
+    high.play(-1)
+    channel = low.play(-1)
+    other.play(-1)
+    assert low.state == Sound.STOPPED
+    assert Sound.active_channels[channel] is other
+
+    assert low.play(-1) == -1
+    assert high.state == Sound.PLAYING and other.state == Sound.PLAYING
+
+
+def test_max_instances(wav, pool):
+    sound = Sound(wav, max_instances=1)
+    channel = sound.play(-1)
+    assert sound.play(-1) == channel
+    assert list(sound._channels) == [channel]
+    assert len(Sound.active_channels) == 1
+
+
+def test_distance(wav, pool, monkeypatch: pytest.MonkeyPatch):
+    sound = Sound(wav, max_distance=10)
+    assert sound.play(-1, pos=(100, 0)) != -1
+    sound.stop()
+
+    monkeypatch.setattr(Sound, "_camera", Camera((90, 0)))
+    assert sound.play(-1, pos=(100, 0)) != -1
+    sound.stop()
+    assert sound.play(-1, pos=(0, 0)) == -1
+    assert sound.play(-1) != -1
@@ -0,0 +1,64 @@
+"""Test the Profiler class"""
+import json
+import pytest
+from rubato.utils.profiler import Profiler
+from rubato.utils.error import InitError
+# pylint: disable=unused-argument, redefined-outer-name
+
+
+@pytest.fixture
+def profiler(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Profiler, "enabled", True)
+    monkeypatch.setattr(Profiler, "history", 3)
+    monkeypatch.setattr(Profiler, "_frames", [])
+    monkeypatch.setattr(Profiler, "_index", 0)
+
+
+def frame(count: int = 1):
+    Profiler._start_frame()
+    with Profiler.section("update"):
+        Profiler.begin("inner")
+        Profiler.count("draw calls", count)
+        Profiler.end()
+    Profiler._end_frame()
+
+
+def test_init():
+    with pytest.raises(InitError):
+        Profiler()
+
+
+def test_disabled(profiler, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Profiler, "enabled", False)
+    frame()
+    assert Profiler.frames() == 0
+    assert Profiler.averages() == {}
+
+
+def test_record(profiler):
+    for i in range(5):
+        frame(i)
+
+    assert Profiler.frames() == 3
+    assert list(Profiler.averages()) == ["frame", "inner", "update"]
+    averages = Profiler.averages()
+    assert averages["frame"] >= averages["update"] >= averages["inner"] > 0
+    assert Profiler.counters() == {"draw calls": 3}
+
+    Profiler.clear()
+    assert Profiler.frames() == 0
+
+
+def test_export(profiler, tmp_path):
+    for i in range(4):
+        frame(i)
+
+    path = tmp_path / "trace.json"
+    Profiler.export(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+
+    frames = [e for e in events if e["name"] == "frame"]
+    assert [e["args"]["frame"] for e in frames] == [0, 1, 2]
+    assert frames[0]["ts"] == 0 and all(a["ts"] < b["ts"] for a, b in zip(frames, frames[1:]))
+    assert [e["args"]["draw calls"] for e in events if e["ph"] == "C"] == [1, 2, 3]
+    assert sum(e["name"] == "inner" for e in events) == 3
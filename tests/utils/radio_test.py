@@ -1,6 +1,13 @@
 """Test the radio module"""
+import ctypes
+import time
 import pytest, unittest.mock as mock
-from rubato.utils.radio import Radio, Listener
+import sdl2
+from rubato.utils.radio import Radio, Listener, Events, MouseMotionResponse, MouseButtonResponse, \
+    JoyAxisMotionResponse, MouseWheelResponse
+from rubato.utils.hardware.display import Display
+from rubato.utils.profiler import Profiler
+from rubato.utils.rb_time import Time
 
 
 def test_listener_init():
@@ -87,3 +94,189 @@ def test_listener_remove():
 
     with pytest.raises(ValueError):
         l2.remove()
+
+
+def test_listener_arity():
+    def bad_cb(params):
+        raise TypeError("from the callback")
+
+    l = Listener("test", bad_cb)
+    with pytest.raises(TypeError, match="from the callback"):
+        l._ping({})
+
+    callback = mock.Mock()
+    l.callback = lambda: callback()
+    l._ping({})
+    callback.assert_called_once_with()
+
+
+def test_radio_broadcast_no_listeners(monkeypatch: pytest.MonkeyPatch):
+    Radio.listeners = {}
+    now = mock.Mock(return_value=0)
+    monkeypatch.setattr(Time, "now", now)
+
+    Radio.broadcast("test")
+    now.assert_not_called()
+
+    callback = mock.Mock()
+    Radio.listen("test", callback)
+    Radio.listen("test", callback)
+    Radio.broadcast("test")
+    now.assert_called_once()
+    assert callback.call_args_list[0] == callback.call_args_list[1]
+
+
+def push_motion(x: int, y: int, dx: int, dy: int):
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEMOTION
+    event.motion.x, event.motion.y, event.motion.xrel, event.motion.yrel = x, y, dx, dy
+    sdl2.SDL_PushEvent(ctypes.byref(event))
+
+
+def push_click():
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_MOUSEBUTTONDOWN
+    event.button.button = 1
+    sdl2.SDL_PushEvent(ctypes.byref(event))
+
+
+def push_axis(which: int, axis: int, value: int):
+    event = sdl2.SDL_Event()
+    event.type = sdl2.SDL_JOYAXISMOTION
+    event.jaxis.which, event.jaxis.axis, event.jaxis.value = which, axis, value
+    sdl2.SDL_PushEvent(ctypes.byref(event))
+
+
+@pytest.fixture
+def queue(rub, monkeypatch: pytest.MonkeyPatch):
+    """An empty event queue and no listeners."""
+    sdl2.SDL_FlushEvents(sdl2.SDL_FIRSTEVENT, sdl2.SDL_LASTEVENT)
+    monkeypatch.setattr(Radio, "listeners", {})
+    received = []
+    Radio.listen(Events.MOUSEMOTION, received.append)
+    Radio.listen(Events.MOUSEDOWN, received.append)
+    Radio.listen(Events.JOYAXISMOTION, received.append)
+    return received
+
+
+@pytest.mark.parametrize("coalesce", [False, True])
+def test_handle(queue, monkeypatch: pytest.MonkeyPatch, coalesce):
+    monkeypatch.setattr(Radio, "coalesce", coalesce)
+    for i in range(100):  # more than one batch
+        push_motion(i, 0, 1, 2)
+    push_click()
+    push_motion(0, 0, 5, 5)
+    push_axis(0, 0, 10)
+    push_axis(0, 1, 20)
+    push_axis(0, 0, 30)
+
+    assert Radio._handle() is False
+
+    if not coalesce:
+        assert [type(r) for r in queue] == [MouseMotionResponse] * 100 + [MouseButtonResponse, MouseMotionResponse] + \
+            [JoyAxisMotionResponse] * 3
+        return
+
+    # motions are merged until the click, then the motion and the axes after it are merged
+    assert [type(r) for r in queue] == [MouseMotionResponse, MouseButtonResponse, MouseMotionResponse] + \
+        [JoyAxisMotionResponse] * 2
+    assert (queue[0].x, queue[0].dx, queue[0].dy) == (99 - Display._half_res[0], 100, -200)
+    assert (queue[2].dx, queue[2].dy) == (5, -5)
+    assert [(r.axis, r.value) for r in queue[3:]] == [(0, pytest.approx(30 / 32768)), (1, pytest.approx(20 / 32768))]
+
+
+def test_coalesce_order(queue, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Radio, "coalesce", True)
+    Radio.listen(Events.MOUSEWHEEL, queue.append)
+    push_motion(0, 0, 1, 1)
+    push_motion(1, 0, 1, 1)
+    wheel = sdl2.SDL_Event()
+    wheel.type = sdl2.SDL_MOUSEWHEEL
+    wheel.wheel.preciseY = 1
+    sdl2.SDL_PushEvent(ctypes.byref(wheel))
+    push_motion(2, 0, 1, 1)
+
+    Radio._handle()
+
+    # the wheel ends the merge of the motions before it
+    assert [type(r) for r in queue] == [MouseMotionResponse, MouseWheelResponse, MouseMotionResponse]
+    assert (queue[0].x, queue[0].dx) == (1 - Display._half_res[0], 2)
+    assert (queue[2].x, queue[2].dx) == (2 - Display._half_res[0], 1)
+
+
+def test_batch_listener(queue):
+    batches = []
+    l = Radio.listen(Events.MOUSEMOTION, batches.append, batch=True)
+    assert l.batch is True
+
+    push_motion(0, 0, 1, 1)
+    push_motion(1, 0, 1, 1)
+    Radio._handle()
+    assert len(batches) == 1
+    assert batches[0] == queue[:2]
+
+    # responses broadcast during the frame are delivered after the next events
+    Radio.broadcast(Events.MOUSEMOTION, queue[0])
+    assert len(batches) == 1
+    Radio._handle()
+    assert batches[1] == [queue[0]]
+
+    Radio._handle()
+    assert len(batches) == 2
+
+
+def test_post(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Radio, "listeners", {})
+    monkeypatch.setattr(Radio, "_posted", {})
+    monkeypatch.setattr(Radio, "_priorities", [])
+    monkeypatch.setattr(Radio, "_posted_count", 0)
+    monkeypatch.setattr(Radio, "drain_budget", 0)
+    monkeypatch.setattr(Profiler, "enabled", False)
+    monkeypatch.setattr(Profiler, "begin", begin := mock.Mock())
+    received = []
+
+    def listener(params):
+        received.append(params)
+        if params == "low":
+            Radio.post("test", "again", 10)
+
+    Radio.listen("test", listener)
+    Radio.post("test", "low")
+    Radio.post("test", "high", 5)
+    Radio.post(Events.EXIT, None)
+    Radio.post("test", "low 2")
+    assert received == []
+    assert Radio.pending() == 4
+
+    Radio._drain()
+    assert received == ["high", "low", "low 2"]
+    assert Radio.pending() == 1
+
+    Radio._drain()
+    assert received == ["high", "low", "low 2", "again"]
+    assert Radio.pending() == 0
+    begin.assert_not_called()
+
+
+def test_post_budget(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Radio, "listeners", {})
+    monkeypatch.setattr(Radio, "_posted", {})
+    monkeypatch.setattr(Radio, "_priorities", [])
+    monkeypatch.setattr(Radio, "_posted_count", 0)
+    monkeypatch.setattr(Radio, "drain_budget", 0.001)
+    monkeypatch.setattr(Profiler, "enabled", True)
+    Profiler.clear()
+
+    Radio.listen("slow", lambda: time.sleep(0.002))
+    for _ in range(3):
+        Radio.post("slow")
+
+    for left in (2, 1, 0):
+        Profiler._start_frame()
+        Radio._drain()
+        Profiler._end_frame()
+        assert Radio.pending() == left
+
+    assert Profiler.averages()["event slow"] >= 2
+    assert Profiler.counters()["posted events"] == 1
+    Profiler.clear()
@@ -0,0 +1,188 @@
+"""Test the Time class"""
+import pytest
+from rubato.utils.rb_time import Time, DelayedTask, FramesTask, RecurrentTask, _TimingWheel, _Clock
+from rubato.structure.scene import Scene
+from rubato.structure.gameobject.game_object import GameObject
+# pylint: disable=unused-argument
+
+
+@pytest.fixture
+def frames(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Time, "_frame_times", [0.0] * 240)
+    monkeypatch.setattr(Time, "_frame_index", 0)
+    monkeypatch.setattr(Time, "_frame_count", 0)
+    monkeypatch.setattr(Time, "_next_queue", [])
+    monkeypatch.setattr(Time, "frames", 0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch):
+    """Empty schedules and a clock set by hand."""
+    now = [0.0]
+    monkeypatch.setattr(Time, "_clock", _Clock())
+    monkeypatch.setattr(Time, "_game_clock", _Clock())
+    monkeypatch.setattr(Time, "_next_queue", [])
+    monkeypatch.setattr(Time, "frames", 0)
+    monkeypatch.setattr(Time, "_delta_time", 1)
+    monkeypatch.setattr(Time, "_now", lambda: now[0] * 1000)
+    return now
+
+
+def test_frame_stats(frames):
+    assert Time.frame_time_percentile(99) == 0
+    assert Time.smooth_fps() == 0
+
+    for ms in [10] * 98 + [20, 40]:
+        Time._delta_time = ms
+        Time._process_calls()
+
+    assert Time.smooth_fps() == int(1000 * 100 / (980 + 60))
+    assert Time.frame_time_percentile(50) == pytest.approx(0.01)
+    assert Time.frame_time_percentile(99) == pytest.approx(0.02)
+    assert Time.frame_time_percentile(100) == pytest.approx(0.04)
+    assert Time.frame_time_histogram(0.01) == {0.01: 98, 0.02: 1, 0.04: 1}
+    assert Time.frame_time_histogram(0.03) == {0: 99, 0.03: 1}
+
+
+def test_end_frame(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Time, "target_fps", 250)
+    monkeypatch.setattr(Time, "_normal_delta", 4.5)
+
+    Time._start_frame()
+    Time._end_frame()
+    assert 4.5 <= Time._delta_time < 10
+
+
+def test_timing_wheel():
+    wheel = _TimingWheel()
+    ticks = [0, 1, 63, 64, 65, 4095, 4096, 5000, 300000, 1 << 24, (1 << 24) + 70]
+    tasks = {tick: FramesTask(lambda: None, tick) for tick in ticks}
+    for tick in reversed(ticks):
+        wheel.add(tasks[tick], tick)
+    assert wheel.count == len(ticks)
+
+    due = []
+    for step in range(0, (1 << 24) + 200, 37):
+        for task in wheel.advance(step):
+            due.append(task)
+            assert step - 37 < task.delay <= step
+    assert due == [tasks[tick] for tick in ticks]
+    assert wheel.count == 0
+
+    # ticks that were already processed come back on the next advance
+    late = FramesTask(lambda: None, 0)
+    wheel.add(late, 3)
+    assert wheel.advance(wheel.tick) == [late]
+
+
+def test_stop(clock):
+    calls = []
+    tasks = [Time.delayed_call(lambda: calls.append(1), i / 1000) for i in range(1, 2000)]
+    tasks.append(Time.delayed_frames(lambda: calls.append(1), 5))
+    tasks.append(Time.recurrent_call(lambda: calls.append(1), 0.5))
+    assert Time.pending() == {"next frame": 0, "frames": 1, "delayed": 1999, "recurrent": 1}
+
+    for task in tasks:
+        task.stop()
+    assert Time.pending() == {"next frame": 0, "frames": 0, "delayed": 0, "recurrent": 0}
+    assert not any(slot for level in Time._clock.task_wheel.slots for slot in level)
+
+    clock[0] = 10
+    for _ in range(10):
+        Time._process_calls()
+    assert calls == []
+
+
+def test_process_calls(clock):
+    calls = []
+    Time.delayed_call(lambda: calls.append("delayed"), 0.0105)
+    Time.delayed_frames(lambda: calls.append("frames"), 2)
+    Time.recurrent_call(lambda: calls.append("recurrent"), 0.004, 0.002)
+
+    clock[0] = 0.0101
+    Time._process_calls()
+    assert calls == ["recurrent"] * 3
+
+    # the delayed task is in the slot of the 10th millisecond but is not due yet
+    calls.clear()
+    clock[0] = 0.0104
+    Time._process_calls()
+    assert calls == ["frames"]
+
+    calls.clear()
+    clock[0] = 0.0105
+    Time._process_calls()
+    assert calls == ["delayed"]
+
+    task = Time.delayed_call(lambda: calls.append("moved"), 0.001)
+    task.delay = 1
+    Time.schedule(task)
+    clock[0] = 0.5
+    Time._process_calls()
+    assert calls == ["delayed"] + ["recurrent"] * 122
+    assert Time.pending() == {"next frame": 0, "frames": 0, "delayed": 1, "recurrent": 1}
+
+
+def test_recurrent_stop(clock):
+    calls = []
+
+    def task(t: RecurrentTask):
+        calls.append(t)
+        if len(calls) == 2:
+            t.stop()
+
+    Time.recurrent_call(task, 0.001)
+    clock[0] = 0.01
+    Time._process_calls()
+    assert len(calls) == 2
+    assert Time.pending()["recurrent"] == 0
+    assert isinstance(Time.delayed_call(lambda: None, 0), DelayedTask)
+
+
+def test_pausable(clock):
+    calls = []
+    Time.delayed_call(lambda: calls.append("pausable"), 0.005, pausable=True)
+    Time.delayed_call(lambda: calls.append("real"), 0.005)
+
+    Time._delta_time = 6
+    clock[0] = 0.006
+    Time._process_calls(paused=True)
+    assert calls == ["real"]
+    assert Time.game_time == 0
+
+    Time._process_calls()
+    assert calls == ["real", "pausable"]
+    assert Time.game_time == pytest.approx(0.006)
+
+
+def test_owned(clock, rub):
+    scene = Scene()
+    go = GameObject()
+    child = GameObject(parent=go)
+    scene.add(go)
+    calls = []
+
+    Time.delayed_call(lambda: calls.append("scene"), 0.01, owner=scene)
+    Time.recurrent_call(lambda: calls.append("go"), 0.01, 0.01, owner=go)
+    Time.delayed_frames(lambda: calls.append("child"), 2, owner=child)
+    assert Time.pending() == {"next frame": 0, "frames": 0, "delayed": 0, "recurrent": 0}
+    assert Time.pending(go)["recurrent"] == 1
+
+    Time._delta_time = 10
+    scene._update()
+    assert calls == ["scene", "go"]
+
+    # inactive gameobjects and their children do not update, so their time stands still
+    calls.clear()
+    go.active = False
+    scene._update()
+    scene._update()
+    assert calls == []
+    go.active = True
+    scene._update()
+    assert calls == ["go", "child"]
+
+    scene.remove(go)
+    assert Time.pending(go)["recurrent"] == 0
+    assert Time.pending(child)["frames"] == 0
+    assert Time.pending(scene)["delayed"] == 0
@@ -0,0 +1,72 @@
+"""Test the texture pool"""
+import pytest
+from rubato.utils.error import InitError
+from rubato.utils.rendering.surface import Surface
+from rubato.utils.rendering.texture_pool import TexturePool
+# pylint: disable=unused-argument
+
+
+def test_init():
+    with pytest.raises(InitError):
+        TexturePool()
+
+
+def test_lazy(rub):
+    TexturePool.clear()
+    live = TexturePool.live_textures()
+
+    surf = Surface(8, 4)
+    assert surf._tx is None
+    assert TexturePool.live_textures() == live
+
+    surf._regen()
+    assert surf._tx is not None
+    assert TexturePool.live_textures() == live + 1
+
+
+def test_reuse(rub):
+    TexturePool.clear()
+    surf = Surface(8, 4)
+    surf._regen()
+    live, live_bytes = TexturePool.live_textures(), TexturePool.live_bytes()
+
+    del surf
+    assert TexturePool.live_textures() == live - 1
+    assert TexturePool.live_bytes() == live_bytes - 8 * 4 * 4
+    assert TexturePool.pooled_textures() == 1
+    assert TexturePool.pooled_bytes() == 8 * 4 * 4
+
+    surf = Surface(8, 4)
+    surf._regen()
+    assert TexturePool.pooled_textures() == 0
+    assert TexturePool.live_textures() == live
+
+    other = Surface(4, 8)
+    other._regen()
+    assert TexturePool.live_textures() == live + 1
+
+
+def test_limits(rub, monkeypatch):
+    TexturePool.clear()
+    monkeypatch.setattr(TexturePool, "max_per_size", 1)
+    surfs = [Surface(2, 2) for _ in range(3)]
+    for surf in surfs:
+        surf._regen()
+
+    surfs.clear()
+    assert TexturePool.pooled_textures() == 1
+
+    TexturePool.clear()
+    assert TexturePool.pooled_textures() == 0
+    assert TexturePool.pooled_bytes() == 0
+
+
+def test_alpha(rub):
+    surf = Surface(2, 2)
+    surf.set_alpha(100)
+    assert surf.get_alpha() == 100
+    surf._regen()
+    assert surf.get_alpha() == 100
+    surf.af = True
+    assert surf._tx is None
+    assert not surf.uptodate